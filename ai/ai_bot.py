@@ -1,69 +1,298 @@
 # ai/ai_bot.py
+import asyncio
+import json
 import openai
 import os
 from dotenv import load_dotenv
 
+from ai.llm_cache import LLMCache
+from ai.resume_index import ResumeIndex, estimate_tokens
+from scripts.answer_index import normalize_question
+from scripts.metrics import increment, span
+from scripts.rate_limits import acall_with_backoff, call_with_backoff
+
 # Load environment variables (API key from .env)
 load_dotenv()
 openai.api_key = os.getenv("OPENAI_API_KEY")
 
+MODEL = "gpt-3.5-turbo"
+MAX_CONCURRENT_REQUESTS = 4
+
+# Answer prompts carry only the resume sections relevant to the question:
+# at most RESUME_TOP_K sections per question within RESUME_TOKEN_BUDGET
+# tokens. A budget of 0 sends the whole resume, as before.
+RESUME_TOP_K = int(os.getenv("RESUME_TOP_K", "3"))
+RESUME_TOKEN_BUDGET = int(os.getenv("RESUME_TOKEN_BUDGET", "250"))
+
+ANSWER_SYSTEM_PROMPT = (
+    "You are an AI that answers job application as the person who is applying for the job."
+)
+
 # Load the resume information from the text file
 with open("resources/resume_prompt.txt", "r") as file:
     resume_info = file.read()
 
+# Cache keys include this digest, so editing the resume invalidates old answers.
+resume_digest = LLMCache.make_key(resume_info)
+resume_index = ResumeIndex(resume_info)
+llm_cache = LLMCache()
+
+# Anything exposing ``chat.completions.create`` can stand in for the OpenAI
+# module here, e.g. a local stub client.
+llm_client = openai
+
+
+def _messages(system_prompt, prompt):
+    return [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": prompt},
+    ]
+
+
+def _resume_context(questions):
+    """Resume sections relevant to one question or a list of them."""
+    if RESUME_TOKEN_BUDGET <= 0:
+        return resume_info
+    if isinstance(questions, str):
+        questions = [questions]
+    # A batch gets room for each question's sections, up to the whole resume.
+    budget = RESUME_TOKEN_BUDGET * len(questions)
+    return resume_index.select(questions, RESUME_TOP_K, budget)
+
+
+def _record_usage(attrs, response, system_prompt, prompt):
+    """Attach token counts to the call's span, print them and add them up."""
+    usage = getattr(response, "usage", None)
+    if usage is not None:
+        prompt_tokens, completion_tokens = usage.prompt_tokens, usage.completion_tokens
+    else:
+        prompt_tokens = estimate_tokens(system_prompt) + estimate_tokens(prompt)
+        completion_tokens = estimate_tokens(response.choices[0].message.content or "")
+
+    attrs["prompt_tokens"] = prompt_tokens
+    attrs["completion_tokens"] = completion_tokens
+    increment("llm_tokens", prompt_tokens, kind="prompt")
+    increment("llm_tokens", completion_tokens, kind="completion")
+    print(
+        f"LLM call: {prompt_tokens} prompt + {completion_tokens} completion tokens "
+        f"(the full resume alone is ~{resume_index.total_tokens})."
+    )
+
+
+def _complete(system_prompt, prompt, client=None):
+    with span("llm_call", mode="sync") as attrs:
+        response = call_with_backoff(
+            "llm",
+            (client or llm_client).chat.completions.create,
+            model=MODEL,
+            messages=_messages(system_prompt, prompt),
+        )
+        _record_usage(attrs, response, system_prompt, prompt)
+    return response.choices[0].message.content
+
+
+async def _acomplete(system_prompt, prompt, client, semaphore):
+    async with semaphore:
+        with span("llm_call", mode="async") as attrs:
+            response = await acall_with_backoff(
+                "llm",
+                client.chat.completions.create,
+                model=MODEL,
+                messages=_messages(system_prompt, prompt),
+            )
+            _record_usage(attrs, response, system_prompt, prompt)
+    return response.choices[0].message.content
+
 
 # Function to generate cover letter using GPT-3.5
-def generate_cover_letter(job_description):
+def generate_cover_letter(job_description, client=None):
+    key = LLMCache.make_key(
+        "cover_letter", MODEL, resume_digest, job_description.strip()
+    )
+    cached = llm_cache.get(key)
+    if cached is not None:
+        return cached
+
     prompt = f"""
     Based on the following resume information, generate a custom cover letter for the job described below:
-    
+
     Resume Information:
     {resume_info}
-    
+
     Job Description:
     {job_description}
-    
+
     Cover Letter:
     """
 
-    response = openai.ChatCompletion.create(
-        model="gpt-3.5-turbo",
-        messages=[
-            {
-                "role": "system",
-                "content": "You are an AI that writes professional cover letters.",
-            },
-            {"role": "user", "content": prompt},
-        ],
+    cover_letter = _complete(
+        "You are an AI that writes professional cover letters.", prompt, client
     )
+    llm_cache.set(key, cover_letter)
+    return cover_letter
+
 
-    return response["choices"][0]["message"]["content"]
+def _answer_key(question, options=None):
+    return LLMCache.make_key(
+        "answer",
+        MODEL,
+        resume_digest,
+        f"{RESUME_TOP_K}/{RESUME_TOKEN_BUDGET}",
+        normalize_question(question),
+        *(options or ()),
+    )
 
 
-# Function to generate an answer for a question based on resume using GPT-3.5
-def generate_answer_for_question(question):
-    prompt = f"""
+def _answer_prompt(question):
+    return f"""
     Based on the following resume information, provide a concise and direct answer to the question below. If the question is asking for years of experience and it's not provided in the resume, return a random number between 2 and 3. The response should not include any explanations or estimates—just or punctuation. The random number response should only be the number "2" or the number "3". If a question is asking implicity for a "yes" or "no" only return 1 of those.
 
-    
+
     Resume Information:
-    {resume_info}
-    
+    {_resume_context(question)}
+
     Question:
     {question}
-    
+
     Answer:
     """
 
-    response = openai.chat.completions.create(
-        model="gpt-3.5-turbo",
-        messages=[
-            {
-                "role": "system",
-                "content": "You are an AI that answers job application as the person who is applying for the job.",
-            },
-            {"role": "user", "content": prompt},
-        ],
-    )
-    response_message = response.choices[0].message.content
+
+def _batch_answer_prompt(questions):
+    numbered = {
+        str(number): (
+            {"question": item["question"], "options": item["options"]}
+            if item.get("options")
+            else {"question": item["question"]}
+        )
+        for number, item in enumerate(questions, start=1)
+    }
+    return f"""
+    Based on the following resume information, answer every question in the JSON object below. Give concise and direct answers with no explanations. If a question is asking for years of experience and it's not provided in the resume, answer "2" or "3". If a question is asking implicitly for a "yes" or "no" only return 1 of those. If a question lists options, the answer must be exactly one of the options.
+
+    Resume Information:
+    {_resume_context([item["question"] for item in questions])}
+
+    Questions:
+    {json.dumps(numbered, indent=2)}
+
+    Return only a JSON object that maps each question number to its answer as a string.
+    """
+
+
+def _parse_batch_answers(response_message, questions):
+    start, end = response_message.find("{"), response_message.rfind("}")
+    if start == -1 or end == -1:
+        return {}
+    try:
+        parsed = json.loads(response_message[start : end + 1])
+    except json.JSONDecodeError:
+        return {}
+
+    answers = {}
+    for number, item in enumerate(questions, start=1):
+        answer = parsed.get(str(number))
+        if isinstance(answer, (str, int, float)) and str(answer).strip():
+            answers[item["question"]] = str(answer).strip()
+    return answers
+
+
+# Function to generate an answer for a question based on resume using GPT-3.5
+def generate_answer_for_question(question, client=None):
+    key = _answer_key(question)
+    cached = llm_cache.get(key)
+    if cached is not None:
+        return cached
+
+    response_message = _complete(ANSWER_SYSTEM_PROMPT, _answer_prompt(question), client)
+    llm_cache.set(key, response_message)
     return response_message
+
+
+async def agenerate_answers_for_questions(
+    questions, client=None, max_concurrency=MAX_CONCURRENT_REQUESTS
+):
+    """Answer every unknown question of a form step in one latency window.
+
+    ``questions`` is a list of ``{"question": str, "options": [str]}`` dicts.
+    Cached answers are used first; the rest go out as a single batched prompt,
+    and anything the batch reply left out is asked individually, at most
+    ``max_concurrency`` requests at a time. Returns ``{question: answer}``.
+
+    Without a ``client`` a fresh ``openai.AsyncOpenAI`` is used and closed
+    again, which honours OPENAI_BASE_URL and so can be pointed at a mock server.
+    """
+    answers = {}
+    pending = []
+    for item in questions:
+        cached = llm_cache.get(_answer_key(item["question"], item.get("options")))
+        if cached is not None:
+            answers[item["question"]] = cached
+        else:
+            pending.append(item)
+
+    if not pending:
+        return answers
+
+    if client is None:
+        async with openai.AsyncOpenAI(api_key=openai.api_key) as client:
+            fetched = await _afetch_answers(pending, client, max_concurrency)
+    else:
+        fetched = await _afetch_answers(pending, client, max_concurrency)
+
+    for item in pending:
+        if item["question"] in fetched:
+            llm_cache.set(
+                _answer_key(item["question"], item.get("options")),
+                fetched[item["question"]],
+            )
+
+    answers.update(fetched)
+    return answers
+
+
+async def _afetch_answers(pending, client, max_concurrency):
+    """Ask the batched prompt, then each question the reply left out."""
+    semaphore = asyncio.Semaphore(max_concurrency)
+    fetched = {}
+
+    if len(pending) > 1:
+        try:
+            response_message = await _acomplete(
+                ANSWER_SYSTEM_PROMPT, _batch_answer_prompt(pending), client, semaphore
+            )
+            batch_answers = _parse_batch_answers(response_message, pending)
+        except Exception as e:
+            print(f"Batched answer request failed: {e}")
+            batch_answers = {}
+
+        fetched.update(batch_answers)
+        pending = [item for item in pending if item["question"] not in batch_answers]
+
+    async def answer_one(item):
+        question = item["question"]
+        if item.get("options"):
+            question += f" (Options: {', '.join(item['options'])})"
+        try:
+            return await _acomplete(
+                ANSWER_SYSTEM_PROMPT, _answer_prompt(question), client, semaphore
+            )
+        except Exception as e:
+            print(f"Answer request failed for '{item['question']}': {e}")
+            return None
+
+    single_answers = await asyncio.gather(*(answer_one(item) for item in pending))
+    for item, answer in zip(pending, single_answers):
+        if answer and answer.strip():
+            fetched[item["question"]] = answer.strip()
+    return fetched
+
+
+def generate_answers_for_questions(questions, client=None):
+    """Blocking wrapper around agenerate_answers_for_questions."""
+    return asyncio.run(agenerate_answers_for_questions(questions, client))
+
+
+def cache_stats():
+    """Hit/miss/eviction counters for the LLM response cache."""
+    return llm_cache.stats()
@@ -0,0 +1,114 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+cache_dir = "resources/.llm_cache"
+
+DEFAULT_TTL = 30 * 24 * 60 * 60
+DEFAULT_MAX_ENTRIES = 5000
+
+
+class LLMCache:
+    """On-disk, content-addressed cache of LLM responses.
+
+    Entries live at ``<directory>/<key[:2]>/<key>.json`` where the key is a
+    hash of everything that shaped the response (kind, model, resume digest,
+    normalized input), so a changed resume simply stops matching old entries.
+    Entries older than ``ttl`` seconds are dropped on read, and the oldest
+    entries are evicted once there are more than ``max_entries``.
+    """
+
+    def __init__(
+        self,
+        directory=cache_dir,
+        ttl=DEFAULT_TTL,
+        max_entries=DEFAULT_MAX_ENTRIES,
+        clock=time.time,
+    ):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._entry_count = None
+
+    @staticmethod
+    def make_key(*parts):
+        return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                entry = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.misses += 1
+            return None
+
+        if self.ttl is not None and self.clock() - entry["created"] > self.ttl:
+            self._remove(path)
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return entry["value"]
+
+    def set(self, key, value):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump({"created": self.clock(), "value": value}, file)
+
+        is_new = not os.path.exists(path)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            if self._entry_count is None:
+                self._entry_count = len(self._entries())
+            elif is_new:
+                self._entry_count += 1
+            if self._entry_count > self.max_entries:
+                self._evict()
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def _entries(self):
+        entries = []
+        for root, _, files in os.walk(self.directory):
+            entries.extend(
+                os.path.join(root, name) for name in files if name.endswith(".json")
+            )
+        return entries
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+            self.evictions += 1
+            if self._entry_count is not None:
+                self._entry_count -= 1
+        except FileNotFoundError:
+            pass
+
+    def _evict(self):
+        """Drop the oldest entries until we're 10% under the size limit."""
+        entries = sorted(self._entries(), key=os.path.getmtime)
+        excess = len(entries) - int(self.max_entries * 0.9)
+        for path in entries[: max(excess, 0)]:
+            self._remove(path)
+        self._entry_count = len(entries) - max(excess, 0)
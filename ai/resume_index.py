@@ -0,0 +1,152 @@
+import math
+import re
+from collections import Counter
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+# Lines like "Work Experience:" start a new section.
+HEADING = re.compile(r"^([A-Z][A-Za-z /&-]{1,40}):\s*$")
+# Numbered entries ("1. Software Developer at ...") are sections of their own.
+NUMBERED_ENTRY = re.compile(r"^\d+\.\s")
+TOKEN = re.compile(r"[a-z0-9][a-z0-9+#]*")
+
+STOPWORDS = frozenset(
+    """
+    a an and are as at be by do does for from have has how i in is it me my of on
+    or that the this to was were what when which who will with you your
+    """.split()
+)
+
+_encoding = None
+
+
+def estimate_tokens(text):
+    """Count LLM tokens with tiktoken when installed, else about 4 characters each."""
+    global _encoding
+    if tiktoken is not None:
+        if _encoding is None:
+            _encoding = tiktoken.get_encoding("cl100k_base")
+        return len(_encoding.encode(text))
+    return math.ceil(len(text) / 4)
+
+
+def tokenize(text):
+    return [word for word in TOKEN.findall(text.lower()) if word not in STOPWORDS]
+
+
+def split_sections(text):
+    """Split resume text into ``(heading, body)`` sections.
+
+    Text before the first heading becomes the "Profile" section, and every
+    numbered entry under a heading becomes its own section.
+    """
+    sections = []
+    heading = "Profile"
+    lines = []
+
+    def flush():
+        body = "\n".join(lines).strip()
+        if body:
+            sections.append((heading, body))
+        lines.clear()
+
+    for line in text.splitlines():
+        match = HEADING.match(line.strip())
+        if match:
+            flush()
+            heading = match.group(1)
+        elif NUMBERED_ENTRY.match(line.strip()):
+            flush()
+            lines.append(line)
+        else:
+            lines.append(line)
+    flush()
+    return sections
+
+
+class ResumeIndex:
+    """BM25 index over resume sections, for question-specific prompt context.
+
+    The "Profile" (name, title, location) and "Education" sections are always
+    included: they are short and answer many screening questions on their own.
+    """
+
+    def __init__(self, text, k1=1.5, b=0.75, always_include=("Profile", "Education")):
+        self.k1 = k1
+        self.b = b
+        self.sections = split_sections(text)
+        self.always_include = [
+            index
+            for index, (heading, _) in enumerate(self.sections)
+            if heading in always_include
+        ]
+        self._terms = [Counter(tokenize(f"{h}\n{body}")) for h, body in self.sections]
+        self._lengths = [sum(terms.values()) for terms in self._terms]
+        self._average_length = (
+            sum(self._lengths) / len(self._lengths) if self._lengths else 0
+        )
+        document_frequency = Counter()
+        for terms in self._terms:
+            document_frequency.update(terms.keys())
+        count = len(self.sections)
+        self._idf = {
+            term: math.log((count - frequency + 0.5) / (frequency + 0.5) + 1)
+            for term, frequency in document_frequency.items()
+        }
+        self._tokens = [
+            estimate_tokens(self._render(index)) for index in range(len(self.sections))
+        ]
+        self.total_tokens = estimate_tokens(text)
+
+    def _render(self, index):
+        heading, body = self.sections[index]
+        return body if heading == "Profile" else f"{heading}:\n{body}"
+
+    def scores(self, query):
+        """BM25 score of every section for ``query``."""
+        query_terms = set(tokenize(query))
+        scores = []
+        for terms, length in zip(self._terms, self._lengths):
+            score = 0.0
+            for term in query_terms:
+                frequency = terms.get(term)
+                if not frequency:
+                    continue
+                norm = 1 - self.b + self.b * length / (self._average_length or 1)
+                score += (
+                    self._idf[term]
+                    * frequency
+                    * (self.k1 + 1)
+                    / (frequency + self.k1 * norm)
+                )
+            scores.append(score)
+        return scores
+
+    def select(self, queries, top_k=3, token_budget=350):
+        """Return the resume context for one query or a list of them.
+
+        Picks the always-included sections, then the best matching ones (at
+        most ``top_k`` per query) while they fit in ``token_budget``, and
+        returns them in resume order.
+        """
+        if isinstance(queries, str):
+            queries = [queries]
+
+        chosen = list(self.always_include)
+        used = sum(self._tokens[index] for index in chosen)
+        for query in queries:
+            scores = self.scores(query)
+            ranked = sorted(
+                (index for index, score in enumerate(scores) if score > 0),
+                key=lambda index: -scores[index],
+            )
+            for index in ranked[:top_k]:
+                if index in chosen or used + self._tokens[index] > token_budget:
+                    continue
+                chosen.append(index)
+                used += self._tokens[index]
+
+        return "\n\n".join(self._render(index) for index in sorted(chosen))
@@ -0,0 +1,131 @@
+import argparse
+import os
+import time
+from collections import Counter
+
+import yaml
+
+from scripts.answer_index import AnswerIndex
+from scripts.intent_engine import MIN_CONFIDENCE, IntentEngine
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+INTENT_LABELS = os.path.join(FIXTURES_DIR, "intent_labels.yaml")
+ANSWER_PROFILE = os.path.join(FIXTURES_DIR, "answer_profile.yaml")
+
+# config.yaml spells yes/no answers several ways.
+YES_NO = {"yes": "yes", "y": "yes", "true": "yes", "no": "no", "n": "no", "false": "no"}
+
+
+def _same_answer(left, right):
+    left, right = left.strip().lower(), right.strip().lower()
+    return YES_NO.get(left, left) == YES_NO.get(right, right)
+
+
+def evaluate(engine, labels, config):
+    """Score the engine against the labels and the answers already in the config.
+
+    Returns the counts, per-intent counts and the ``(question, config answer,
+    engine answer)`` of every answer that differs from the config.
+    """
+    answers = AnswerIndex(config)
+    rows = Counter()
+    per_intent = {}
+    disagreements = []
+    for item in labels:
+        question, expected = item["question"], item["intent"]
+        intent, answer, confidence, _ = engine.classify(question)
+        answered = answer is not None and confidence >= engine.min_confidence
+        predicted = intent if answered else None
+
+        rows["questions"] += 1
+        rows["intent_correct"] += intent == expected
+        if expected:
+            stats = per_intent.setdefault(expected, Counter())
+            stats["labeled"] += 1
+            stats["answered"] += answered
+        if not answered:
+            continue
+
+        rows["answered"] += 1
+        rows["answered_correct"] += predicted == expected
+        if expected:
+            per_intent[expected]["correct"] += predicted == expected
+        config_answer, _, score = answers.lookup(question)
+        if config_answer is not None and score == 1.0:
+            rows["config_answers"] += 1
+            if _same_answer(config_answer, answer):
+                rows["config_agrees"] += 1
+            else:
+                disagreements.append((question, config_answer, answer))
+    return rows, per_intent, disagreements
+
+
+def throughput(profile, min_confidence, questions, rounds):
+    """Questions classified per second by a fresh engine, so nothing is cached."""
+    started = time.perf_counter()
+    for _ in range(rounds):
+        engine = IntentEngine(profile, min_confidence)
+        for question in questions:
+            engine.classify(question)
+    return rounds * len(questions) / (time.perf_counter() - started)
+
+
+def print_report(rows, per_intent, disagreements, rate):
+    def share(part, whole):
+        return f"{rows[part]}/{rows[whole]} ({rows[part] / max(rows[whole], 1):.1%})"
+
+    labeled = sum(stats["labeled"] for stats in per_intent.values())
+    print(f"Intent accuracy:         {share('intent_correct', 'questions')}")
+    print(f"Answered, right intent:  {share('answered_correct', 'answered')}")
+    print(
+        f"Coverage:                {rows['answered_correct']}/{labeled} labeled "
+        f"questions ({rows['answered_correct'] / max(labeled, 1):.1%})"
+    )
+    # The config holds the user's own answers, so this is the answer precision.
+    print(f"Answer precision:        {share('config_agrees', 'config_answers')}")
+    print(f"Throughput:              {rate:,.0f} questions/s")
+
+    if disagreements:
+        print("\nAnswers that differ from config.yaml:")
+        for question, config_answer, answer in disagreements:
+            print(f"  {answer!r} (config {config_answer!r})  {question}")
+
+    print(f"\n{'intent':<20} {'labeled':>7} {'answered':>8} {'correct':>7}")
+    for intent, stats in sorted(per_intent.items(), key=lambda item: -item[1]["labeled"]):
+        print(
+            f"{intent:<20} {stats['labeled']:>7} {stats['answered']:>8} "
+            f"{stats['correct']:>7}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Score the rule-based answer engine on the labeled config questions."
+    )
+    parser.add_argument("--profile", default=ANSWER_PROFILE)
+    parser.add_argument("--config", default="resources/config.yaml")
+    parser.add_argument("--labels", default=INTENT_LABELS)
+    parser.add_argument("--min-confidence", type=float, default=MIN_CONFIDENCE)
+    parser.add_argument("--rounds", type=int, default=20, help="throughput repetitions")
+    args = parser.parse_args()
+
+    with open(args.profile, "r") as file:
+        profile = yaml.safe_load(file) or {}
+    with open(args.config, "r") as file:
+        config = yaml.safe_load(file) or {}
+    with open(args.labels, "r") as file:
+        labels = yaml.safe_load(file)
+
+    engine = IntentEngine(profile, args.min_confidence)
+    rows, per_intent, disagreements = evaluate(engine, labels, config)
+    rate = throughput(
+        engine.profile,
+        engine.min_confidence,
+        [item["question"] for item in labels],
+        args.rounds,
+    )
+    print_report(rows, per_intent, disagreements, rate)
+
+
+if __name__ == "__main__":
+    main()
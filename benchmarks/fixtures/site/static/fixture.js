@@ -0,0 +1,287 @@
+// Behaves like the parts of LinkedIn's job search the bot touches: a
+// virtualized results list, a details pane filled after a delay, and a
+// multi-step Easy Apply modal that validates each step before moving on.
+(function () {
+    const params = new URLSearchParams(location.search);
+    const PAGE_SIZE = 25;
+    const TOTAL = parseInt(params.get('jobs') || '10', 10);
+    const LATENCY = parseInt(params.get('latency') || '100', 10);
+    const START = parseInt(params.get('start') || '0', 10);
+    // Cards further than this from the viewport are emptied again.
+    const RENDER_BUFFER = 600;
+
+    const TITLES = ['Python Developer', 'Backend Engineer', 'Data Engineer',
+                    'Software Engineer', 'Automation Engineer'];
+    const COMPANIES = ['Acme', 'Globex', 'Initech', 'Umbrella', 'Hooli',
+                       'Stark Industries', 'Wayne Enterprises'];
+
+    const stats = window.__fixtureStats = {
+        detailsShown: 0, modalsOpened: 0, stepsRejected: 0, submitted: 0,
+    };
+    const later = (callback, factor) => setTimeout(callback, LATENCY * (factor || 1));
+    const el = (tag, attributes, children) => {
+        const node = document.createElement(tag);
+        for (const [key, value] of Object.entries(attributes || {})) {
+            if (key === 'text') { node.textContent = value; } else { node.setAttribute(key, value); }
+        }
+        for (const child of children || []) { node.appendChild(child); }
+        return node;
+    };
+
+    const jobs = [];
+    for (let index = START; index < Math.min(TOTAL, START + PAGE_SIZE); index++) {
+        jobs.push({
+            id: String(3900000000 + index),
+            index: index,
+            title: TITLES[index % TITLES.length],
+            company: COMPANIES[index % COMPANIES.length],
+            location: index % 3 === 0 ? 'United States (Remote)' : 'Austin, TX',
+            easyApply: index % 7 !== 6,
+            applied: index % 11 === 10,
+        });
+    }
+
+    // --- Results list --------------------------------------------------------
+
+    const list = document.querySelector('.jobs-search-results-list');
+    const container = list.querySelector('ul');
+
+    function cardContent(job) {
+        const footer = job.applied ? 'Applied' : (job.easyApply ? 'Easy Apply' : 'Promoted');
+        return el('div', {'class': 'job-card-container', 'data-job-id': job.id}, [
+            el('div', {'class': 'job-card-list__title', text: job.title}),
+            el('div', {'class': 'artdeco-entity-lockup__subtitle', text: job.company}),
+            el('div', {'class': 'artdeco-entity-lockup__caption', text: job.location}),
+            el('div', {'class': 'job-card-container__footer-wrapper', text: footer}),
+        ]);
+    }
+
+    function hydrate() {
+        const top = list.scrollTop - RENDER_BUFFER;
+        const bottom = list.scrollTop + list.clientHeight + RENDER_BUFFER;
+        for (const li of container.children) {
+            const near = li.offsetTop + li.offsetHeight > top && li.offsetTop < bottom;
+            const job = jobs[Number(li.dataset.index)];
+            if (near && !li.firstChild && !li.dataset.pending) {
+                li.dataset.pending = '1';
+                later(() => {
+                    delete li.dataset.pending;
+                    if (!li.firstChild) { li.appendChild(cardContent(job)); }
+                }, 0.5);
+            } else if (!near && li.firstChild) {
+                li.replaceChildren();
+            }
+        }
+    }
+
+    if (!jobs.length) {
+        list.querySelector('.jobs-search-no-results-banner').hidden = false;
+    }
+    jobs.forEach((job, position) => {
+        const li = el('li', {'data-occludable-job-id': job.id, 'data-index': String(position)});
+        li.addEventListener('click', () => showDetails(job));
+        container.appendChild(li);
+    });
+    list.addEventListener('scroll', hydrate);
+    hydrate();
+
+    // --- Details pane --------------------------------------------------------
+
+    const topCard = document.querySelector('.jobs-unified-top-card');
+    const details = document.getElementById('job-details');
+
+    function showDetails(job) {
+        topCard.replaceChildren();
+        details.replaceChildren();
+        later(() => {
+            const url = new URL(location.href);
+            url.searchParams.set('currentJobId', job.id);
+            history.replaceState(null, '', url);
+
+            topCard.append(
+                el('h2', {text: job.title}),
+                el('a', {href: `/jobs/view/${job.id}/`, text: job.company}),
+            );
+            if (job.easyApply && !job.applied) {
+                const button = el('button', {'class': 'jobs-apply-button', text: 'Easy Apply'});
+                button.addEventListener('click', () => openModal(job));
+                topCard.appendChild(button);
+            }
+            details.append(
+                el('h2', {text: 'About the job'}),
+                el('p', {text: `${job.company} is hiring a ${job.title} to build and run ` +
+                              'Python services. You will work with Selenium, SQL and ' +
+                              'cloud tooling in a small team.'}),
+            );
+            stats.detailsShown += 1;
+        });
+    }
+
+    // --- Easy Apply modal ----------------------------------------------------
+
+    function stepsFor(job) {
+        const steps = [
+            {title: 'Contact info', fields: [
+                {kind: 'text', label: 'First name', value: 'Bench'},
+                {kind: 'text', label: 'Last name', value: 'Runner'},
+                {kind: 'select', label: 'Email address',
+                 options: ['Select an option', 'bench@example.com']},
+                {kind: 'text', label: 'Mobile phone number'},
+            ]},
+            {title: 'Resume', resume: true, fields: [
+                {kind: 'file', label: 'Upload resume', optional: true},
+            ]},
+            {title: 'Additional Questions', fields: [
+                {kind: 'radio', label: 'Are you legally authorized to work in the United States?',
+                 options: ['Yes', 'No']},
+                {kind: 'radio',
+                 label: 'Will you now or in the future require sponsorship for employment visa status?',
+                 options: ['Yes', 'No']},
+                {kind: 'text', label: 'How many years of work experience do you have with Python?'},
+                {kind: 'select', label: "Do you have a Bachelor's degree?",
+                 options: ['Select an option', 'Yes', 'No']},
+            ]},
+        ];
+        // Every other job asks company-specific questions no config answers.
+        if (job.index % 2 === 1) {
+            steps.push({title: 'Screening questions', fields: [
+                {kind: 'textarea', label: `Why do you want to work at ${job.company}?`},
+                {kind: 'textarea', label: 'Cover letter', optional: true},
+                {kind: 'checkbox', label: `I agree to the ${job.company} privacy policy`},
+            ]});
+        }
+        return steps;
+    }
+
+    function renderField(field, key) {
+        const id = `fixture-${key}`;
+        if (field.kind === 'radio') {
+            return el('fieldset', {'class': 'fb-field', 'data-kind': 'radio'}, [
+                el('legend', {}, [el('span', {text: field.label})]),
+                ...field.options.map((option, index) => el('div', {}, [
+                    el('input', {type: 'radio', id: `${id}-${index}`, name: id, value: option}),
+                    el('label', {'for': `${id}-${index}`, text: option}),
+                ])),
+            ]);
+        }
+
+        let control;
+        if (field.kind === 'select') {
+            control = el('select', {id: id},
+                         field.options.map((option) => el('option', {text: option})));
+        } else if (field.kind === 'textarea') {
+            control = el('textarea', {id: id});
+        } else {
+            control = el('input', {type: field.kind, id: id});
+            if (field.value) { control.value = field.value; }
+        }
+        control.dataset.kind = field.kind;
+        if (field.optional) { control.dataset.optional = '1'; }
+        return el('div', {'class': 'fb-field'}, [
+            el('label', {'for': id, text: field.label}),
+            control,
+        ]);
+    }
+
+    function stepIsValid(form) {
+        let valid = true;
+        for (const fieldset of form.querySelectorAll('fieldset[data-kind="radio"]')) {
+            valid = valid && !!fieldset.querySelector('input:checked');
+        }
+        for (const control of form.querySelectorAll('[data-kind]:not(fieldset)')) {
+            if (control.dataset.optional) { continue; }
+            if (control.dataset.kind === 'checkbox') {
+                valid = valid && control.checked;
+            } else if (control.tagName === 'SELECT') {
+                valid = valid && control.selectedIndex > 0;
+            } else {
+                valid = valid && control.value.trim() !== '';
+            }
+        }
+        return valid;
+    }
+
+    function openModal(job) {
+        const steps = stepsFor(job);
+        const modal = el('div', {'class': 'jobs-easy-apply-modal', role: 'dialog'});
+        document.body.appendChild(modal);
+        stats.modalsOpened += 1;
+
+        function button(label, text, onClick) {
+            const node = el('button', {type: 'button', 'aria-label': label, text: text});
+            node.addEventListener('click', onClick);
+            return node;
+        }
+
+        function advance(form, render) {
+            if (!stepIsValid(form)) {
+                stats.stepsRejected += 1;
+                if (!form.querySelector('.artdeco-inline-feedback--error')) {
+                    form.appendChild(el('p', {'class': 'artdeco-inline-feedback--error',
+                                              text: 'Please enter a valid answer'}));
+                }
+                return;
+            }
+            later(render, 0.5);
+        }
+
+        function renderStep(number) {
+            const step = steps[number];
+            const form = el('form', {novalidate: ''}, [
+                el('h3', {text: step.title}),
+                ...step.fields.map((field, index) => renderField(field, `${number}-${index}`)),
+            ]);
+            if (step.resume) {
+                form.insertBefore(el('div', {
+                    'class': 'jobs-document-upload-redesign-card__container ' +
+                             'jobs-document-upload-redesign-card__container--selected',
+                }, [el('h3', {text: 'Bench_Runner_Resume.pdf'})]), form.children[1]);
+            }
+            const last = number === steps.length - 1;
+            const next = last
+                ? button('Review your application', 'Review', () => advance(form, renderReview))
+                : button('Continue to next step', 'Next',
+                         () => advance(form, () => renderStep(number + 1)));
+            modal.replaceChildren(
+                el('h2', {text: `Apply to ${job.company}`}),
+                el('progress', {max: String(steps.length + 1), value: String(number + 1)}),
+                form,
+                next,
+            );
+        }
+
+        function renderReview() {
+            const form = el('form', {novalidate: ''}, [
+                el('h3', {text: 'Review your application'}),
+                el('input', {type: 'checkbox', id: 'follow-company-checkbox'}),
+                el('label', {'for': 'follow-company-checkbox', text: `Follow ${job.company}`}),
+            ]);
+            form.querySelector('#follow-company-checkbox').checked = true;
+            modal.replaceChildren(
+                el('h2', {text: `Apply to ${job.company}`}),
+                el('progress', {max: String(steps.length + 1), value: String(steps.length + 1)}),
+                form,
+                button('Submit application', 'Submit application', submit),
+            );
+        }
+
+        function submit() {
+            modal.remove();
+            job.applied = true;
+            stats.submitted += 1;
+            topCard.querySelector('.jobs-apply-button')?.remove();
+            const li = container.querySelector(`li[data-occludable-job-id="${job.id}"]`);
+            if (li && li.firstChild) { li.replaceChildren(cardContent(job)); }
+
+            later(() => {
+                const sent = el('div', {'class': 'artdeco-modal', role: 'dialog'}, [
+                    el('h2', {text: `Your application was sent to ${job.company}`}),
+                ]);
+                sent.prepend(button('Dismiss', '×', () => sent.remove()));
+                document.body.appendChild(sent);
+            });
+        }
+
+        renderStep(0);
+    }
+})();
@@ -0,0 +1,98 @@
+import argparse
+import statistics
+import time
+
+from benchmarks.fixture_server import serve_directory
+from scripts.job_application_bot import setup_driver
+
+PROFILES = {
+    "standard": {},
+    "lean": {"lean": True},
+}
+
+PAGE_METRICS_SCRIPT = """
+const resources = performance.getEntriesByType('resource');
+const navigation = performance.getEntriesByType('navigation')[0] || {};
+return {
+    requests: resources.length + 1,
+    transferred: resources.reduce((total, entry) => total + (entry.transferSize || 0),
+                                  navigation.transferSize || 0),
+    dom_content_loaded: navigation.domContentLoadedEventEnd || 0,
+    heap: (performance.memory && performance.memory.usedJSHeapSize) || 0,
+};
+"""
+
+
+def measure_profile(name, browser_settings, urls, runs):
+    driver = setup_driver(browser_settings=browser_settings)
+    samples = []
+    try:
+        for _ in range(runs):
+            for url in urls:
+                driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+                start = time.perf_counter()
+                driver.get(url)
+                elapsed = time.perf_counter() - start
+                metrics = driver.execute_script(PAGE_METRICS_SCRIPT)
+                samples.append(dict(metrics, wall=elapsed))
+    finally:
+        driver.quit()
+    return name, samples
+
+
+def print_report(results):
+    print(
+        f"{'profile':<10} {'loads':>5} {'mean ms':>8} {'p95 ms':>8} "
+        f"{'requests':>8} {'KB':>8} {'heap MB':>8}"
+    )
+    for name, samples in results:
+        walls = sorted(sample["wall"] * 1000 for sample in samples)
+        p95 = walls[min(len(walls) - 1, int(len(walls) * 0.95))]
+        print(
+            f"{name:<10} {len(samples):>5} {statistics.mean(walls):>8.0f} {p95:>8.0f} "
+            f"{statistics.mean(s['requests'] for s in samples):>8.1f} "
+            f"{statistics.mean(s['transferred'] for s in samples) / 1024:>8.0f} "
+            f"{statistics.mean(s['heap'] for s in samples) / 2**20:>8.1f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare page loads under the standard and lean browser profiles."
+    )
+    parser.add_argument("urls", nargs="*", help="pages to load (paths when --serve is used)")
+    parser.add_argument("--serve", help="serve this fixture directory locally")
+    parser.add_argument("--runs", type=int, default=5, help="loads per page and profile")
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="run the standard profile headless too, for display-less machines",
+    )
+    args = parser.parse_args()
+
+    server = None
+    urls = args.urls
+    if args.serve:
+        server, base_url = serve_directory(args.serve)
+        urls = [f"{base_url}/{path.lstrip('/')}" for path in (urls or ["index.html"])]
+    if not urls:
+        parser.error("give at least one URL or --serve a fixture directory")
+
+    profiles = {name: dict(settings) for name, settings in PROFILES.items()}
+    if args.headless:
+        profiles["standard"]["headless"] = True
+
+    try:
+        results = [
+            measure_profile(name, settings, urls, args.runs)
+            for name, settings in profiles.items()
+        ]
+    finally:
+        if server:
+            server.shutdown()
+
+    print_report(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+import argparse
+import functools
+import json
+import logging
+import math
+import os
+import sys
+import tempfile
+import time
+from urllib.parse import urlencode
+
+import yaml
+
+from benchmarks import stub_ai_bot
+
+# Must be in place before the bot imports ai.ai_bot, so no request reaches OpenAI.
+sys.modules["ai.ai_bot"] = stub_ai_bot
+
+from benchmarks.fixture_server import serve_directory  # noqa: E402
+from scripts import job_application_bot as bot  # noqa: E402
+from scripts import cover_letters, locators, metrics  # noqa: E402
+from scripts.answer_journal import append_answers  # noqa: E402
+from scripts.applied_ledger import AppliedJobsLedger, SUBMITTED  # noqa: E402
+from scripts.pagination import PAGE_SIZE  # noqa: E402
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+FIXTURE_SITE = os.path.join(FIXTURES_DIR, "site")
+FIXTURE_ANSWERS = os.path.join(FIXTURES_DIR, "answers.yaml")
+
+# Spans shown in the per-step latency table, in pipeline order.
+REPORTED_SPANS = (
+    "open_search_page",
+    "card_click",
+    "scrape_job_description",
+    "easy_apply_button",
+    "form_step",
+    "form_snapshot",
+    "form_plan",
+    "form_apply",
+    "field",
+    "follow_checkbox",
+    "close_popup",
+    "wait",
+    "cover_letter",
+    "cover_letter_wait",
+)
+
+
+def isolate_side_effects(workdir, legacy):
+    """Point every file the bot writes into ``workdir`` and stub out prompts."""
+    metrics.spans_path = os.path.join(workdir, "spans.jsonl")
+    metrics.prometheus_path = os.path.join(workdir, "jobbot.prom")
+    cover_letters.cover_letters_dir = os.path.join(workdir, "cover_letters")
+    locators.locator_stats_path = os.path.join(workdir, "locator_stats.json")
+    bot.append_answers = functools.partial(
+        append_answers, path=os.path.join(workdir, "answers.jsonl")
+    )
+    bot.ask_user = stub_ai_bot.ask_user
+    bot.USE_AI_ANSWERS = True
+    bot.USE_FORM_SNAPSHOT = not legacy
+    # Keep replayed questions out of the real unanswered_questions.log.
+    logging.disable(logging.CRITICAL)
+
+
+def run_once(driver, search_url, jobs, workdir, run):
+    with open(FIXTURE_ANSWERS, "r") as file:
+        config = yaml.safe_load(file)
+    settings = {
+        "pagination": {"max_pages": math.ceil(jobs / PAGE_SIZE)},
+        "cover_letters": {"enabled": True},
+    }
+    ledger = AppliedJobsLedger(os.path.join(workdir, f"ledger-{run}.sqlite3"))
+
+    started = time.perf_counter()
+    try:
+        outcomes = bot.apply_to_jobs(
+            driver,
+            config,
+            settings,
+            ledger=ledger,
+            checkpoint_file=os.path.join(workdir, f"checkpoint-{run}.json"),
+            search=search_url,
+        )
+    finally:
+        ledger.close()
+    elapsed = time.perf_counter() - started
+
+    fixture_stats = driver.execute_script("return window.__fixtureStats || {};")
+    return {
+        "run": run,
+        "seconds": elapsed,
+        "submitted": outcomes[SUBMITTED],
+        "processed": sum(outcomes.values()),
+        "outcomes": dict(outcomes),
+        "applications_per_minute": outcomes[SUBMITTED] / (elapsed / 60),
+        "fixture": fixture_stats,
+    }
+
+
+def step_latencies():
+    """Collapse span_summary() per span name, for the spans in REPORTED_SPANS."""
+    rows = {}
+    for (name, labels), stats in metrics.span_summary().items():
+        if name not in REPORTED_SPANS:
+            continue
+        label = name + "".join(f" {key}={value}" for key, value in labels)
+        rows[label] = {
+            key: round(stats[key], 4) for key in ("count", "total", "p50", "p95", "max")
+        }
+    order = {name: index for index, name in enumerate(REPORTED_SPANS)}
+    ranked = sorted(rows, key=lambda label: (order[label.split()[0]], label))
+    return {label: rows[label] for label in ranked}
+
+
+def print_report(results, latencies):
+    for result in results:
+        fixture = result["fixture"]
+        print(
+            f"Run {result['run']}: {result['submitted']} submitted, "
+            f"{result['processed']} processed in {result['seconds']:.1f}s "
+            f"({result['applications_per_minute']:.2f} applications/min); "
+            f"fixture saw {fixture.get('submitted', 0)} submissions and "
+            f"{fixture.get('stepsRejected', 0)} rejected steps"
+        )
+
+    print(f"\n{'step':<34} {'count':>6} {'p50 s':>7} {'p95 s':>7} {'total s':>8}")
+    for label, stats in latencies.items():
+        print(
+            f"{label[:34]:<34} {stats['count']:>6} {stats['p50']:>7.3f} "
+            f"{stats['p95']:>7.3f} {stats['total']:>8.1f}"
+        )
+
+    calls = ", ".join(f"{count} {kind}" for kind, count in stub_ai_bot.CALLS.items())
+    print(f"\nStubbed LLM/prompt calls: {calls or 'none'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Replay the bot against the offline fixture site and time it."
+    )
+    parser.add_argument("--jobs", type=int, default=10, help="results in the search")
+    parser.add_argument("--runs", type=int, default=1, help="repetitions, each fresh")
+    parser.add_argument(
+        "--latency", type=int, default=100, help="simulated network delay in ms"
+    )
+    parser.add_argument(
+        "--llm-latency", type=float, default=0.0, help="seconds per stubbed LLM call"
+    )
+    parser.add_argument(
+        "--legacy",
+        action="store_true",
+        help="fill forms element by element instead of from snapshots",
+    )
+    parser.add_argument("--lean", action="store_true", help="use the lean browser mode")
+    parser.add_argument("--headed", action="store_true", help="show the browser window")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    stub_ai_bot.LATENCY = args.llm_latency
+    workdir = tempfile.mkdtemp(prefix="jobbot-replay-")
+    isolate_side_effects(workdir, args.legacy)
+
+    server, base_url = serve_directory(FIXTURE_SITE)
+    query = {"keywords": "python", "jobs": args.jobs, "latency": args.latency}
+    search_url = f"{base_url}/jobs/search/?{urlencode(query)}"
+
+    driver = bot.setup_driver(
+        browser_settings={"headless": not args.headed, "lean": args.lean}
+    )
+    try:
+        results = [
+            run_once(driver, search_url, args.jobs, workdir, run)
+            for run in range(1, args.runs + 1)
+        ]
+    finally:
+        driver.quit()
+        server.shutdown()
+
+    latencies = step_latencies()
+    print_report(results, latencies)
+    print(f"Spans and metrics were written to {workdir}")
+
+    if args.json:
+        with open(args.json, "w") as file:
+            report = {"args": vars(args), "runs": results, "steps": latencies}
+            json.dump(report, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
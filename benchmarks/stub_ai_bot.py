@@ -0,0 +1,55 @@
+"""Offline stand-in for ai/ai_bot.py with canned answers and a fixed latency."""
+
+import re
+import time
+from collections import Counter
+
+# Seconds each stubbed LLM request takes.
+LATENCY = 0.0
+CALLS = Counter()
+
+
+def _answer(question, options=None):
+    options = [option for option in options or [] if option]
+    if options:
+        return "Yes" if "Yes" in options else options[0]
+    if re.search(r"\bhow many\b|\byears\b", question, re.IGNORECASE):
+        return "3"
+    return "My background matches the role well and I enjoy this kind of work."
+
+
+def generate_cover_letter(job_description, client=None):
+    CALLS["cover_letter"] += 1
+    time.sleep(LATENCY)
+    return "Dear hiring manager, I would like to apply for this role."
+
+
+def generate_answer_for_question(question, client=None):
+    CALLS["answer"] += 1
+    time.sleep(LATENCY)
+    return _answer(question)
+
+
+async def agenerate_answers_for_questions(questions, client=None, max_concurrency=4):
+    return generate_answers_for_questions(questions, client)
+
+
+def generate_answers_for_questions(questions, client=None):
+    CALLS["batch_answer"] += 1
+    time.sleep(LATENCY)
+    return {
+        item["question"]: _answer(item["question"], item.get("options"))
+        for item in questions
+    }
+
+
+def cache_stats():
+    return {"hits": 0, "misses": sum(CALLS.values()), "evictions": 0, "hit_rate": 0.0}
+
+
+def ask_user(message):
+    """Answer a terminal prompt the way a user would, without blocking."""
+    CALLS["prompt"] += 1
+    match = re.search(r"'(.*)'", message)
+    question = match.group(1) if match else message
+    return _answer(question, ["Yes", "No"] if "(Yes/No)" in message else None)
@@ -1,14 +1,22 @@
+import argparse
 import os
 
 from dotenv import load_dotenv
 
+from scripts.answer_journal import compact_journal
+from scripts.checkpoint import load_checkpoint
+from scripts.pagination import PAGE_SIZE
+from scripts.startup import DEFAULT_PROFILE_DIR, startup_phase
 from scripts.job_application_bot import (
     load_config,
-    linkedin_login,
+    load_settings,
+    ensure_logged_in,
     apply_to_jobs,
     setup_driver,
+    start_rate_limits,
     update_yaml_with_env,
 )
+from scripts.worker_pool import run_worker_pool
 
 load_dotenv("resources/.env")
 LINKEDIN_USERNAME = os.getenv("LINKEDIN_USERNAME")
@@ -17,14 +25,83 @@ config_path = "resources/config.yaml"
 
 
 if __name__ == "__main__":
-    config = load_config()
-    update_yaml_with_env(config_path)
-    driver = setup_driver()
-    linkedin_login(driver, LINKEDIN_USERNAME, LINKEDIN_PASSWORD)
+    parser = argparse.ArgumentParser(description="Apply to LinkedIn Easy Apply jobs.")
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="continue from the last checkpoint instead of waiting for manual filters",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="run this many Chrome sessions over --search or the searches in "
+        "settings.yaml",
+    )
+    parser.add_argument(
+        "--defer-questions",
+        action="store_true",
+        help="park applications with unknown questions instead of prompting",
+    )
+    parser.add_argument(
+        "--search",
+        help="search URL to apply from, instead of pausing to set filters by hand",
+    )
+    args = parser.parse_args()
 
-    input("Please manually log in and apply filters. Press Enter to continue...")
+    with startup_phase("config load"):
+        config = load_config()
+        settings = load_settings()
+        update_yaml_with_env(config_path)
+        start_rate_limits(settings)
+    if args.defer_questions:
+        settings.setdefault("questions", {})["defer"] = True
+
+    if args.workers > 1:
+        try:
+            run_worker_pool(
+                config,
+                settings,
+                args.workers,
+                (LINKEDIN_USERNAME, LINKEDIN_PASSWORD),
+                searches=[args.search] if args.search else None,
+                resume=args.resume,
+            )
+        finally:
+            compact_journal(config_path)
+        raise SystemExit
+
+    checkpoint = load_checkpoint() if args.resume else None
+    if args.resume and not checkpoint:
+        print("No checkpoint found, starting a new run.")
+
+    browser_settings = settings.get("browser") or {}
+    driver = setup_driver(
+        profile_dir=browser_settings.get("profile_dir", DEFAULT_PROFILE_DIR),
+        browser_settings=browser_settings,
+    )
+    session_reused = ensure_logged_in(driver, LINKEDIN_USERNAME, LINKEDIN_PASSWORD)
+
+    search = args.search
+    start_page = None
+    if checkpoint:
+        search = checkpoint["search_url"]
+        start_page = checkpoint["start"] // PAGE_SIZE
+    elif not search:
+        if session_reused:
+            input("Please apply your search filters. Press Enter to continue...")
+        else:
+            input("Please manually log in and apply filters. Press Enter to continue...")
 
     try:
-        apply_to_jobs(driver, config)
+        apply_to_jobs(
+            driver,
+            config,
+            settings,
+            resume=checkpoint,
+            search=search,
+            start_page=start_page,
+        )
     finally:
         driver.quit()
+        compact_journal(config_path)
@@ -0,0 +1,199 @@
+import re
+import threading
+from collections import Counter, defaultdict
+
+# Trigram similarity the words two questions don't share must reach, e.g.
+# "authorised"/"authorized" (0.73) but not "Rust"/"Ruby" (0.4).
+FUZZY_MATCH_THRESHOLD = 0.7
+# Words one question may have and the other not without changing the question.
+FILLER_WORDS = frozenset({"a", "an", "the", "of", "please", "your"})
+
+_REQUIRED_SUFFIX = re.compile(r"\s*\bRequired\s*$")
+# "C#", "C++" and "C" are different languages, so the symbols become words
+# before punctuation is dropped.
+_SHARP = re.compile(r"(?<=\w)#")
+_PLUS_PLUS = re.compile(r"(?<=\w)\+\+")
+_PUNCTUATION = re.compile(r"[^\w\s]")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_question(text):
+    """Canonicalize a question label so LinkedIn's label variants share one key.
+
+    Repeated label text ("Q\\n\\nQ" or "Q Q"), a trailing "Required" marker,
+    case and punctuation are all dropped; "C#" and "C++" become "csharp" and
+    "cpp".
+    """
+    if text is None:
+        return ""
+
+    lines = []
+    for line in str(text).splitlines():
+        line = _REQUIRED_SUFFIX.sub("", line.strip())
+        if line and line not in lines:
+            lines.append(line)
+
+    normalized = " ".join(lines).lower()
+    normalized = _PLUS_PLUS.sub("pp", _SHARP.sub("sharp", normalized))
+    normalized = _PUNCTUATION.sub(" ", normalized)
+    words = _WHITESPACE.sub(" ", normalized).strip().split(" ")
+
+    half = len(words) // 2
+    if len(words) % 2 == 0 and half and words[:half] == words[half:]:
+        words = words[:half]
+
+    return " ".join(words)
+
+
+def normalize_answer(value):
+    """Turn a YAML answer into the string the form handlers expect."""
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return "Yes" if value else "No"
+    value = str(value).strip()
+    return value or None
+
+
+def _trigrams(key):
+    padded = f"  {key} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def _dice(shared, left, right):
+    return 2.0 * shared / (left + right) if left + right else 0.0
+
+
+def _trigram_similarity(left, right):
+    if not left or not right:
+        return 0.0
+    left, right = _trigrams(left), _trigrams(right)
+    return _dice(len(left & right), len(left), len(right))
+
+
+class AnswerIndex:
+    """Answers keyed by normalized question text, built once per run.
+
+    Exact lookups are a single dict hit on the canonical key. On a miss, a
+    token inverted index proposes stored questions that share most of the
+    words. Questions built from one template ("How many years of experience
+    do you have with X?") differ only in their slot, so only the words that
+    are not shared are scored: their trigram similarity has to clear
+    ``fuzzy_threshold``, which lets a spelling variant through but not
+    another technology or number.
+
+    Between the two tiers, ``engine(question)``, if given, may answer the
+    question from its intent and slots; it returns an
+    ``(answer, matched_question, score)`` triple like ``lookup``. It comes
+    before the fuzzy tier so that a confident intent answer is never
+    overridden by a stored answer to a merely similar question.
+    """
+
+    def __init__(
+        self, answers=None, fuzzy_threshold=FUZZY_MATCH_THRESHOLD, engine=None
+    ):
+        self.fuzzy_threshold = fuzzy_threshold
+        self.engine = engine
+        self._answers = {}
+        self._questions = {}
+        self._tokens = {}
+        self._postings = defaultdict(set)
+        self._fuzzy_cache = {}
+        self._lock = threading.Lock()
+
+        for question, answer in (answers or {}).items():
+            self.add(question, answer, overwrite=False)
+
+    def __len__(self):
+        return len(self._answers)
+
+    def __contains__(self, question):
+        return self.get(question) is not None
+
+    def add(self, question, answer, overwrite=True):
+        """Store an answer; returns False when there was nothing to store."""
+        key = normalize_question(question)
+        answer = normalize_answer(answer)
+        if not key or answer is None:
+            return False
+        with self._lock:
+            if key in self._answers and not overwrite:
+                return False
+
+            if key not in self._answers:
+                tokens = frozenset(key.split())
+                self._tokens[key] = tokens
+                for token in tokens - FILLER_WORDS:
+                    self._postings[token].add(key)
+
+            self._answers[key] = answer
+            self._questions[key] = question
+            self._fuzzy_cache = {}
+            return True
+
+    def lookup(self, question):
+        """Return ``(answer, matched_question, score)`` for a question label."""
+        key = normalize_question(question)
+        if not key:
+            return None, None, 0.0
+
+        if key in self._answers:
+            return self._answers[key], self._questions[key], 1.0
+
+        if self.engine is not None:
+            answer, matched_question, engine_score = self.engine(question)
+            if answer is not None:
+                return answer, matched_question, engine_score
+
+        if key not in self._fuzzy_cache:
+            self._fuzzy_cache[key] = self._fuzzy_match(key)
+
+        match, score = self._fuzzy_cache[key]
+        if match is not None:
+            return self._answers[match], self._questions[match], score
+        return None, None, score
+
+    def get(self, question, default=None):
+        answer, matched_question, score = self.lookup(question)
+        if answer is None:
+            return default
+        if score < 1.0:
+            print(f"Matched '{question}' to '{matched_question}' (score {score:.2f})")
+        return answer
+
+    def _fuzzy_match(self, key):
+        words = key.split()
+        tokens = frozenset(words)
+        shared = Counter()
+        for token in tokens - FILLER_WORDS:
+            shared.update(self._postings.get(token, ()))
+
+        best_key, best_score = None, 0.0
+        for candidate, count in shared.items():
+            candidate_tokens = self._tokens[candidate]
+            # Both questions have to be mostly the same words.
+            if 2 * count < max(len(tokens), len(candidate_tokens)):
+                continue
+
+            # Joined without spaces, so "react js" still matches "reactjs".
+            left = "".join(
+                word
+                for word in words
+                if word not in candidate_tokens and word not in FILLER_WORDS
+            )
+            right = "".join(
+                word
+                for word in candidate.split()
+                if word not in tokens and word not in FILLER_WORDS
+            )
+            if left != right:
+                score = _trigram_similarity(left, right)
+            else:
+                # Only word order, spacing or filler words differ.
+                score = _trigram_similarity(key, candidate)
+            if score > best_score:
+                best_key, best_score = candidate, score
+
+        if best_score >= self.fuzzy_threshold:
+            return best_key, best_score
+        return None, best_score
@@ -0,0 +1,87 @@
+import json
+import os
+import tempfile
+import threading
+import time
+
+import yaml
+
+journal_path = "resources/answers.jsonl"
+
+_lock = threading.Lock()
+
+
+def append_answers(new_answers, path=journal_path):
+    """Append answers to the journal and fsync, so a crash loses at most the line being written."""
+    lines = "".join(
+        json.dumps({"question": question, "answer": answer, "ts": time.time()}) + "\n"
+        for question, answer in new_answers.items()
+    )
+    with _lock:
+        with open(path, "a+b") as file:
+            # Start on a fresh line if an earlier write was torn mid-entry.
+            if file.tell() > 0:
+                file.seek(-1, os.SEEK_END)
+                if file.read(1) != b"\n":
+                    lines = "\n" + lines
+            file.write(lines.encode("utf-8"))
+            file.flush()
+            os.fsync(file.fileno())
+
+
+def load_journal(path=journal_path):
+    """Replay the journal into a dict; later entries win and a torn last line is ignored."""
+    answers = {}
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            for line in file:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    print(f"Ignoring incomplete journal entry in {path}.")
+                    continue
+                answers[entry["question"]] = entry["answer"]
+    except FileNotFoundError:
+        pass
+    return answers
+
+
+def write_yaml_atomic(path, data):
+    """Dump YAML to a temp file next to ``path`` and rename it into place."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=".yaml")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            yaml.safe_dump(data, file, allow_unicode=True)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def compact_journal(config_path, path=journal_path):
+    """Fold journaled answers back into the YAML config and clear the journal.
+
+    Replaying the same journal twice is harmless, so a crash between the YAML
+    rename and the journal removal only means the entries are merged again.
+    """
+    with _lock:
+        answers = load_journal(path)
+        if not answers:
+            return False
+
+        try:
+            with open(config_path, "r") as file:
+                config_data = yaml.safe_load(file) or {}
+
+            config_data.update(answers)
+            write_yaml_atomic(config_path, config_data)
+            os.remove(path)
+            print(f"Compacted {len(answers)} journaled answers into {config_path}.")
+            return True
+
+        except Exception as e:
+            print(f"Failed to compact answer journal: {e}")
+            return False
@@ -0,0 +1,139 @@
+import argparse
+import sqlite3
+import threading
+import time
+
+ledger_path = "resources/applied_jobs.sqlite3"
+
+SUBMITTED = "submitted"
+FAILED = "failed"
+NO_EASY_APPLY = "no_easy_apply"
+# Abandoned in defer mode until its questions are answered.
+PARKED = "parked"
+# A near-copy of a job already applied to, see scripts.job_corpus.
+DUPLICATE = "duplicate"
+
+
+class AppliedJobsLedger:
+    """Every job id the bot has processed, with its outcome, across runs.
+
+    Rows live in SQLite; the job id -> outcome map is also held in memory
+    so membership checks in the apply loop are a dict lookup. Workers sharing
+    one ledger claim a job id before touching it, so no two of them apply to
+    the same job.
+    """
+
+    def __init__(self, path=ledger_path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_id TEXT PRIMARY KEY,
+                outcome TEXT NOT NULL,
+                reason TEXT,
+                company TEXT,
+                title TEXT,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self._outcomes = dict(self._conn.execute("SELECT job_id, outcome FROM jobs"))
+        self._claimed = set()
+
+    def __contains__(self, job_id):
+        return job_id in self._outcomes
+
+    def __len__(self):
+        return len(self._outcomes)
+
+    def outcome(self, job_id):
+        return self._outcomes.get(job_id)
+
+    def claim(self, job_id, retry_failed=False, retry_parked=False):
+        """Reserve a job for this worker; False if it's processed or already claimed."""
+        if not job_id:
+            return True
+        with self._lock:
+            outcome = self._outcomes.get(job_id)
+            retryable = (retry_failed and outcome == FAILED) or (
+                retry_parked and outcome == PARKED
+            )
+            if job_id in self._claimed or (outcome and not retryable):
+                return False
+            self._claimed.add(job_id)
+            return True
+
+    def release(self, job_id):
+        """Give up a claim without recording an outcome."""
+        with self._lock:
+            self._claimed.discard(job_id)
+
+    def record(self, job_id, outcome, reason=None, company=None, title=None):
+        if not job_id:
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO jobs VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, outcome, reason, company, title, time.time()),
+            )
+            self._outcomes[job_id] = outcome
+            self._claimed.discard(job_id)
+
+    def submitted_since(self, since):
+        """Applications submitted at or after the ``since`` timestamp."""
+        return self._conn.execute(
+            "SELECT COUNT(*) FROM jobs WHERE outcome = ? AND updated_at >= ?",
+            (SUBMITTED, since),
+        ).fetchone()[0]
+
+    def stats(self, group_by="company"):
+        """Return ``(group, processed, submitted, success_rate)`` rows, busiest first."""
+        if group_by not in ("company", "title", "outcome"):
+            raise ValueError(f"Can't group the ledger by {group_by!r}")
+
+        rows = self._conn.execute(
+            f"""
+            SELECT COALESCE({group_by}, '(unknown)') AS grp,
+                   COUNT(*),
+                   SUM(outcome = ?)
+            FROM jobs
+            GROUP BY grp
+            ORDER BY COUNT(*) DESC, grp
+            """,
+            (SUBMITTED,),
+        ).fetchall()
+        return [
+            (group, total, submitted, submitted / total if total else 0.0)
+            for group, total, submitted in rows
+        ]
+
+    def close(self):
+        self._conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query the applied-jobs ledger.")
+    parser.add_argument(
+        "--by",
+        choices=("company", "title", "outcome"),
+        default="company",
+        help="column to group success rates by",
+    )
+    parser.add_argument("--limit", type=int, default=25, help="rows to show")
+    parser.add_argument("--ledger", default=ledger_path, help="ledger database path")
+    args = parser.parse_args()
+
+    ledger = AppliedJobsLedger(args.ledger)
+    rows = ledger.stats(args.by)
+    print(f"{len(ledger)} jobs processed.")
+    print(f"{args.by:<50} {'processed':>9} {'submitted':>9} {'rate':>6}")
+    for group, total, submitted, rate in rows[: args.limit]:
+        print(f"{group[:50]:<50} {total:>9} {submitted:>9} {rate:>6.0%}")
+    ledger.close()
+
+
+if __name__ == "__main__":
+    main()
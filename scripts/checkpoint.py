@@ -0,0 +1,38 @@
+import json
+import os
+import tempfile
+import time
+
+checkpoint_path = "resources/checkpoint.json"
+
+
+def save_checkpoint(state, path=checkpoint_path):
+    """Atomically write the run position so a crash never leaves half a file."""
+    state = dict(state, updated_at=time.time())
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=".json")
+    try:
+        with os.fdopen(fd, "w") as file:
+            json.dump(state, file)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def load_checkpoint(path=checkpoint_path):
+    try:
+        with open(path, "r") as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return None
+    except json.JSONDecodeError as e:
+        print(f"Ignoring unreadable checkpoint {path}: {e}")
+        return None
+
+
+def clear_checkpoint(path=checkpoint_path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,132 @@
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from collections import namedtuple
+from types import MappingProxyType
+
+import yaml
+
+config_cache_path = "resources/.config_cache.pickle"
+
+# Bump when the cached layout changes so old caches are ignored.
+CACHE_VERSION = 1
+
+# libyaml's loader when PyYAML was built with it; it parses several times faster.
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+CompiledConfig = namedtuple("CompiledConfig", "digest data")
+CompiledConfig.__doc__ = """A parsed config file.
+
+``digest`` is the SHA-256 of the file's bytes and ``data`` a read-only view
+of the parsed YAML.
+"""
+
+
+def _read_cache(cache_path, digest):
+    try:
+        with open(cache_path, "rb") as file:
+            cached = pickle.load(file)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"Ignoring unreadable config cache {cache_path}: {e}")
+        return None
+    if cached.get("version") != CACHE_VERSION or cached.get("digest") != digest:
+        return None
+    return cached["data"]
+
+
+def _write_cache(cache_path, digest, data):
+    directory = os.path.dirname(os.path.abspath(cache_path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=".pickle")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            pickle.dump(
+                {"version": CACHE_VERSION, "digest": digest, "data": data},
+                file,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class ConfigStore:
+    """One config file, parsed once and re-read only when it changes.
+
+    The parsed YAML is pickled to ``cache_path`` under the hash of the file,
+    so a run whose config.yaml is unchanged skips YAML parsing. ``load``
+    stats the file and only re-reads it after its mtime or size changed,
+    which is cheap enough to call before every application.
+    """
+
+    def __init__(self, path, cache_path=None):
+        self.path = path
+        self.cache_path = cache_path or config_cache_path
+        self.current = None
+        self._stat = None
+        self._lock = threading.Lock()
+
+    def load(self):
+        """Return the current CompiledConfig, re-reading the file if it changed."""
+        with self._lock:
+            stat = os.stat(self.path)
+            stat_key = (stat.st_mtime_ns, stat.st_size)
+            if self.current is not None and stat_key == self._stat:
+                return self.current
+
+            with open(self.path, "rb") as file:
+                raw = file.read()
+            digest = hashlib.sha256(raw).hexdigest()
+            self._stat = stat_key
+            if self.current is not None and digest == self.current.digest:
+                return self.current
+
+            data = _read_cache(self.cache_path, digest)
+            if data is None:
+                data = yaml.load(raw, Loader=Loader) or {}
+                try:
+                    _write_cache(self.cache_path, digest, data)
+                except OSError as e:
+                    print(f"Failed to write config cache {self.cache_path}: {e}")
+
+            self.current = CompiledConfig(digest, MappingProxyType(data))
+            return self.current
+
+    def changes(self):
+        """Return ``{key: value}`` added or edited in the file since the last load.
+
+        Returns nothing until the store has been loaded once, and nothing
+        when the file is gone or does not parse, which leaves the last good
+        config in place.
+        """
+        previous = self.current
+        if previous is None:
+            return {}
+        try:
+            compiled = self.load()
+        except (OSError, yaml.YAMLError) as e:
+            print(f"Keeping the loaded config, {self.path} could not be read: {e}")
+            return {}
+        if compiled is previous:
+            return {}
+        return {
+            key: value
+            for key, value in compiled.data.items()
+            if key not in previous.data or previous.data[key] != value
+        }
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def config_store(path):
+    """The shared ConfigStore for ``path``."""
+    with _stores_lock:
+        if path not in _stores:
+            _stores[path] = ConfigStore(path)
+        return _stores[path]
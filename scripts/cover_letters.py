@@ -0,0 +1,133 @@
+import os
+import re
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+from scripts.metrics import increment, span
+
+cover_letters_dir = "cover_letters"
+
+# How long a cover-letter field waits for a letter that is still being written.
+WAIT_SECONDS = 60
+
+# Cover-letter uploads take PDF or Word files; the generated .txt letter is
+# only pasted into text boxes.
+UPLOAD_EXTENSIONS = (".pdf", ".docx")
+
+_COVER_LETTER = re.compile(r"cover\s*letter", re.IGNORECASE)
+_UNSAFE = re.compile(r"[^\w-]+")
+
+
+def is_cover_letter_question(question_text):
+    return bool(question_text and _COVER_LETTER.search(question_text))
+
+
+def cover_letter_path(company, title, directory=None):
+    """``cover_letters/<company>--<title>.txt``, shared by reposts of a job."""
+
+    def slug(text):
+        return _UNSAFE.sub("-", (text or "unknown").strip().lower()).strip("-")
+
+    return os.path.join(
+        directory or cover_letters_dir, f"{slug(company)}--{slug(title)}.txt"
+    )
+
+
+def uploadable_cover_letter(path):
+    """The PDF or DOCX copy saved next to the letter at ``path``, or None."""
+    stem = os.path.splitext(path)[0]
+    for extension in UPLOAD_EXTENSIONS:
+        if os.path.exists(stem + extension):
+            return stem + extension
+    return None
+
+
+def _write_atomic(path, text):
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=".txt")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            file.write(text)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class CoverLetterWorker:
+    """Writes cover letters on a background thread while forms are filled.
+
+    ``submit`` hands a job's description over as soon as it is scraped, and
+    ``wait`` returns the letter's path once a form asks for it. Letters are
+    files in ``directory``, one per company and title. A letter that is
+    already there is reused, and so is one that is still being written.
+    """
+
+    def __init__(self, generate, directory=None, wait_seconds=WAIT_SECONDS):
+        self.generate = generate
+        self.directory = directory
+        self.wait_seconds = wait_seconds
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="cover-letter"
+        )
+        self._futures = {}
+        self._lock = threading.Lock()
+
+    def _path(self, job):
+        return cover_letter_path(job.get("company"), job.get("title"), self.directory)
+
+    def submit(self, job, job_description):
+        """Start writing the letter for ``job``; returns a Future of its path."""
+        path = self._path(job)
+        with self._lock:
+            future = self._futures.get(path)
+            if future is not None:
+                return future
+
+            future = Future()
+            if os.path.exists(path):
+                increment("cover_letter", source="cached")
+                future.set_result(path)
+            else:
+                future = self._executor.submit(self._write, path, job_description)
+            self._futures[path] = future
+            return future
+
+    def _write(self, path, job_description):
+        try:
+            with span("cover_letter") as attrs:
+                attrs["path"] = path
+                cover_letter = self.generate(job_description)
+                if not cover_letter or not cover_letter.strip():
+                    raise ValueError("the generated cover letter is empty")
+                _write_atomic(path, cover_letter.strip() + "\n")
+        except Exception as e:
+            print(f"Failed to write cover letter {path}: {e}")
+            with self._lock:
+                # A later repost of the job gets another try.
+                self._futures.pop(path, None)
+            return None
+
+        increment("cover_letter", source="generated")
+        print(f"Cover letter written to {path}")
+        return path
+
+    def wait(self, job):
+        """Path of the letter for ``job``, or None if it isn't ready in time."""
+        with self._lock:
+            future = self._futures.get(self._path(job))
+        if future is None:
+            return None
+        try:
+            with span("cover_letter_wait"):
+                return future.result(timeout=self.wait_seconds)
+        except FutureTimeoutError:
+            print(f"Cover letter for {job.get('title')} is not ready, skipping it.")
+            return None
+
+    def close(self):
+        """Finish the letter being written and drop the ones still queued."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,363 @@
+import os
+
+from selenium.webdriver.common.by import By
+
+from scripts.cover_letters import is_cover_letter_question, uploadable_cover_letter
+
+FIELD_ATTRIBUTE = "data-jobbot-field"
+
+# Collects every answerable control on the current Easy Apply step in one
+# round-trip. Each control is tagged with FIELD_ATTRIBUTE so the batched write
+# below (or a follow-up send_keys) can find it again without another scan.
+SNAPSHOT_SCRIPT = """
+const form = document.querySelector('form');
+if (!form) { return null; }
+
+const ATTR = arguments[0];
+const text = (el) => ((el && el.innerText) || '').trim();
+const labelFor = (control) => {
+    if (control.id) {
+        const label = document.querySelector(`label[for="${CSS.escape(control.id)}"]`);
+        if (label) { return label; }
+    }
+    const sibling = control.nextElementSibling;
+    return sibling && sibling.tagName === 'LABEL' ? sibling : null;
+};
+const controlFor = (label) => {
+    if (label.htmlFor) {
+        const control = document.getElementById(label.htmlFor);
+        if (control && control.matches('input, select, textarea')) { return control; }
+    }
+    for (let sibling = label.nextElementSibling; sibling; sibling = sibling.nextElementSibling) {
+        if (sibling.matches('input, select, textarea')) { return sibling; }
+        const nested = sibling.querySelector('input, select, textarea');
+        if (nested) { return nested; }
+    }
+    return null;
+};
+
+const fields = [];
+const seen = new Set();
+const labels = form.querySelectorAll('label:not([class*="visually-hidden"])');
+
+for (const label of labels) {
+    const id = String(fields.length);
+    const fieldset = label.closest('fieldset');
+    const radios = fieldset ? fieldset.querySelectorAll('input[type="radio"]') : [];
+
+    if (radios.length) {
+        if (seen.has(fieldset)) { continue; }
+        seen.add(fieldset);
+        const options = Array.from(radios).map((radio, index) => {
+            radio.setAttribute(ATTR, `${id}.${index}`);
+            return {id: `${id}.${index}`, label: text(labelFor(radio)), checked: radio.checked};
+        });
+        fields.push({
+            id: id,
+            kind: 'radio',
+            question: text(fieldset.querySelector('legend')) || text(label),
+            value: (options.find((option) => option.checked) || {}).label || '',
+            options: options,
+        });
+        continue;
+    }
+
+    const control = controlFor(label);
+    if (!control || seen.has(control)) { continue; }
+    seen.add(control);
+    control.setAttribute(ATTR, id);
+
+    const tag = control.tagName.toLowerCase();
+    const field = {
+        id: id,
+        kind: 'text',
+        question: text(label) || text(label.querySelector('span')),
+        value: control.value || '',
+        options: [],
+        typeahead: control.getAttribute('role') === 'combobox'
+            || control.hasAttribute('aria-autocomplete'),
+    };
+    if (tag === 'select') {
+        field.kind = 'select';
+        field.value = control.selectedIndex >= 0
+            ? control.options[control.selectedIndex].text.trim() : '';
+        field.options = Array.from(control.options).map((option) => option.text.trim());
+    } else if (control.type === 'checkbox') {
+        field.kind = 'checkbox';
+        field.value = control.checked;
+    } else if (control.type === 'file') {
+        field.kind = 'file';
+    }
+    fields.push(field);
+}
+
+return {
+    fields: fields,
+    resumeSelected: !!document.querySelector(
+        '.jobs-document-upload-redesign-card__container--selected'),
+};
+"""
+
+# Applies every planned write in one round-trip. Values are set through the
+# native setters and followed by input/change events so LinkedIn's React
+# state sees them, the same as typed input.
+APPLY_SCRIPT = """
+const ATTR = arguments[0];
+const writes = arguments[1];
+const results = [];
+
+for (const write of writes) {
+    const el = document.querySelector(`[${ATTR}="${write.id}"]`);
+    if (!el) { results.push(false); continue; }
+
+    if (write.action === 'click') {
+        const label = el.id && document.querySelector(`label[for="${CSS.escape(el.id)}"]`);
+        (label || el).click();
+    } else if (write.action === 'select') {
+        const option = Array.from(el.options).find((o) => o.text.trim() === write.value);
+        if (!option) { results.push(false); continue; }
+        const setter = Object.getOwnPropertyDescriptor(HTMLSelectElement.prototype, 'value').set;
+        setter.call(el, option.value);
+        el.dispatchEvent(new Event('change', {bubbles: true}));
+    } else if (write.action === 'type') {
+        const proto = el.tagName === 'TEXTAREA'
+            ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+        Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, write.value);
+        el.dispatchEvent(new Event('input', {bubbles: true}));
+        el.dispatchEvent(new Event('change', {bubbles: true}));
+        el.dispatchEvent(new Event('blur'));
+    }
+    results.push(true);
+}
+return results;
+"""
+
+
+def snapshot_form(driver):
+    """Return the current form step as ``{"fields": [...], "resumeSelected": bool}``."""
+    return driver.execute_script(SNAPSHOT_SCRIPT, FIELD_ATTRIBUTE)
+
+
+def clean_question_text(question_text):
+    """Drop the repeated label and "Required" marker LinkedIn adds to a question."""
+    return question_text.split("\n")[0].replace("Required", "").strip()
+
+
+def _answerable_fields(snapshot):
+    """Yield the snapshot fields that still need an answer."""
+    for field in snapshot["fields"]:
+        question_text = field["question"]
+        kind = field["kind"]
+
+        if not question_text or "Search" in question_text:
+            continue
+
+        if "resume" in question_text.lower() and (
+            kind in ("text", "file") or snapshot["resumeSelected"]
+        ):
+            print(f"Skipping resume-related field: {question_text}")
+            continue
+
+        # The only uploads filled in are cover letters.
+        if kind == "file" and not is_cover_letter_question(question_text):
+            continue
+
+        if kind in ("text", "select") and field["value"]:
+            if field["value"].lower() != "select an option":
+                print(
+                    f"Skipping {question_text}, already filled with value: {field['value']}"
+                )
+                continue
+
+        yield field
+
+
+def field_options(field):
+    """Return the answers a field accepts; empty for free text."""
+    if field["kind"] == "radio":
+        return [option["label"] for option in field["options"]]
+    if field["kind"] == "select":
+        return [
+            option
+            for option in field["options"]
+            if option and option.lower() != "select an option"
+        ]
+    if field["kind"] == "checkbox":
+        return ["Yes", "No"]
+    return []
+
+
+def _answer_fits_field(field, answer):
+    options = field_options(field)
+    return not options or answer.lower() in (option.lower() for option in options)
+
+
+def plan_form_writes(
+    snapshot, answer_index, ask, resolve_unknowns=None, cover_letter=None
+):
+    """Decide every write for a snapshot in memory.
+
+    ``resolve_unknowns(items)``, if given, is called once with every question
+    the index can't answer, as ``{"question": str, "options": [str]}`` dicts,
+    and returns ``{question: answer}``. Whatever is still unanswered after
+    that goes to ``ask(question_text, field)``, which should return the answer
+    or an empty value. Both get the cleaned question text, which is also the
+    key of the new answers; the raw label is only used for lookups.
+    Cover-letter text boxes get the letter from ``cover_letter()``, if given,
+    instead, and uploads get its PDF or DOCX copy. Returns the list of writes
+    for ``apply_form_writes`` and a dict of newly supplied answers.
+    """
+    writes = []
+    new_answers = {}
+    fields = []
+    for field in _answerable_fields(snapshot):
+        if field["kind"] == "file" or (
+            cover_letter and is_cover_letter_question(field["question"])
+        ):
+            write = _plan_cover_letter_write(
+                field, cover_letter() if cover_letter else None
+            )
+            if write:
+                writes.append(write)
+        else:
+            fields.append(field)
+
+    if resolve_unknowns:
+        unknown = {}
+        for field in fields:
+            if answer_index.lookup(field["question"])[0] is None:
+                question_text = clean_question_text(field["question"])
+                unknown.setdefault(
+                    question_text,
+                    {"question": question_text, "options": field_options(field)},
+                )
+
+        if unknown:
+            try:
+                resolved = resolve_unknowns(list(unknown.values()))
+            except Exception as e:
+                print(f"Error generating answers for unknown questions: {e}")
+                resolved = {}
+
+            for field in fields:
+                question_text = clean_question_text(field["question"])
+                answer = resolved.get(question_text)
+                if answer and _answer_fits_field(field, answer):
+                    if answer_index.add(question_text, answer):
+                        new_answers[question_text] = answer
+                        print(f"AI-generated answer for: {question_text}")
+
+    for field in fields:
+        question_text = clean_question_text(field["question"])
+
+        answer = answer_index.get(field["question"])
+        if not answer:
+            answer = ask(question_text, field)
+            if not answer:
+                print(f"No answer for '{question_text}', leaving it empty.")
+                continue
+            if answer_index.add(question_text, answer):
+                new_answers[question_text] = answer
+
+        write = _plan_field_write(field, str(answer))
+        if write:
+            writes.append(write)
+
+    return writes, new_answers
+
+
+def _plan_cover_letter_write(field, path):
+    question_text = field["question"]
+    if not path:
+        print(f"No cover letter ready for: {question_text}")
+        return None
+    if field["kind"] == "file":
+        upload = uploadable_cover_letter(path)
+        if not upload:
+            print(f"No PDF or DOCX copy of {path}, skipping: {question_text}")
+            return None
+        return {
+            "id": field["id"],
+            "action": "keys",
+            "value": os.path.abspath(upload),
+            "question": question_text,
+        }
+    if field["kind"] == "text":
+        with open(path, "r", encoding="utf-8") as file:
+            cover_letter = file.read().strip()
+        return {
+            "id": field["id"],
+            "action": "type",
+            "value": cover_letter,
+            "question": question_text,
+        }
+    return None
+
+
+def _plan_field_write(field, answer):
+    question_text = field["question"]
+
+    if field["kind"] == "radio":
+        for option in field["options"]:
+            if option["label"].lower() == answer.lower():
+                if option["checked"]:
+                    return None
+                return {"id": option["id"], "action": "click", "question": question_text}
+        print(f"No option matching '{answer}' for: {question_text}")
+        return None
+
+    if field["kind"] == "select":
+        for option in field["options"]:
+            if option.lower() == answer.lower():
+                return {
+                    "id": field["id"],
+                    "action": "select",
+                    "value": option,
+                    "question": question_text,
+                }
+        print(f"No option matching '{answer}' for: {question_text}")
+        return None
+
+    if field["kind"] == "checkbox":
+        wanted = answer.lower() == "yes"
+        if answer.lower() in ("yes", "no") and wanted != field["value"]:
+            return {"id": field["id"], "action": "click", "question": question_text}
+        return None
+
+    return {
+        "id": field["id"],
+        "action": "keys" if field.get("typeahead") else "type",
+        "value": answer,
+        "question": question_text,
+    }
+
+
+def apply_form_writes(driver, writes):
+    """Push planned writes to the page; returns the questions that failed."""
+    batched = [write for write in writes if write["action"] != "keys"]
+    failed = []
+
+    if batched:
+        results = driver.execute_script(APPLY_SCRIPT, FIELD_ATTRIBUTE, batched)
+        failed.extend(
+            write["question"] for write, ok in zip(batched, results) if not ok
+        )
+
+    # Typeahead inputs only react to real key events, and file inputs only
+    # take a path through them.
+    for write in writes:
+        if write["action"] != "keys":
+            continue
+        try:
+            driver.find_element(
+                By.CSS_SELECTOR, f'[{FIELD_ATTRIBUTE}="{write["id"]}"]'
+            ).send_keys(write["value"])
+        except Exception as e:
+            print(f"Error typing answer for '{write['question']}': {e}")
+            failed.append(write["question"])
+
+    for write in writes:
+        if write["question"] not in failed:
+            print(f"Filled answer for: {write['question']}")
+
+    return failed
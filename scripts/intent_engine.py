@@ -0,0 +1,372 @@
+import re
+
+from scripts.answer_index import normalize_question
+from scripts.metrics import increment
+
+# Confidence of an answer backed by one unambiguous pattern match.
+STRONG = 0.95
+# Confidence of an intent seen only through its trigger words.
+WEAK = 0.5
+# Scaled by the strength of every other detected intent that disagrees with
+# the answer, and taken off once for "if not, ..." follow-up questions.
+CONFLICT_PENALTY = 0.3
+MIN_CONFIDENCE = 0.75
+
+US = r"(?:u s(?: a)?|usa|us|united states|america)"
+
+# Questions that ask for a value or an explanation, not a yes/no.
+OPEN_QUESTION = re.compile(
+    r"^(?:what|which|why|where|when|who|please|list|describe|explain|tell|"
+    r"provide|share|enter|mention)\b"
+)
+CONDITIONAL = re.compile(r"\bif (?:not|no|so|yes)\b")
+NUMERIC_QUESTION = re.compile(r"\bhow many\b|\bnumber of years\b")
+REQUIRED_YEARS = re.compile(
+    r"\b(\d{1,2})(?: (?:to |or )?\d{1,2})? (?:plus |or more )?years?\b"
+)
+# The technology is named after "experience" ("... experience do you have
+# with Flask"), between "years" and "experience" ("years of AWS experience")
+# or after "years" ("years with Node").
+BEFORE_EXPERIENCE = re.compile(r"\byears? (?:of )?(.+?) experience\b")
+AFTER_YEARS = re.compile(r"\byears?\b(.*)$")
+TECHNOLOGY_LEAD = re.compile(
+    r"^(?:(?:do you (?:currently )?have|have you(?: been)?|you have|do have|"
+    r"worked|working|of|with|in|using|as an?|as)\b ?)+"
+)
+TECHNOLOGY_TAIL = re.compile(r" (?:do you (?:currently )?have|have you|you have)\b.*$")
+# Words around the technologies of a list or a role ("Python, Java or C#",
+# "Python programming", "backend developer", "React.js").
+TECHNOLOGY_FILLER = frozenset(
+    (
+        "or and with in using as such like including etc a an the of "
+        "programming language languages development developer developing "
+        "engineer engineering professional advanced js"
+    ).split()
+)
+
+# intent: (trigger words, confirming patterns, excluding patterns)
+INTENTS = {
+    "sponsorship": (
+        (
+            "sponsor",
+            "sponsorship",
+            "sponsoring",
+            "visa",
+            "h1b",
+            "h 1b",
+            "opt",
+            "cpt",
+            "f1",
+            "immigration",
+        ),
+        (
+            r"\b(?:requir|need)\w*\b(?: \w+){0,8}? (?:\w+ )?sponsor",
+            r"\bsponsor\w*\b(?: \w+){0,8}? (?:now or in the future|in the future)\b",
+            r"\b(?:on|hold|holding) (?:an? )?(?:\w+ ){0,2}?"
+            r"(?:h ?1 ?b|f ?1|opt|cpt|tn)\b(?: \w+){0,3}? (?:visa|status)\b",
+            r"\bon (?:an? )?(?:h ?1 ?b|f ?1|opt|cpt|tn) ",
+            r"^(?:visa )?sponsorship$",
+        ),
+        (r"\bwithout\b",),
+    ),
+    "work_authorization": (
+        (
+            "authorized",
+            "authorised",
+            "authorization",
+            "eligible",
+            "legally",
+            "lawfully",
+            "right to work",
+            "without",
+        ),
+        (
+            r"\bauthori[sz]ed to (?:lawfully |legally )?work\b",
+            r"\b(?:legally|lawfully) (?:eligible|able|permitted) to work\b",
+            r"\beligible to (?:lawfully |legally )?work\b",
+            r"\bright to work\b",
+            r"\bwithout (?:\w+ ){0,4}?sponsorship\b",
+        ),
+        (),
+    ),
+    "citizenship": (
+        ("citizen", "citizens", "citizenship", "green card", "permanent resident"),
+        (
+            rf"\bcitizen\w*\b(?: \w+){{0,3}}? (?:of )?(?:the )?{US}\b",
+            rf"\b{US} (?:born )?citizen",
+            r"\bgreen card\b",
+            r"\bpermanent resident\b",
+        ),
+        (),
+    ),
+    "located_in_us": (
+        ("live", "living", "located", "based", "reside", "residing", "resident"),
+        (
+            r"\b(?:live|living|located|based|reside|residing|resident)\b"
+            rf"(?: \w+){{0,2}}? (?:in|of|out of|within) (?:the )?{US}$",
+            r"\b(?:live|living|located|based|reside|residing|resident)\b"
+            rf"(?: \w+){{0,2}}? (?:in|of|out of|within) (?:the )?{US} and\b",
+        ),
+        (),
+    ),
+    "relocation": (
+        ("relocate", "relocating", "relocation"),
+        (r"\breloca\w*",),
+        (),
+    ),
+    "commute": (("commute", "commuting"), (r"\bcommut\w*",), ()),
+    "work_setting": (
+        ("remote", "hybrid", "onsite", "on site", "in office", "in person"),
+        (
+            r"\b(?:comfortable|open|willing|ok|okay|able)\b(?: \w+){0,6}? "
+            r"(?:remote|hybrid|onsite|on site|in office|in person)\b",
+        ),
+        (),
+    ),
+    "age_18": (
+        ("18", "eighteen", "legal age"),
+        (
+            r"\b18\b(?: \w+){0,3}? (?:older|above|over|of age)\b",
+            r"\b(?:over|at least|above|older than) (?:the age of )?18\b",
+            r"\b18 years\b",
+            r"\blegal age\b",
+        ),
+        (),
+    ),
+    "english": (
+        ("english",),
+        (
+            r"\b(?:fluent|fluency|proficient|speak|read|write|communicate)\b"
+            r".*\benglish\b",
+        ),
+        (),
+    ),
+    "background_check": (
+        ("background", "drug"),
+        (r"\bbackground (?:check|screening|investigation)", r"\bdrug (?:test|screen)"),
+        (),
+    ),
+    "years_experience": (
+        ("year", "years"),
+        (r"\byears?\b.*\b(?:experience|worked|working|with|in)\b",),
+        (r"\b(?:last|past|within) \d+ years\b",),
+    ),
+}
+
+# Intents answered with Yes or No; they only apply to yes/no questions.
+YES_NO_INTENTS = frozenset(INTENTS) - {"years_experience"}
+
+_TRIGGERS = {}
+for _name, (_words, _, _) in INTENTS.items():
+    for _word in _words:
+        _TRIGGERS.setdefault(_word, []).append(_name)
+# One alternation over every trigger word, longest first, finds the
+# candidate intents in a single pass before any of their patterns are tried.
+TRIGGER = re.compile(
+    r"\b("
+    + "|".join(re.escape(word) for word in sorted(_TRIGGERS, key=len, reverse=True))
+    + r")\b"
+)
+PATTERNS = {
+    name: (
+        [re.compile(pattern) for pattern in patterns],
+        [re.compile(pattern) for pattern in excludes],
+    )
+    for name, (_, patterns, excludes) in INTENTS.items()
+}
+
+
+def yes_no(value):
+    return "Yes" if value else "No"
+
+
+def _technology_phrase(text):
+    text = TECHNOLOGY_LEAD.sub("", text.strip())
+    return TECHNOLOGY_TAIL.sub("", " " + text).strip()
+
+
+class IntentEngine:
+    """Answers the recurring screening questions from a small profile.
+
+    A question is mapped to one of ``INTENTS`` by its trigger words and
+    confirmed by the intent's patterns. ``years_experience`` also extracts
+    the technology and the required years. Only answers with a confidence of
+    at least ``min_confidence`` are returned; anything else is left to the
+    LLM or a prompt.
+    """
+
+    def __init__(self, profile=None, min_confidence=MIN_CONFIDENCE):
+        self.profile = profile or {}
+        self.min_confidence = min_confidence
+        self.years = {
+            normalize_question(technology): years
+            for technology, years in (
+                self.profile.get("years_of_experience") or {}
+            ).items()
+        }
+        self._technology = (
+            re.compile(
+                r"\b("
+                + "|".join(
+                    re.escape(technology)
+                    for technology in sorted(self.years, key=len, reverse=True)
+                )
+                + r")\b"
+            )
+            if self.years
+            else None
+        )
+        self._cache = {}
+
+    def __call__(self, question):
+        """``AnswerIndex`` engine: ``(answer, "intent:<name>", confidence)``."""
+        intent, answer, confidence, _ = self.classify(question)
+        if answer is None or confidence < self.min_confidence:
+            return None, None, confidence
+        increment("engine_answer", intent=intent)
+        return answer, f"intent:{intent}", confidence
+
+    def classify(self, question):
+        """Return ``(intent, answer, confidence, slots)`` for a question label.
+
+        ``intent`` and ``answer`` are None when nothing matched.
+        """
+        key = normalize_question(question)
+        if key not in self._cache:
+            self._cache[key] = self._classify(key)
+        return self._cache[key]
+
+    def _classify(self, key):
+        candidates = {}
+        for word in TRIGGER.findall(key):
+            for name in _TRIGGERS[word]:
+                candidates.setdefault(name, WEAK)
+        if not candidates:
+            return None, None, 0.0, {}
+
+        open_question = bool(OPEN_QUESTION.match(key))
+        for name in list(candidates):
+            patterns, excludes = PATTERNS[name]
+            if any(pattern.search(key) for pattern in excludes):
+                del candidates[name]
+            elif name in YES_NO_INTENTS and open_question:
+                continue
+            elif any(pattern.search(key) for pattern in patterns):
+                candidates[name] = STRONG
+        if not candidates:
+            return None, None, 0.0, {}
+
+        # Ties go to the intent listed first in INTENTS.
+        intent = max(INTENTS, key=lambda name: candidates.get(name, 0.0))
+        answer, confidence, slots = self._answer(intent, key, open_question)
+        if answer is None:
+            return intent, None, confidence, slots
+        confidence = min(confidence, candidates[intent])
+
+        for name, strength in candidates.items():
+            if name != intent and self._answer(name, key, open_question)[0] != answer:
+                confidence -= CONFLICT_PENALTY * strength
+        if CONDITIONAL.search(key):
+            confidence -= CONFLICT_PENALTY
+        return intent, answer, round(max(confidence, 0.0), 2), slots
+
+    def _answer(self, intent, key, open_question):
+        """Return ``(answer, confidence, slots)`` for ``key`` read as ``intent``."""
+        profile = self.profile
+        if intent == "years_experience":
+            return self._answer_years(key, open_question)
+        if intent == "citizenship":
+            offers_green_card = re.search(r"green card|permanent resident|gc", key)
+            needed = {"us_citizen"} if "citizen" in key else set()
+            if offers_green_card or "citizen" not in key:
+                needed.add("permanent_resident")
+            if not needed <= profile.keys():
+                return None, 0.0, {}
+            permanent_resident = bool(profile.get("permanent_resident"))
+            if "citizen" in key:
+                value = profile["us_citizen"] or (
+                    offers_green_card and permanent_resident
+                )
+            else:
+                value = permanent_resident
+            return yes_no(value), STRONG, {}
+        if intent == "work_authorization":
+            needed = {"work_authorized"}
+            if "without" in key:
+                needed.add("requires_sponsorship")
+            if not needed <= profile.keys():
+                return None, 0.0, {}
+            value = profile["work_authorized"]
+            if "without" in key:
+                value = value and not profile["requires_sponsorship"]
+            return yes_no(value), STRONG, {}
+        if intent == "work_setting":
+            if "work_settings" not in profile:
+                return None, 0.0, {}
+            settings = profile["work_settings"] or []
+            asked = {
+                "remote" if "remote" in key else None,
+                "hybrid" if "hybrid" in key else None,
+                "onsite" if re.search(r"on ?site|in office|in person", key) else None,
+            } - {None}
+            return yes_no(asked <= set(settings)), STRONG, {"settings": sorted(asked)}
+
+        field = {
+            "sponsorship": "requires_sponsorship",
+            "located_in_us": "located_in_us",
+            "relocation": "willing_to_relocate",
+            "commute": "willing_to_commute",
+            "age_18": "over_18",
+            "english": "english_fluent",
+            "background_check": "background_check",
+        }[intent]
+        if field not in profile:
+            return None, 0.0, {}
+        return yes_no(profile[field]), STRONG, {}
+
+    def _answer_years(self, key, open_question):
+        slots = {}
+        technology = _technology_phrase(key.partition(" experience")[2])
+        if not technology:
+            match = BEFORE_EXPERIENCE.search(key) or AFTER_YEARS.search(key)
+            technology = _technology_phrase(match.group(1)) if match else None
+        if technology:
+            slots["technology"] = technology
+        required = REQUIRED_YEARS.search(key)
+        if required:
+            slots["required_years"] = int(required.group(1))
+
+        known = []
+        if self._technology is not None:
+            known = self._technology.findall(technology or key)
+        if known:
+            # "Python, JavaScript or C#" counts the best of the listed skills.
+            years = max(self.years[name] for name in known)
+            # "AWS GovCloud" or "Teradata SQL" is not the AWS or SQL the
+            # profile has years for.
+            rest = self._technology.sub(" ", technology or "").split()
+            whole = not any(word not in TECHNOLOGY_FILLER for word in rest)
+            confidence = STRONG if whole else WEAK
+        else:
+            years = self.profile.get("default_years")
+            confidence = WEAK
+        if years is None:
+            return None, 0.0, slots
+        slots["years"] = years
+
+        if NUMERIC_QUESTION.search(key):
+            return str(years), confidence, slots
+        if open_question or "required_years" not in slots:
+            return None, 0.0, slots
+        return yes_no(years >= slots["required_years"]), confidence, slots
+
+
+def load_intent_engine(settings):
+    """Build the engine from the ``answer_engine`` settings, or None if disabled."""
+    engine_settings = (settings or {}).get("answer_engine") or {}
+    if not engine_settings.get("enabled", False):
+        return None
+    return IntentEngine(
+        engine_settings.get("profile"),
+        engine_settings.get("min_confidence", MIN_CONFIDENCE),
+    )
@@ -2,13 +2,17 @@ import os
 import time
 import yaml
 import logging
+import functools
+import threading
+from collections import Counter
+from itertools import count
 
 from dotenv import load_dotenv
-from webdriver_manager.chrome import ChromeDriverManager
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import Select
+from selenium.webdriver.remote.command import Command
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
@@ -19,20 +23,144 @@ from selenium.common.exceptions import (
     TimeoutException,
     StaleElementReferenceException,
     ElementNotInteractableException,
+    SessionNotCreatedException,
+    WebDriverException,
 )
 
 # ai automation not implemented yet
-from ai.ai_bot import generate_cover_letter, generate_answer_for_question
+from ai.ai_bot import (
+    generate_cover_letter,
+    generate_answer_for_question,
+    generate_answers_for_questions,
+)
+from scripts.answer_index import AnswerIndex
+from scripts.config_store import config_store
+from scripts.intent_engine import load_intent_engine
+from scripts.answer_journal import append_answers, load_journal, write_yaml_atomic
+from scripts.form_snapshot import (
+    snapshot_form,
+    plan_form_writes,
+    apply_form_writes,
+    clean_question_text,
+    field_options,
+)
+from scripts.waits import SCRIPT_TIMEOUT, wait_for, modal_step_signature, wait_report
+from scripts.job_cards import (
+    iter_job_cards,
+    find_job_card,
+    card_skip_reason,
+    report_triage,
+)
+from scripts.applied_ledger import (
+    AppliedJobsLedger,
+    SUBMITTED,
+    FAILED,
+    NO_EASY_APPLY,
+    PARKED,
+    DUPLICATE,
+)
+from scripts.cover_letters import (
+    WAIT_SECONDS,
+    CoverLetterWorker,
+    is_cover_letter_question,
+    uploadable_cover_letter,
+)
+from scripts.job_corpus import load_job_corpus
+from scripts.locators import find, find_first, locator_report, save_locator_stats
+from scripts.checkpoint import checkpoint_path, save_checkpoint, clear_checkpoint
+from scripts.pagination import (
+    MAX_FAILED_PAGES,
+    PAGE_SIZE,
+    build_search_url,
+    page_urls,
+    start_offset,
+)
+from scripts.question_queue import QuestionQueue, QuestionsDeferred
+from scripts.memory_watchdog import TAB, MemoryWatchdog
+from scripts.rate_limits import (
+    RunThrottled,
+    check_throttling,
+    configure_rate_limits,
+    wait_turn,
+)
+from scripts.metrics import span, timed, increment, export_prometheus, metrics_report
+from scripts.startup import (
+    chromedriver_path,
+    mark_first_card,
+    session_is_valid,
+    startup_phase,
+)
 
 load_dotenv("resources/.env")
 LINKEDIN_USERNAME = os.getenv("LINKEDIN_USERNAME")
 LINKEDIN_PASSWORD = os.getenv("LINKEDIN_PASSWORD")
 
 config_path = "resources/config.yaml"
+settings_path = "resources/settings.yaml"
+
+JOB_VIEW_URL = "https://www.linkedin.com/jobs/view/{job_id}/"
+
+# Read each form step with one script call instead of per-element lookups.
+USE_FORM_SNAPSHOT = True
+
+# Requests blocked in lean browser mode: media, fonts and tracking beacons
+# that form filling never needs.
+LEAN_BLOCKED_URLS = [
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+    "*.webp",
+    "*.ico",
+    "*.mp4",
+    "*.webm",
+    "*.woff",
+    "*.woff2",
+    "*.ttf",
+    "*media.licdn.com*",
+    "*static.licdn.com/aero-v1/sc/h/*.svg",
+    "*px.ads.linkedin.com*",
+    "*/li/track*",
+    "*/litms/*",
+    "*/sensorCollect*",
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*bat.bing.com*",
+    "*connect.facebook.net*",
+]
+
+# Ask the LLM, in one batch per step, for answers the config doesn't have
+# before falling back to a prompt.
+USE_AI_ANSWERS = bool(os.getenv("OPENAI_API_KEY"))
+
+
+def setup_driver(profile_dir=None, browser_settings=None):
+    """Start Chrome; ``browser_settings`` is the ``browser`` section of settings.yaml.
+
+    Lean mode runs headless, skips images, returns from navigations at
+    DOMContentLoaded and blocks LEAN_BLOCKED_URLS (plus any ``blocked_urls``)
+    through CDP. The chromedriver binary is ``driver_path`` if set, otherwise
+    the locally cached download for ``driver_version``.
+    """
+    browser_settings = browser_settings or {}
+    lean = browser_settings.get("lean", False)
+    chrome_options = Options()
 
+    if profile_dir:
+        chrome_options.add_argument(f"--user-data-dir={os.path.abspath(profile_dir)}")
 
-def setup_driver():
-    chrome_options = Options()
+    if browser_settings.get("headless", lean):
+        chrome_options.add_argument("--headless=new")
+        chrome_options.add_argument("--window-size=1920,1080")
+
+    if lean:
+        chrome_options.page_load_strategy = "eager"
+        chrome_options.add_experimental_option(
+            "prefs", {"profile.managed_default_content_settings.images": 2}
+        )
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_argument("--mute-audio")
 
     chrome_options.add_argument("--no-sandbox")
     chrome_options.add_argument("--disable-dev-shm-usage")
@@ -45,33 +173,93 @@ def setup_driver():
     chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
     chrome_options.add_experimental_option("useAutomationExtension", False)
 
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=chrome_options)
+    driver_version = browser_settings.get("driver_version")
+    with startup_phase("chromedriver lookup"):
+        driver_path = browser_settings.get("driver_path") or chromedriver_path(
+            driver_version
+        )
+
+    with startup_phase("browser launch"):
+        try:
+            driver = webdriver.Chrome(
+                service=Service(driver_path), options=chrome_options
+            )
+        except SessionNotCreatedException as e:
+            if browser_settings.get("driver_path"):
+                raise
+            # Chrome probably updated past the cached driver; fetch a matching one.
+            print(f"Cached chromedriver was rejected, fetching a new one: {e.msg}")
+            driver_path = chromedriver_path(driver_version, refresh=True)
+            driver = webdriver.Chrome(
+                service=Service(driver_path), options=chrome_options
+            )
+
+    # Kept so recycle_browser can start the same browser again.
+    driver.launch_options = chrome_options
+    prepare_session(driver, browser_settings)
+    return driver
+
 
+def prepare_session(driver, browser_settings=None):
+    """Per-session and per-tab setup, redone whenever the browser is recycled."""
+    browser_settings = browser_settings or {}
     driver.execute_script(
         "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
     )
+    driver.set_script_timeout(SCRIPT_TIMEOUT)
 
-    return driver
+    if browser_settings.get("lean", False):
+        blocked_urls = LEAN_BLOCKED_URLS + browser_settings.get("blocked_urls", [])
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked_urls})
+        print(f"Lean browser mode: blocking {len(blocked_urls)} URL patterns.")
+
+
+@timed("browser_recycle")
+def recycle_browser(driver, scope, url, browser_settings=None):
+    """Free the browser's memory at a safe point and reopen ``url``.
+
+    TAB opens ``url`` in a fresh tab and closes the old one. DRIVER ends the
+    browser and starts a new one in the same WebDriver object, so callers
+    keep their reference. Cookies are copied over, on top of what the
+    Chrome profile already keeps.
+    """
+    if scope == TAB:
+        old_handle = driver.current_window_handle
+        driver.switch_to.new_window("tab")
+        new_handle = driver.current_window_handle
+        driver.switch_to.window(old_handle)
+        driver.close()
+        driver.switch_to.window(new_handle)
+    else:
+        origin = "https://www.linkedin.com/"
+        cookies = driver.get_cookies()
+        driver.execute(Command.QUIT)
+        driver.start_session(driver.launch_options.to_capabilities())
+        driver.get(origin)
+        for cookie in cookies:
+            try:
+                driver.add_cookie(cookie)
+            except WebDriverException as e:
+                print(f"Could not restore cookie {cookie.get('name')}: {e.msg}")
+
+    prepare_session(driver, browser_settings)
+    wait_turn("navigation")
+    driver.get(url)
+    print(f"Recycled the browser {scope} and reopened {url}")
 
 
 def linkedin_login(driver, LINKEDIN_USERNAME, LINKEDIN_PASSWORD):
     driver.get("https://www.linkedin.com/login")
 
     try:
-        username_field = WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.ID, "username"))
-        )
+        username_field = find(driver, "login_username", timeout=10)
         print("Username field found!")
 
-        password_field = WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.ID, "password"))
-        )
+        password_field = find(driver, "login_password", timeout=10)
         print("Password field found!")
 
-        login_button = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, '//button[@type="submit"]'))
-        )
+        login_button = find(driver, "login_button", timeout=10, clickable=True)
         print("Login button found!")
 
         username_field.send_keys(LINKEDIN_USERNAME)
@@ -87,65 +275,459 @@ def linkedin_login(driver, LINKEDIN_USERNAME, LINKEDIN_PASSWORD):
         print(f"Login failed: {e}")
 
 
+def ensure_logged_in(driver, username, password):
+    """Reuse the profile's LinkedIn session if it's still valid, else log in.
+
+    Returns True when the saved session was reused.
+    """
+    with startup_phase("session check"):
+        valid = session_is_valid(driver)
+    if valid:
+        print("Saved LinkedIn session is still valid, skipping login.")
+        return True
+
+    with startup_phase("login"):
+        linkedin_login(driver, username, password)
+    return False
+
+
 def load_config():
+    """Load the config answers, merged with the answers journaled since."""
     try:
-        with open("resources/config.yaml", "r") as file:
-            config = yaml.safe_load(file)
+        config = dict(config_store(config_path).load().data)
         print("Config file loaded successfully.")
+
+        journaled_answers = load_journal()
+        if journaled_answers:
+            config.update(journaled_answers)
+            print(f"Merged {len(journaled_answers)} answers from the answer journal.")
+
         return config
     except Exception as e:
         print(f"Failed to load config file: {e}")
         raise
 
 
-def apply_to_jobs(driver, config):
+def load_settings():
+    """Load bot behaviour settings; a missing file means all defaults."""
     try:
-        while True:
-            print("Scrolling down to load job listings...")
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
+        with open(settings_path, "r") as file:
+            settings = yaml.safe_load(file) or {}
+        print("Settings file loaded successfully.")
+        return settings
+    except FileNotFoundError:
+        print(f"No settings file at {settings_path}, using defaults.")
+        return {}
+    except Exception as e:
+        print(f"Failed to load settings file: {e}")
+        raise
 
-            jobs = get_all_job_cards(driver)
 
-            for index, job in enumerate(jobs):
-                try:
-                    print(f"Clicking job card {index+1}")
-                    driver.execute_script("arguments[0].scrollIntoView(true);", job)
-                    WebDriverWait(driver, 3).until(
-                        EC.element_to_be_clickable(job)
-                    ).click()
-                    time.sleep(2)
+def start_rate_limits(settings=None):
+    """Apply the ``rate_limits`` settings, counting today's submissions so far."""
+    ledger = AppliedJobsLedger()
+    try:
+        recent = ledger.submitted_since(time.time() - 24 * 3600)
+    finally:
+        ledger.close()
+    scheduler = configure_rate_limits(settings, recent)
+    if scheduler.buckets["application"]:
+        print(f"Rate limits on; {recent} applications submitted in the past day.")
+    return scheduler
+
+
+def start_cover_letter_worker(settings=None):
+    """Start a background cover-letter writer if ``cover_letters.enabled``."""
+    letter_settings = (settings or {}).get("cover_letters") or {}
+    if not (USE_AI_ANSWERS and letter_settings.get("enabled", False)):
+        return None
+    return CoverLetterWorker(
+        generate_cover_letter,
+        wait_seconds=letter_settings.get("wait_seconds", WAIT_SECONDS),
+    )
 
-                    try:
-                        job_description = scrape_job_description(driver)
 
-                        easy_apply_button = WebDriverWait(driver, 5).until(
-                            EC.element_to_be_clickable(
-                                (By.CLASS_NAME, "jobs-apply-button")
-                            )
-                        )
-                        driver.execute_script(
-                            "arguments[0].click();", easy_apply_button
-                        )
-                        print("Easy Apply button clicked!")
+def reload_config_answers(answer_index):
+    """Add answers edited into config.yaml since it was loaded to ``answer_index``.
 
-                        fill_application_form(driver, config)
+    Lets answers typed into the YAML during a run count from the next
+    application on. Removed answers stay until the next run.
+    """
+    changes = config_store(config_path).changes()
+    added = sum(
+        answer_index.add(question, answer) for question, answer in changes.items()
+    )
+    if added:
+        print(f"Reloaded {added} answers edited in {config_path}.")
+    return added
+
+
+def build_answer_index(config, settings=None):
+    """Index the config answers, backed by the answer engine when it is enabled."""
+    engine = load_intent_engine(settings)
+    answer_index = AnswerIndex(config, engine=engine)
+    print(f"Indexed {len(answer_index)} answers from the config.")
+    if engine is not None:
+        print("Common screening questions are answered from the profile.")
+    return answer_index
+
+
+def apply_to_jobs(
+    driver,
+    config,
+    settings=None,
+    ledger=None,
+    resume=None,
+    answer_index=None,
+    checkpoint_file=checkpoint_path,
+    search=None,
+    start_page=None,
+    page_step=1,
+    question_queue=None,
+    cover_letters=None,
+    corpus=None,
+    stop=None,
+):
+    """Apply to every job of a search, opening its result pages by URL.
+
+    ``search`` is a search URL or spec (see build_search_url) and defaults to
+    the page open in ``driver``. Every ``page_step``-th page from
+    ``start_page`` is visited until one comes back empty, or until
+    ``pagination.max_failed_pages`` pages in a row fail to load.
+    Progress is checkpointed after each card; pass the loaded checkpoint as
+    ``resume`` to continue from it.
+    Workers sharing a ``ledger`` and ``answer_index`` never claim the same
+    job id. With ``questions.defer`` set, applications with unknown
+    questions are parked in ``question_queue`` instead of prompting.
+    Cover letters are written by ``cover_letters``, or by a worker of this
+    run's own when ``cover_letters.enabled`` is set.
+    With ``memory.enabled``, the tab or the whole browser is recycled
+    between applications once it uses too much memory or has done enough
+    applications.
+    Job descriptions are kept in ``corpus``, or in one opened from the
+    ``dedupe`` settings, and reposts of jobs already applied to are skipped.
+    Workers sharing a ``stop`` event end their run between cards once it is
+    set, and a run that LinkedIn throttles sets it for all of them.
+    Returns a Counter of application outcomes.
+    """
+    settings = settings or {}
+    outcomes = Counter()
+
+    if settings.get("questions", {}).get("defer", False):
+        question_queue = question_queue or QuestionQueue()
+        print(f"Deferring unknown questions; {len(question_queue)} jobs are parked.")
+    else:
+        question_queue = None
+
+    if answer_index is None:
+        answer_index = build_answer_index(config, settings)
+
+    own_cover_letters = cover_letters is None
+    if own_cover_letters:
+        cover_letters = start_cover_letter_worker(settings)
+
+    own_corpus = corpus is None
+    if own_corpus:
+        corpus = load_job_corpus(settings)
+
+    ledger = ledger or AppliedJobsLedger()
+    retry_failed = settings.get("ledger", {}).get("retry_failed", False)
+    watchdog = MemoryWatchdog(
+        settings.get("memory"), label=threading.current_thread().name
+    )
+    print(f"Ledger has {len(ledger)} previously processed jobs.")
+
+    if search is None:
+        search = driver.current_url
+    if start_page is None:
+        start_page = 0
+        if isinstance(search, str):
+            start_page = start_offset(search) // PAGE_SIZE
+    max_pages = settings.get("pagination", {}).get("max_pages")
+    max_failed_pages = settings.get("pagination", {}).get(
+        "max_failed_pages", MAX_FAILED_PAGES
+    )
 
-                    except Exception:
-                        print(
-                            f"No Easy Apply button found for job {index+1}. Skipping to next job."
-                        )
+    checkpoint = {
+        "search_url": build_search_url(search),
+        "start": start_page * PAGE_SIZE,
+        "card_index": 0,
+        "in_flight_job_id": None,
+    }
+    skip_cards = 0
+    if resume:
+        skip_cards = resume.get("card_index", 0)
+        print(f"Resuming at result offset {checkpoint['start']}, card {skip_cards+1}.")
+        if resume.get("in_flight_job_id"):
+            print(f"Job {resume['in_flight_job_id']} was in flight and will be retried.")
+
+    failed_pages = []
+    try:
+        for page, page_url in page_urls(search, start_page, page_step, max_pages):
+            check_stop(stop)
+            if not open_search_page(driver, page_url):
+                failed_pages.append(page)
+                if len(failed_pages) >= max_failed_pages:
+                    break
+                print(f"Skipping page {page+1}, it failed to load.")
+                continue
+            failed_pages = []
+            check_throttling(driver)
+
+            checkpoint.update(
+                start=page * PAGE_SIZE, card_index=skip_cards, in_flight_job_id=None
+            )
+            save_checkpoint(checkpoint, checkpoint_file)
+
+            triage_rules = settings.get("triage", {})
+            skipped = Counter()
+            index = -1
+
+            for index, card in enumerate(iter_job_cards(driver)):
+                mark_first_card()
+                check_stop(stop)
+                if index < skip_cards:
+                    continue
+
+                skip_reason = card_skip_reason(card, triage_rules)
+                if skip_reason:
+                    skipped[skip_reason] += 1
+                    increment("card_skipped", reason=skip_reason)
+                    continue
+
+                job_id = card["job_id"]
+
+                if not ledger.claim(job_id, retry_failed):
+                    status = ledger.outcome(job_id) or "claimed by another worker"
+                    print(f"Skipping job {job_id} ({status}).")
+                    continue
+
+                checkpoint.update(card_index=index, in_flight_job_id=job_id)
+                save_checkpoint(checkpoint, checkpoint_file)
+
+                try:
+                    print(
+                        f"Clicking job card {index+1}: {card['title']} at {card['company']}"
+                    )
+                    wait_turn("navigation")
+                    with span("card_click") as attrs:
+                        attrs["job_id"] = job_id
+                        click_job_card(driver, card)
+                        wait_for(driver, "job_details", job_id=job_id)
+
+                    reload_config_answers(answer_index)
+                    outcome = apply_to_open_job(
+                        driver,
+                        card,
+                        answer_index,
+                        ledger,
+                        question_queue,
+                        cover_letters,
+                        corpus,
+                    )
+                    outcomes[outcome] += 1
+                    checkpoint.update(card_index=index + 1, in_flight_job_id=None)
+                    save_checkpoint(checkpoint, checkpoint_file)
 
                 except Exception as e:
                     print(f"Error clicking job card {index+1}: {e}")
+                    ledger.release(job_id)
                     continue
 
-            if not click_next_page(driver):
+                check_throttling(driver)
+                recycle = watchdog.check(driver)
+                if recycle:
+                    scope, reason = recycle
+                    print(f"Recycling the browser {scope} after {reason}.")
+                    recycle_browser(driver, scope, page_url, settings.get("browser"))
+                    watchdog.recycled(scope, driver)
+
+            report_triage(skipped, index + 1, triage_rules)
+            if index < 0:
+                print(f"No job cards on page {page+1}, reached the end of the results.")
                 break
 
+            skip_cards = 0
+
+        if len(failed_pages) >= max_failed_pages:
+            checkpoint.update(
+                start=failed_pages[0] * PAGE_SIZE,
+                card_index=skip_cards,
+                in_flight_job_id=None,
+            )
+            save_checkpoint(checkpoint, checkpoint_file)
+            print(
+                f"Stopping the search, {len(failed_pages)} pages in a row failed "
+                "to load. The checkpoint is kept for --resume."
+            )
+        else:
+            clear_checkpoint(checkpoint_file)
+
+    except RunThrottled as e:
+        print(f"Stopping the run, {e}. The checkpoint is kept for --resume.")
+        if stop is not None:
+            stop.set()
     except Exception as e:
         print(f"Error while processing jobs: {e}")
 
+    if outcomes[PARKED]:
+        print(
+            f"Parked {outcomes[PARKED]} applications on unanswered questions. "
+            "Answer them with: python -m scripts.question_queue answer"
+        )
+
+    if own_cover_letters and cover_letters is not None:
+        cover_letters.close()
+
+    if corpus is not None:
+        corpus.report(outcomes[DUPLICATE])
+        if own_corpus:
+            corpus.close()
+
+    wait_report()
+    watchdog.report()
+    locator_report()
+    save_locator_stats()
+    metrics_report()
+    try:
+        export_prometheus()
+    except OSError as e:
+        print(f"Failed to export metrics: {e}")
+    return outcomes
+
+
+def apply_to_open_job(
+    driver,
+    job,
+    answer_index,
+    ledger,
+    question_queue=None,
+    cover_letters=None,
+    corpus=None,
+):
+    """Apply to the job shown in the details pane and record the outcome.
+
+    With a ``question_queue`` (defer mode), an application stuck on questions
+    nobody can answer now is discarded and parked in the queue. The job
+    description goes to ``cover_letters``, if given, as soon as it is
+    scraped, so the letter is written while the form is filled. A job whose
+    description nearly matches one already submitted to, per ``corpus``, is
+    recorded as a duplicate without opening Easy Apply. Returns the outcome.
+    """
+    job_id = job["job_id"]
+    cover_letter = None
+    try:
+        job_description = scrape_job_description(driver)
+        if corpus is not None and job_description:
+            duplicate = corpus.check_and_add(
+                job,
+                job_description,
+                accept=lambda other: ledger.outcome(other) == SUBMITTED,
+            )
+            if duplicate:
+                original, score = duplicate
+                reason = f"repost of {original} ({score:.0%} similar)"
+                print(f"Skipping job {job_id}, a {reason}.")
+                ledger.record(
+                    job_id, DUPLICATE, reason, job.get("company"), job.get("title")
+                )
+                increment("application", outcome=DUPLICATE)
+                return DUPLICATE
+
+        if cover_letters is not None and job_description:
+            cover_letters.submit(job, job_description)
+            cover_letter = functools.partial(cover_letters.wait, job)
+
+        with span("easy_apply_button"):
+            easy_apply_button = find(
+                driver, "easy_apply_button", timeout=5, clickable=True
+            )
+        wait_turn("application")
+        driver.execute_script("arguments[0].click();", easy_apply_button)
+        print("Easy Apply button clicked!")
+
+    except Exception:
+        print(f"No Easy Apply button found for job {job_id}. Skipping to next job.")
+        outcome, reason = NO_EASY_APPLY, None
+
+    else:
+        try:
+            outcome, reason = fill_application_form(
+                driver,
+                answer_index,
+                defer=question_queue is not None,
+                cover_letter=cover_letter,
+            )
+        except QuestionsDeferred as e:
+            print(f"Parking job {job_id}. {e}")
+            abandon_application(driver)
+            question_queue.park(job, e.questions)
+            outcome, reason = PARKED, str(e)
+
+    ledger.record(job_id, outcome, reason, job.get("company"), job.get("title"))
+    increment("application", outcome=outcome)
+    return outcome
+
+
+def apply_to_parked_jobs(driver, config, settings, question_queue, ledger=None):
+    """Re-attempt parked jobs whose queued questions now all have answers.
+
+    Jobs are opened by id. Submitted or otherwise finished jobs leave the
+    queue; a job that runs into new unknown questions is parked again.
+    Returns a Counter of outcomes.
+    """
+    settings = settings or {}
+    outcomes = Counter()
+    answer_index = build_answer_index(config, settings)
+    ledger = ledger or AppliedJobsLedger()
+    defer = settings.get("questions", {}).get("defer", False)
+    cover_letters = start_cover_letter_worker(settings)
+
+    for job_id, job in question_queue.parked_jobs():
+        unanswered = [
+            question for question in job["questions"] if not answer_index.get(question)
+        ]
+        if unanswered:
+            print(f"Job {job_id} still waits on {len(unanswered)} questions.")
+            continue
+        if not ledger.claim(job_id, retry_parked=True):
+            print(f"Skipping job {job_id} ({ledger.outcome(job_id)}).")
+            continue
+
+        print(f"Retrying parked job {job_id}: {job['title']} at {job['company']}")
+        try:
+            wait_turn("navigation")
+            driver.get(JOB_VIEW_URL.format(job_id=job_id))
+            wait_for(driver, "job_details")
+            reload_config_answers(answer_index)
+            outcome = apply_to_open_job(
+                driver,
+                dict(job, job_id=job_id),
+                answer_index,
+                ledger,
+                question_queue if defer else None,
+                cover_letters,
+            )
+        except Exception as e:
+            print(f"Error retrying job {job_id}: {e}")
+            ledger.release(job_id)
+            continue
+
+        outcomes[outcome] += 1
+        if outcome != PARKED:
+            question_queue.remove_job(job_id)
+
+        try:
+            check_throttling(driver)
+        except RunThrottled as e:
+            print(f"Stopping the retries, {e}.")
+            break
+
+    if cover_letters is not None:
+        cover_letters.close()
+    ledger.close()
+    return outcomes
+
 
 logging.basicConfig(
     filename="unanswered_questions.log",
@@ -153,93 +735,167 @@ logging.basicConfig(
     format="%(message)s",
 )
 
+_prompt_lock = threading.Lock()
+
+
+def ask_user(message):
+    """Prompt on the terminal, one worker at a time."""
+    with _prompt_lock, span("user_prompt"):
+        return input(message)
 
-def fill_application_form(driver, answers):
+
+def fill_application_form(driver, answer_index, defer=False, cover_letter=None):
+    """Walk the Easy Apply modal to submission; returns ``(outcome, reason)``.
+
+    With ``defer``, a step with unanswerable questions raises
+    QuestionsDeferred instead of prompting. ``cover_letter()`` returns the
+    path of the job's cover letter for cover-letter fields.
+    """
     try:
-        while True:
-            fill_form_fields(driver, answers)
+        for step_number in count(1):
+            with span("form_step") as attrs:
+                attrs["step"] = step_number
+                fill_form_fields(driver, answer_index, defer, cover_letter)
 
-            try:
-                next_button = WebDriverWait(driver, 5).until(
-                    EC.element_to_be_clickable(
-                        (
-                            By.XPATH,
-                            '//button[contains(@aria-label, "Continue to next step") or contains(@aria-label, "Next")]',
-                        )
+                # One wait for either button, so the last step doesn't first
+                # time out looking for a 'Next' that isn't there.
+                try:
+                    button_name, button = find_first(
+                        driver,
+                        ("next_button", "review_button"),
+                        timeout=10,
+                        clickable=True,
                     )
-                )
+                except TimeoutException:
+                    print("No 'Next', 'Review', or 'Submit' button found.")
+                    return FAILED, "No 'Next', 'Review', or 'Submit' button found."
+
+                if button_name == "next_button":
+                    step = modal_step_signature(driver)
+                    try:
+                        button.click()
+                        print("Clicked on 'Next' to proceed to the next form.")
+                    except ElementClickInterceptedException:
+                        print("Click intercepted, retrying without scrolling...")
+                        driver.execute_script("arguments[0].click();", button)
+
+                    if not wait_for(
+                        driver, "modal_step_changed", timeout=15, previous=step
+                    ):
+                        print("Form step did not change after 'Next'.")
+                        return FAILED, "Form step did not change after 'Next'."
+                    continue
+
+                driver.execute_script("arguments[0].scrollIntoView(true);", button)
+                step = modal_step_signature(driver)
                 try:
-                    next_button.click()
-                    print("Clicked on 'Next' to proceed to the next form.")
+                    button.click()
+                    print("Clicked on 'Review' button.")
                 except ElementClickInterceptedException:
                     print("Click intercepted, retrying without scrolling...")
-                    driver.execute_script("arguments[0].click();", next_button)
+                    driver.execute_script("arguments[0].click();", button)
 
-                time.sleep(2)
-                WebDriverWait(driver, 15).until(
-                    EC.presence_of_element_located(
-                        (By.XPATH, "//input | //select | //textarea")
-                    )
-                )
+                wait_for(driver, "modal_step_changed", timeout=10, previous=step)
 
-            except TimeoutException:
                 try:
-                    review_button = WebDriverWait(driver, 10).until(
-                        EC.element_to_be_clickable(
-                            (
-                                By.XPATH,
-                                '//button[contains(@aria-label, "Review your application") or contains(aria-label, "Review")]',
-                            )
-                        )
-                    )
-                    driver.execute_script(
-                        "arguments[0].scrollIntoView(true);", review_button
+                    handle_follow_checkbox(driver)
+                    submit_button = find(
+                        driver, "submit_button", timeout=15, clickable=True
                     )
                     try:
-                        review_button.click()
-                        print("Clicked on 'Review' button.")
+                        submit_button.click()
+                        print("Application submitted successfully.")
                     except ElementClickInterceptedException:
                         print("Click intercepted, retrying without scrolling...")
-                        driver.execute_script("arguments[0].click();", review_button)
+                        driver.execute_script("arguments[0].click();", submit_button)
 
-                    time.sleep(2)
-
-                    try:
-                        handle_follow_checkbox(driver)
-                        submit_button = WebDriverWait(driver, 15).until(
-                            EC.element_to_be_clickable(
-                                (
-                                    By.XPATH,
-                                    '//button[contains(@aria-label, "Submit application") or contains(aria-label, "Submit")]',
-                                )
-                            )
-                        )
-                        try:
-                            submit_button.click()
-                            print("Application submitted successfully.")
-                        except ElementClickInterceptedException:
-                            print("Click intercepted, retrying without scrolling...")
-                            driver.execute_script(
-                                "arguments[0].click();", submit_button
-                            )
-
-                        close_popup_if_present(driver)
-
-                        break
-                    except (NoSuchElementException, TimeoutException):
-                        print("No 'Submit' button found after the review step.")
-                        break
+                    close_popup_if_present(driver)
 
+                    return SUBMITTED, None
                 except (NoSuchElementException, TimeoutException):
-                    print("No 'Next', 'Review', or 'Submit' button found.")
-                    break
+                    print("No 'Submit' button found after the review step.")
+                    return FAILED, "No 'Submit' button found after the review step."
 
+    except QuestionsDeferred:
+        raise
     except Exception as e:
         print(f"Error while filling out the application form: {e}")
+        return FAILED, str(e)
+
+
+def fill_form_fields_from_snapshot(
+    driver, answer_index, defer=False, cover_letter=None
+):
+    """Fill the current step from a single DOM snapshot.
+
+    Returns False when the snapshot can't be taken or applied, so the caller
+    can fall back to the per-element path.
+    """
+    deferred = []
+    try:
+        with span("form_snapshot"):
+            snapshot = snapshot_form(driver)
+        if snapshot is None:
+            return False
+
+        def ask(question_text, field):
+            if defer:
+                deferred.append(
+                    {"question": question_text, "options": field_options(field)}
+                )
+                return ""
+            hint = " (Yes/No)" if field["kind"] in ("radio", "checkbox") else ""
+            return ask_user(f"Please provide an answer for '{question_text}'{hint}: ")
+
+        with span("form_plan"):
+            writes, new_answers = plan_form_writes(
+                snapshot,
+                answer_index,
+                ask,
+                resolve_unknowns=(
+                    generate_answers_for_questions if USE_AI_ANSWERS else None
+                ),
+                cover_letter=cover_letter,
+            )
+
+        if len(new_answers) > 0:
+            update_config_with_unanswered_questions(new_answers)
+
+        if deferred:
+            raise QuestionsDeferred(deferred)
 
+        if writes:
+            with span("form_apply") as attrs:
+                attrs["writes"] = len(writes)
+                failed = apply_form_writes(driver, writes)
+            for question_text in failed:
+                print(f"Error handling field '{question_text}'")
+
+        print("Application form filled out.")
+        return True
+
+    except QuestionsDeferred:
+        raise
+    except Exception as e:
+        print(f"Error filling out the form from a snapshot: {e}")
+        return False
+
+
+def fill_form_fields(driver, answer_index, defer=False, cover_letter=None):
+    if USE_FORM_SNAPSHOT and fill_form_fields_from_snapshot(
+        driver, answer_index, defer, cover_letter
+    ):
+        return
 
-def fill_form_fields(driver, config):
     new_answers = {}
+    deferred = []
+
+    def prompt_for(question_text, message):
+        """Ask the user, or in defer mode note the question and leave it empty."""
+        if defer:
+            deferred.append({"question": question_text, "options": []})
+            return ""
+        return ask_user(message)
 
     def get_label_question_text(label):
         """Extract question text from a label or fieldset, and clean it."""
@@ -266,14 +922,8 @@ def fill_form_fields(driver, config):
     def handle_resume_prefilled():
         """Skip resume selection if it's already prefilled."""
         try:
-            resume_section = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, "//h3[text()='Resume']"))
-            )
-
-            selected_resume = resume_section.find_element(
-                By.XPATH,
-                "//div[contains(@class, 'jobs-document-upload-redesign-card__container--selected')]",
-            )
+            find(driver, "resume_heading", timeout=10)
+            selected_resume = find(driver, "selected_resume")
             if selected_resume:
                 resume_name = selected_resume.find_element(
                     By.XPATH, ".//h3"
@@ -300,7 +950,12 @@ def fill_form_fields(driver, config):
             print(f"Error extracting question text from fieldset: {e}")
             return ""
 
-    def handle_radio_buttons(fieldset, question_text, config):
+    def remember_answer(question_text, answer):
+        """Make a typed answer available to later fields and persist it."""
+        if answer and answer_index.add(question_text, answer):
+            new_answers[question_text] = answer
+
+    def handle_radio_buttons(fieldset, question_text, answer_index):
         """Handle radio button inputs inside a fieldset."""
         try:
             question_text = get_question_text_from_fieldset(fieldset)
@@ -308,27 +963,18 @@ def fill_form_fields(driver, config):
             if not question_text:
                 return
 
-            cleaned_question_text = question_text.split("\n")[0].strip()
-            cleaned_question_text = cleaned_question_text.replace(
-                "Required", ""
-            ).strip()
-
-            normalized_question_text = cleaned_question_text.lower()
+            cleaned_question_text = clean_question_text(question_text)
 
             print(f"Cleaned question text: '{cleaned_question_text}'")
 
-            config_keys = {key.strip().lower(): key for key in config.keys()}
-
-            if normalized_question_text in config_keys:
-                answer = config[config_keys[normalized_question_text]]
-            else:
-                answer = None
+            answer = answer_index.get(question_text)
 
             if not answer:
-                answer = input(
-                    f"Please provide an answer for '{cleaned_question_text}' (Yes/No): "
+                answer = prompt_for(
+                    cleaned_question_text,
+                    f"Please provide an answer for '{cleaned_question_text}' (Yes/No): ",
                 )
-                new_answers[cleaned_question_text] = answer
+                remember_answer(cleaned_question_text, answer)
 
             radio_buttons = fieldset.find_elements(By.XPATH, ".//input[@type='radio']")
 
@@ -352,18 +998,20 @@ def fill_form_fields(driver, config):
         except Exception as e:
             print(f"Error handling radio buttons for question '{question_text}': {e}")
 
-    def handle_select_dropdown(input_element, question_text, config):
+    def handle_select_dropdown(input_element, question_text, answer_index):
         """Handle select dropdown inputs."""
         select = Select(input_element)
         current_selection = select.first_selected_option.text.strip()
 
         if current_selection == "Select an option":
-            answer = config.get(question_text)
+            answer = answer_index.get(question_text)
 
             if not answer:
-                answer = input(f"Please provide an answer for '{question_text}': ")
+                answer = prompt_for(
+                    question_text, f"Please provide an answer for '{question_text}': "
+                )
                 if answer:
-                    new_answers[question_text] = answer
+                    remember_answer(question_text, answer)
                     print(f"AI-generated answer for: {question_text}")
 
             try:
@@ -376,7 +1024,7 @@ def fill_form_fields(driver, config):
                 f"Skipping {question_text}, already filled with value: {current_selection}"
             )
 
-    def handle_text_input(input_element, question_text, config):
+    def handle_text_input(input_element, question_text, answer_index):
         """Handle text input and textarea fields."""
         if "resume" in question_text.lower():
             print(f"Skipping resume-related field: {question_text}")
@@ -388,26 +1036,51 @@ def fill_form_fields(driver, config):
                 f"Skipping {question_text}, already filled with value: {existing_value}"
             )
         else:
-            answer = config.get(question_text)
+            answer = answer_index.get(question_text)
 
             if not answer:
-                answer = input(f"Please provide an answer for '{question_text}': ")
+                answer = prompt_for(
+                    question_text, f"Please provide an answer for '{question_text}': "
+                )
                 if answer:
-                    new_answers[question_text] = answer
+                    remember_answer(question_text, answer)
                     print(f"AI-generated answer for: {question_text}")
 
             input_element.send_keys(answer)
             print(f"Filled answer for: {question_text}")
 
-    def handle_checkbox(input_element, question_text, config):
+    def handle_cover_letter(input_element, question_text):
+        """Upload or paste the job's cover letter, once it has been written."""
+        path = cover_letter() if cover_letter else None
+        if not path:
+            print(f"No cover letter ready for: {question_text}")
+            return
+
+        if input_element.get_attribute("type") == "file":
+            upload = uploadable_cover_letter(path)
+            if not upload:
+                print(f"No PDF or DOCX copy of {path}, skipping: {question_text}")
+                return
+            input_element.send_keys(os.path.abspath(upload))
+        elif input_element.get_attribute("value"):
+            print(f"Skipping {question_text}, it already has a cover letter.")
+            return
+        else:
+            with open(path, "r", encoding="utf-8") as file:
+                input_element.send_keys(file.read().strip())
+        print(f"Filled cover letter for: {question_text}")
+
+    def handle_checkbox(input_element, question_text, answer_index):
         """Handle checkbox inputs."""
         is_checked = input_element.is_selected()
-        answer = config.get(question_text)
+        answer = answer_index.get(question_text)
 
         if not answer:
-            answer = input(f"Please provide an answer for '{question_text}': ")
+            answer = prompt_for(
+                question_text, f"Please provide an answer for '{question_text}': "
+            )
             if answer:
-                new_answers[question_text] = answer
+                remember_answer(question_text, answer)
                 print(f"AI-generated answer for: {question_text}")
 
         if answer.lower() == "yes" and not is_checked:
@@ -434,22 +1107,30 @@ def fill_form_fields(driver, config):
             try:
                 try:
                     fieldset = label.find_element(By.XPATH, "./ancestor::fieldset")
-                    handle_radio_buttons(fieldset, question_text, config)
+                    with span("field", kind="radio"):
+                        handle_radio_buttons(fieldset, question_text, answer_index)
                     continue
                 except NoSuchElementException:
-                    input_element = label.find_element(
-                        By.XPATH,
-                        "./following-sibling::input | ./following-sibling::select | ./following-sibling::textarea | ./following-sibling::div//input | ./following-sibling::div//select | ./following-sibling::div//textarea",
-                    )
+                    input_element = find(label, "form_control")
 
                 input_type = input_element.get_attribute("type")
 
-                if input_type == "checkbox":
-                    handle_checkbox(input_element, question_text, config)
+                if is_cover_letter_question(question_text) and (
+                    cover_letter or input_type == "file"
+                ):
+                    with span("field", kind="cover_letter"):
+                        handle_cover_letter(input_element, question_text)
+                elif input_type == "checkbox":
+                    with span("field", kind="checkbox"):
+                        handle_checkbox(input_element, question_text, answer_index)
                 elif input_element.tag_name == "select":
-                    handle_select_dropdown(input_element, question_text, config)
+                    with span("field", kind="select"):
+                        handle_select_dropdown(
+                            input_element, question_text, answer_index
+                        )
                 elif input_element.tag_name in ["input", "textarea"]:
-                    handle_text_input(input_element, question_text, config)
+                    with span("field", kind="text"):
+                        handle_text_input(input_element, question_text, answer_index)
                 else:
                     print(f"Unknown field type for {question_text}, skipping.")
 
@@ -459,20 +1140,37 @@ def fill_form_fields(driver, config):
         print("Application form filled out.")
 
         if len(new_answers) > 0:
-            update_config_with_unanswered_questions(config_path, new_answers)
+            update_config_with_unanswered_questions(new_answers)
 
     except Exception as e:
         print(f"Error filling out the application form: {e}")
 
+    if deferred:
+        raise QuestionsDeferred(deferred)
+
 
+@timed("abandon_application")
+def abandon_application(driver):
+    """Close the Easy Apply modal and discard the draft application."""
+    try:
+        dismiss_button = find(driver, "modal_dismiss", timeout=5, clickable=True)
+        driver.execute_script("arguments[0].click();", dismiss_button)
+
+        discard_button = find(driver, "discard_button", timeout=5, clickable=True)
+        discard_button.click()
+        print("Discarded the application.")
+        return True
+
+    except Exception as e:
+        print(f"Could not discard the application: {e}")
+        return False
+
+
+@timed("close_popup")
 def close_popup_if_present(driver, retries=3):
     for attempt in range(retries):
         try:
-            close_button = WebDriverWait(driver, 5).until(
-                EC.presence_of_element_located(
-                    (By.XPATH, "//button[@aria-label='Dismiss']")
-                )
-            )
+            close_button = find(driver, "popup_dismiss", timeout=5)
 
             if close_button.is_displayed() and close_button.is_enabled():
                 try:
@@ -480,8 +1178,6 @@ def close_popup_if_present(driver, retries=3):
                         "arguments[0].scrollIntoView(true);", close_button
                     )
 
-                    time.sleep(1)
-
                     close_button.click()
                     print("Popup closed by clicking 'Dismiss'.")
                     return True
@@ -505,7 +1201,12 @@ def close_popup_if_present(driver, retries=3):
             return False
         except ElementNotInteractableException:
             print(f"Element not interactable on attempt {attempt+1}, retrying...")
-            time.sleep(2)
+            wait_for(
+                driver,
+                "element_visible",
+                timeout=2,
+                selector="button[aria-label='Dismiss']",
+            )
         except Exception as e:
             print(f"Unexpected error while handling the pop-up: {e}")
             return False
@@ -513,17 +1214,14 @@ def close_popup_if_present(driver, retries=3):
     return False
 
 
+@timed("follow_checkbox")
 def handle_follow_checkbox(driver):
     try:
-        label_element = WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located(
-                (By.XPATH, "//label[@for='follow-company-checkbox']")
-            )
-        )
+        label_element = find(driver, "follow_checkbox_label", timeout=15)
 
         driver.execute_script("arguments[0].scrollIntoView(true);", label_element)
 
-        checkbox_element = driver.find_element(By.ID, "follow-company-checkbox")
+        checkbox_element = find(driver, "follow_checkbox")
         if checkbox_element.is_selected():
             label_element.click()
             print("Unchecked the 'Follow' checkbox.")
@@ -538,11 +1236,10 @@ def handle_follow_checkbox(driver):
         print(f"Unexpected error while handling the 'Follow' checkbox: {e}")
 
 
+@timed("scrape_job_description")
 def scrape_job_description(driver):
     try:
-        job_description_element = WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.ID, "job-details"))
-        )
+        job_description_element = find(driver, "job_description", timeout=10)
         job_description = job_description_element.text.strip()
         return job_description
 
@@ -551,37 +1248,49 @@ def scrape_job_description(driver):
         return None
 
 
-def get_all_job_cards(driver):
-    try:
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located(
-                (By.XPATH, "//li[contains(@class, 'jobs-search-results__list-item')]")
+def click_job_card(driver, card):
+    """Click a job card, re-resolving it by job id if its element is gone.
+
+    The element goes stale when the list re-renders it, and is unknown to
+    the browser after the tab or the browser was recycled.
+    """
+    job = card["element"]
+    for attempt in range(2):
+        try:
+            driver.execute_script("arguments[0].scrollIntoView(true);", job)
+            WebDriverWait(driver, 3).until(EC.element_to_be_clickable(job)).click()
+            return
+        except WebDriverException as e:
+            if attempt:
+                raise
+            print(
+                f"Job card {card['job_id']} could not be clicked "
+                f"({type(e).__name__}), looking it up again."
             )
-        )
+            job = find_job_card(driver, card["job_id"])
 
-        job_cards = driver.find_elements(
-            By.XPATH, "//li[contains(@class, 'jobs-search-results__list-item')]"
-        )
 
-        return job_cards
-    except TimeoutException:
-        print("Timed out waiting for job cards to load.")
-        return []
+def check_stop(stop):
+    """Raise RunThrottled once another worker of the run set ``stop``."""
+    if stop is not None and stop.is_set():
+        raise RunThrottled("another worker was throttled")
 
 
-def click_next_page(driver):
-    try:
-        next_button = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable(
-                (By.XPATH, "//button[contains(@aria-label, 'View next page')]")
-            )
-        )
-        next_button.click()
-        print("Navigating to the next page...")
+@timed("open_search_page")
+def open_search_page(driver, page_url, retries=2):
+    """Open a result page directly by URL; False if it keeps failing to load."""
+    if driver.current_url == page_url:
         return True
-    except (NoSuchElementException, TimeoutException) as e:
-        print("No more pages to navigate or error finding 'Next' button:", e)
-        return False
+
+    for attempt in range(retries + 1):
+        try:
+            wait_turn("navigation")
+            driver.get(page_url)
+            print(f"Opened results page {page_url}")
+            return True
+        except WebDriverException as e:
+            print(f"Failed to open {page_url} on attempt {attempt+1}: {e}")
+    return False
 
 
 def update_yaml_with_env(yaml_file_path):
@@ -594,8 +1303,8 @@ def update_yaml_with_env(yaml_file_path):
     load_dotenv()
 
     try:
-        with open(yaml_file_path, "r") as yaml_file:
-            config_data = yaml.safe_load(yaml_file)
+        # Usually already loaded by load_config, so this doesn't parse again.
+        config_data = dict(config_store(yaml_file_path).load().data)
     except FileNotFoundError:
         print(f"YAML file {yaml_file_path} not found.")
         return
@@ -613,27 +1322,31 @@ def update_yaml_with_env(yaml_file_path):
         ),
     }
 
+    if all(config_data.get(key) == value for key, value in updated_data.items()):
+        print("YAML configuration already matches the environment.")
+        return
+
     config_data.update(updated_data)
 
     try:
-        with open(yaml_file_path, "w") as yaml_file:
-            yaml.dump(config_data, yaml_file)
+        write_yaml_atomic(yaml_file_path, config_data)
         print("YAML configuration updated successfully.")
     except Exception as exc:
         print(f"Failed to write updated data to YAML file: {exc}")
 
 
-def update_config_with_unanswered_questions(config_path, new_answers):
-    try:
-        with open(config_path, "r") as file:
-            config_data = yaml.safe_load(file)
-
-        config_data.update(new_answers)
+def update_config_with_unanswered_questions(new_answers):
+    """Log the questions the config couldn't answer and journal their answers.
 
-        with open(config_path, "w") as file:
-            yaml.safe_dump(config_data, file)
+    Journaled answers are folded into config.yaml by compact_journal.
+    """
+    for question in new_answers:
+        logging.info(question)
+    increment("unanswered_question", len(new_answers))
 
-        print("Config file successfully updated with new answers.")
+    try:
+        append_answers(new_answers)
+        print(f"Journaled {len(new_answers)} new answers.")
 
     except Exception as e:
-        print(f"Failed to update config file: {e}")
+        print(f"Failed to journal new answers: {e}")
@@ -0,0 +1,148 @@
+from selenium.webdriver.common.by import By
+
+from scripts.waits import wait_for
+
+# Rough cost of clicking a card that turns out to be unusable: the click,
+# the detail pane render and the Easy Apply button timeout.
+DEFAULT_SECONDS_PER_CLICK = 7
+
+CARD_SELECTOR = "li.jobs-search-results__list-item, li[data-occludable-job-id]"
+
+# One step of incremental discovery: report every hydrated card whose job id
+# hasn't been seen yet, then scroll the results list so LinkedIn renders the
+# next cards. The <li> element is returned too, so a card can be clicked
+# straight away without another lookup.
+DISCOVER_SCRIPT = """
+const seen = new Set(arguments[0]);
+const step = arguments[1];
+const text = (root, selector) => {
+    const el = root.querySelector(selector);
+    return el ? el.innerText.trim() : '';
+};
+const items = Array.from(document.querySelectorAll(arguments[2]));
+
+const cards = [];
+let placeholders = 0;
+for (const li of items) {
+    const idHolder = li.matches('[data-occludable-job-id]')
+        ? li : li.querySelector('[data-occludable-job-id], [data-job-id]');
+    const jobId = idHolder
+        ? (idHolder.getAttribute('data-occludable-job-id') || idHolder.getAttribute('data-job-id'))
+        : null;
+    const title = text(li, '.job-card-list__title, .job-card-container__link strong, a.job-card-container__link');
+    // Virtualized placeholders carry an id but no content until scrolled into view.
+    if (jobId && !title) { placeholders += 1; }
+    if (!jobId || !title || seen.has(jobId)) { continue; }
+
+    const footer = text(li, '.job-card-container__footer-wrapper, .job-card-list__footer-wrapper');
+    cards.push({
+        element: li,
+        job_id: jobId,
+        title: title,
+        company: text(li, '.job-card-container__primary-description, .artdeco-entity-lockup__subtitle'),
+        location: text(li, '.job-card-container__metadata-item, .artdeco-entity-lockup__caption'),
+        easy_apply: /Easy Apply/i.test(li.innerText),
+        applied: /\\bApplied\\b/.test(footer || li.innerText),
+    });
+}
+
+const container = (items[0] && items[0].closest(
+    '.jobs-search-results-list, .scaffold-layout__list, [class*="jobs-search-results"]'))
+    || document.scrollingElement;
+const before = container.scrollTop;
+container.scrollTop = before + step;
+
+return {
+    cards: cards,
+    placeholders: placeholders,
+    at_end: container.scrollTop === before,
+};
+"""
+
+# Pixels the results list is scrolled per discovery step.
+SCROLL_STEP = 600
+
+
+def iter_job_cards(driver, step=SCROLL_STEP, settle_timeout=2, max_idle_steps=3):
+    """Yield each job card of the open results page once, as soon as it hydrates.
+
+    The list is scrolled one step at a time, and cards are keyed by job id so
+    re-renders never produce duplicates. Iteration ends once the list stops
+    scrolling and no new cards have appeared for ``max_idle_steps`` steps.
+    """
+    if not wait_for(driver, "element_present", timeout=10, selector=CARD_SELECTOR):
+        print("Timed out waiting for job cards to load.")
+        return
+
+    seen = set()
+    idle_steps = 0
+    while idle_steps < max_idle_steps:
+        browser = _browser_key(driver)
+        result = driver.execute_script(DISCOVER_SCRIPT, list(seen), step, CARD_SELECTOR)
+
+        for card in result["cards"]:
+            if _browser_key(driver) != browser:
+                # The tab or browser was recycled, so the rest of the batch holds
+                # elements of the old page; discover them again on the new one.
+                break
+            seen.add(card["job_id"])
+            yield card
+
+        if result["cards"]:
+            idle_steps = 0
+        elif result["at_end"]:
+            idle_steps += 1
+
+        if not result["cards"] or result["placeholders"] > 0:
+            wait_for(driver, "job_cards_hydrated", timeout=settle_timeout)
+
+
+def _browser_key(driver):
+    """Changes when the tab or the whole browser session is replaced."""
+    return driver.session_id, driver.current_window_handle
+
+
+def find_job_card(driver, job_id):
+    """Re-resolve a card's element by job id after the list re-rendered it."""
+    return driver.find_element(
+        By.CSS_SELECTOR,
+        f'li[data-occludable-job-id="{job_id}"], li:has([data-job-id="{job_id}"])',
+    )
+
+
+def _contains_any(text, keywords):
+    text = (text or "").lower()
+    return any(keyword.lower() in text for keyword in keywords)
+
+
+def card_skip_reason(card, rules):
+    """Return why a card should not be clicked, or None to keep it."""
+    if rules.get("skip_applied", True) and card.get("applied"):
+        return "already applied"
+    if rules.get("require_easy_apply", True) and not card.get("easy_apply"):
+        return "no Easy Apply"
+
+    title_include = rules.get("title_include") or []
+    if title_include and not _contains_any(card["title"], title_include):
+        return "title not included"
+    if _contains_any(card["title"], rules.get("title_exclude") or []):
+        return "title excluded"
+    if _contains_any(card.get("company"), rules.get("company_exclude") or []):
+        return "company excluded"
+    if rules.get("remote_only") and "remote" not in (card.get("location") or "").lower():
+        return "not remote"
+
+    return None
+
+
+def report_triage(skipped, total, rules):
+    """Print how many cards triage dropped, why, and the clicks that saved."""
+    if not skipped:
+        return
+    seconds = rules.get("seconds_per_click", DEFAULT_SECONDS_PER_CLICK)
+    count = sum(skipped.values())
+    reasons = ", ".join(f"{number} {reason}" for reason, number in skipped.items())
+    print(
+        f"Triage skipped {count} of {total} job cards ({reasons}), "
+        f"saving about {count * seconds}s of clicks."
+    )
@@ -0,0 +1,264 @@
+import argparse
+import random
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from array import array
+from collections import defaultdict
+
+corpus_path = "resources/job_corpus.sqlite3"
+
+DEFAULT_THRESHOLD = 0.8
+NUM_PERMUTATIONS = 128
+SHINGLE_WORDS = 5
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_WORD = re.compile(r"[a-z0-9]+")
+
+# Fixed seed: signatures stored by earlier runs must stay comparable.
+_rng = random.Random(20240601)
+PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_PERMUTATIONS)
+]
+
+
+def shingles(text):
+    """Hashes of every run of SHINGLE_WORDS words, case and punctuation ignored."""
+    words = _WORD.findall(text.lower())
+    if len(words) < SHINGLE_WORDS:
+        return {zlib.crc32(" ".join(words).encode("utf-8"))} if words else set()
+    return {
+        zlib.crc32(" ".join(words[i : i + SHINGLE_WORDS]).encode("utf-8"))
+        for i in range(len(words) - SHINGLE_WORDS + 1)
+    }
+
+
+def minhash(text):
+    """MinHash signature of a description, NUM_PERMUTATIONS values long."""
+    hashes = shingles(text)
+    if not hashes:
+        return None
+    prime = _MERSENNE_PRIME
+    return array(
+        "Q", [min((a * x + b) % prime for x in hashes) for a, b in PERMUTATIONS]
+    )
+
+
+def similarity(left, right):
+    """Estimated Jaccard similarity of the shingle sets behind two signatures."""
+    return sum(x == y for x, y in zip(left, right)) / len(left)
+
+
+def lsh_bands(threshold):
+    """``(bands, rows)`` whose LSH curve catches pairs well below ``threshold``.
+
+    Candidates are verified against the signature afterwards, so erring on
+    the low side costs a few comparisons and misses fewer reposts.
+    """
+    options = [
+        (bands, NUM_PERMUTATIONS // bands)
+        for bands in range(1, NUM_PERMUTATIONS + 1)
+        if NUM_PERMUTATIONS % bands == 0
+    ]
+    below = [
+        (bands, rows)
+        for bands, rows in options
+        if (1 / bands) ** (1 / rows) <= threshold * 0.85
+    ]
+    return max(
+        below or options[-1:], key=lambda option: (1 / option[0]) ** (1 / option[1])
+    )
+
+
+class JobCorpus:
+    """Scraped job descriptions, zlib-compressed in SQLite, with a MinHash LSH index.
+
+    Each description's signature is split into bands; postings that share
+    a band are candidates, and a candidate whose estimated similarity is at
+    least ``threshold`` is a near-duplicate. The index is rebuilt from the
+    stored signatures when the corpus is opened.
+    """
+
+    def __init__(self, path=corpus_path, threshold=DEFAULT_THRESHOLD):
+        self.path = path
+        self.threshold = threshold
+        self.bands, self.rows = lsh_bands(threshold)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS descriptions (
+                job_id TEXT PRIMARY KEY,
+                company TEXT,
+                title TEXT,
+                description BLOB NOT NULL,
+                signature BLOB,
+                duplicate_of TEXT,
+                added_at REAL NOT NULL
+            )
+            """
+        )
+        self._signatures = {}
+        self._buckets = defaultdict(set)
+        self.lookups = 0
+        self.lookup_seconds = 0.0
+        for job_id, blob in self._conn.execute(
+            "SELECT job_id, signature FROM descriptions WHERE signature IS NOT NULL"
+        ):
+            signature = array("Q")
+            signature.frombytes(blob)
+            if len(signature) == NUM_PERMUTATIONS:
+                self._index(job_id, signature)
+
+    def __len__(self):
+        return len(self._signatures)
+
+    def _band_keys(self, signature):
+        rows = self.rows
+        return [
+            (band, hash(tuple(signature[band * rows : (band + 1) * rows])))
+            for band in range(self.bands)
+        ]
+
+    def _index(self, job_id, signature):
+        self._signatures[job_id] = signature
+        for key in self._band_keys(signature):
+            self._buckets[key].add(job_id)
+
+    def find_duplicate(self, description, accept=None, exclude=None, signature=None):
+        """Return ``(job_id, similarity)`` of the closest near-duplicate, or None.
+
+        ``accept(job_id)`` limits matches to some postings, e.g. the ones
+        already applied to; ``exclude`` is the job being checked.
+        """
+        start = time.perf_counter()
+        signature = signature or minhash(description)
+        best = None
+        if signature is not None:
+            with self._lock:
+                candidates = set()
+                for key in self._band_keys(signature):
+                    candidates |= self._buckets.get(key, set())
+                candidates.discard(exclude)
+                scored = [
+                    (similarity(signature, self._signatures[job_id]), job_id)
+                    for job_id in candidates
+                ]
+            for score, job_id in sorted(scored, reverse=True):
+                if score < self.threshold:
+                    break
+                if accept is None or accept(job_id):
+                    best = job_id, score
+                    break
+        self.lookups += 1
+        self.lookup_seconds += time.perf_counter() - start
+        return best
+
+    def add(self, job, description, duplicate_of=None, signature=None):
+        """Store a scraped description and index its signature."""
+        signature = signature or minhash(description)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO descriptions VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    job["job_id"],
+                    job.get("company"),
+                    job.get("title"),
+                    zlib.compress(description.encode("utf-8"), 9),
+                    signature.tobytes() if signature is not None else None,
+                    duplicate_of,
+                    time.time(),
+                ),
+            )
+            if signature is not None:
+                self._index(job["job_id"], signature)
+
+    def check_and_add(self, job, description, accept=None):
+        """Store ``job``'s description and return its near-duplicate, if any."""
+        signature = minhash(description)
+        duplicate = self.find_duplicate(
+            description, accept, exclude=job["job_id"], signature=signature
+        )
+        self.add(
+            job, description, duplicate[0] if duplicate else None, signature=signature
+        )
+        return duplicate
+
+    def description(self, job_id):
+        row = self._conn.execute(
+            "SELECT description FROM descriptions WHERE job_id = ?", (job_id,)
+        ).fetchone()
+        return zlib.decompress(row[0]).decode("utf-8") if row else None
+
+    def stats(self):
+        """``(descriptions, raw bytes, compressed bytes, duplicates)`` in the corpus."""
+        count, compressed, duplicates = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(LENGTH(description)), 0), "
+            "COUNT(duplicate_of) FROM descriptions"
+        ).fetchone()
+        raw = sum(
+            len(zlib.decompress(blob))
+            for (blob,) in self._conn.execute("SELECT description FROM descriptions")
+        )
+        return count, raw, compressed, duplicates
+
+    def reposts(self, limit=25):
+        """``(company, title, original company, original title)``, newest first."""
+        return self._conn.execute(
+            """
+            SELECT d.company, d.title, o.company, o.title
+            FROM descriptions d JOIN descriptions o ON o.job_id = d.duplicate_of
+            ORDER BY d.added_at DESC LIMIT ?
+            """,
+            (limit,),
+        ).fetchall()
+
+    def report(self, skipped=0):
+        """Print the applications skipped as reposts and how fast lookups were."""
+        if not self.lookups:
+            return
+        print(
+            f"Skipped {skipped} reposts of jobs already applied to; "
+            f"{len(self)} descriptions indexed, "
+            f"{self.lookup_seconds / self.lookups * 1000:.1f}ms per lookup."
+        )
+
+    def close(self):
+        self._conn.close()
+
+
+def load_job_corpus(settings):
+    """Open the corpus from the ``dedupe`` settings, or None if disabled."""
+    dedupe_settings = (settings or {}).get("dedupe") or {}
+    if not dedupe_settings.get("enabled", False):
+        return None
+    return JobCorpus(threshold=dedupe_settings.get("threshold", DEFAULT_THRESHOLD))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Inspect the job description corpus and its reposts."
+    )
+    parser.add_argument("--corpus", default=corpus_path, help="corpus database path")
+    parser.add_argument("--limit", type=int, default=25, help="reposts to list")
+    args = parser.parse_args()
+
+    corpus = JobCorpus(args.corpus)
+    count, raw, compressed, duplicates = corpus.stats()
+    print(
+        f"{count} descriptions, {raw / 1024:.0f} KB stored in "
+        f"{compressed / 1024:.0f} KB; {duplicates} were reposts."
+    )
+    for company, title, original_company, original_title in corpus.reposts(args.limit):
+        print(f"{company} - {title}  repost of  {original_company} - {original_title}")
+    corpus.close()
+
+
+if __name__ == "__main__":
+    main()
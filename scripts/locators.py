@@ -0,0 +1,324 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import Counter
+
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+
+from scripts.metrics import increment
+
+locator_stats_path = "resources/locator_stats.json"
+
+# Hits and misses are halved once an alternative has seen this many lookups,
+# so one that stopped matching after a UI change drops back within a few
+# applications instead of living off its old record.
+STATS_WINDOW = 50
+POLL_SECONDS = 0.2
+
+FORM_CONTROL = "self::input or self::select or self::textarea"
+
+# name: ordered (By, value) alternatives. CSS comes first where it can express
+# the same element, since browsers match it natively; the XPath the bot used
+# before is kept as the last fallback. Relative XPaths are searched from the
+# element passed to find().
+LOCATORS = {
+    "login_username": ((By.ID, "username"),),
+    "login_password": ((By.ID, "password"),),
+    "login_button": (
+        (By.CSS_SELECTOR, "button[type='submit']"),
+        (By.XPATH, '//button[@type="submit"]'),
+    ),
+    "easy_apply_button": (
+        (By.CSS_SELECTOR, "button.jobs-apply-button"),
+        (By.CLASS_NAME, "jobs-apply-button"),
+    ),
+    "job_description": (
+        (By.ID, "job-details"),
+        (By.CSS_SELECTOR, ".jobs-description-content__text"),
+    ),
+    "next_button": (
+        (By.CSS_SELECTOR, "button[aria-label='Continue to next step']"),
+        (By.CSS_SELECTOR, ".jobs-easy-apply-modal button[aria-label*='Next']"),
+        (
+            By.XPATH,
+            '//button[contains(@aria-label, "Continue to next step") '
+            'or contains(@aria-label, "Next")]',
+        ),
+    ),
+    "review_button": (
+        (By.CSS_SELECTOR, "button[aria-label='Review your application']"),
+        (By.CSS_SELECTOR, ".jobs-easy-apply-modal button[aria-label*='Review']"),
+        (
+            By.XPATH,
+            '//button[contains(@aria-label, "Review your application") '
+            'or contains(@aria-label, "Review")]',
+        ),
+    ),
+    "submit_button": (
+        (By.CSS_SELECTOR, "button[aria-label='Submit application']"),
+        (By.CSS_SELECTOR, ".jobs-easy-apply-modal button[aria-label*='Submit']"),
+        (
+            By.XPATH,
+            '//button[contains(@aria-label, "Submit application") '
+            'or contains(@aria-label, "Submit")]',
+        ),
+    ),
+    # The control a form label belongs to, searched from the label.
+    "form_control": (
+        (By.XPATH, f"./following-sibling::*[1][{FORM_CONTROL}]"),
+        (By.XPATH, f"./following-sibling::*[1][self::div]//*[{FORM_CONTROL}]"),
+        (
+            By.XPATH,
+            "./following-sibling::input | ./following-sibling::select | "
+            "./following-sibling::textarea | ./following-sibling::div//input | "
+            "./following-sibling::div//select | ./following-sibling::div//textarea",
+        ),
+    ),
+    "resume_heading": (
+        (By.XPATH, "//h3[text()='Resume']"),
+        (By.XPATH, "//h3[normalize-space()='Resume']"),
+    ),
+    "selected_resume": (
+        (By.CSS_SELECTOR, ".jobs-document-upload-redesign-card__container--selected"),
+        (
+            By.XPATH,
+            "//div[contains(@class, "
+            "'jobs-document-upload-redesign-card__container--selected')]",
+        ),
+    ),
+    "modal_dismiss": (
+        (By.CSS_SELECTOR, ".jobs-easy-apply-modal button[aria-label='Dismiss']"),
+        (
+            By.XPATH,
+            "//div[contains(@class, 'jobs-easy-apply-modal')]"
+            "//button[@aria-label='Dismiss']",
+        ),
+    ),
+    "discard_button": (
+        (
+            By.CSS_SELECTOR,
+            "button[data-control-name='discard_application_confirm_btn']",
+        ),
+        (By.XPATH, "//button[.//span[normalize-space()='Discard']]"),
+    ),
+    "popup_dismiss": (
+        (By.CSS_SELECTOR, "button[aria-label='Dismiss']"),
+        (By.XPATH, "//button[@aria-label='Dismiss']"),
+    ),
+    "follow_checkbox_label": (
+        (By.CSS_SELECTOR, "label[for='follow-company-checkbox']"),
+        (By.XPATH, "//label[@for='follow-company-checkbox']"),
+    ),
+    "follow_checkbox": ((By.ID, "follow-company-checkbox"),),
+}
+
+
+def _alternative_key(alternative):
+    by, value = alternative
+    return f"{by}={value}"
+
+
+def _probe(context, alternative, clickable):
+    """Return ``(element or None, seconds)`` for one alternative, without waiting."""
+    start = time.perf_counter()
+    try:
+        elements = context.find_elements(*alternative)
+        if clickable:
+            elements = [e for e in elements if e.is_displayed() and e.is_enabled()]
+        element = elements[0] if elements else None
+    except StaleElementReferenceException:
+        element = None
+    return element, time.perf_counter() - start
+
+
+class LocatorRegistry:
+    """Named locators whose alternatives are tried best first.
+
+    Every lookup tries all alternatives of a locator on each poll, so a
+    broken one costs a single ``find_elements`` call rather than a whole
+    timeout. The alternative that matches is credited with a hit and those
+    tried before it with a miss; alternatives are ranked by hit rate, then
+    by how long they take to evaluate. Stats are kept in ``path``.
+    """
+
+    def __init__(self, locators=LOCATORS, path=None):
+        self.locators = locators
+        self.path = path
+        self._stats = None
+        self._timeouts = Counter()
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self._stats is not None:
+            return
+        self.path = self.path or locator_stats_path
+        try:
+            with open(self.path, "r") as file:
+                self._stats = json.load(file)
+        except FileNotFoundError:
+            self._stats = {}
+        except (OSError, ValueError) as e:
+            print(f"Ignoring unreadable locator stats {self.path}: {e}")
+            self._stats = {}
+
+    def _alternative_stats(self, name, alternative):
+        return self._stats.setdefault(name, {}).setdefault(
+            _alternative_key(alternative),
+            {"hits": 0, "misses": 0, "seconds": 0.0, "calls": 0},
+        )
+
+    def ordered(self, name):
+        """The alternatives of ``name``, best first."""
+        alternatives = self.locators[name]
+        with self._lock:
+            self._load()
+            stats = self._stats.get(name) or {}
+
+            def rank(index):
+                record = stats.get(_alternative_key(alternatives[index]))
+                if not record:
+                    # Unseen alternatives start at even odds, in listed order.
+                    return (-0.5, 0.0, index)
+                hit_rate = (record["hits"] + 1) / (
+                    record["hits"] + record["misses"] + 2
+                )
+                latency = record["seconds"] / record["calls"] if record["calls"] else 0
+                # Between alternatives that work about as often, the faster wins.
+                return (-round(hit_rate, 1), latency, index)
+
+            return [alternatives[i] for i in sorted(range(len(alternatives)), key=rank)]
+
+    def _record(self, name, hit, tried):
+        with self._lock:
+            for alternative, seconds in tried:
+                record = self._alternative_stats(name, alternative)
+                if alternative == hit:
+                    record["hits"] += 1
+                else:
+                    record["misses"] += 1
+                record["seconds"] += seconds
+                record["calls"] += 1
+                if record["hits"] + record["misses"] > STATS_WINDOW:
+                    for field in record:
+                        record[field] /= 2
+
+    def _attempt(self, context, name, clickable):
+        alternatives = self.ordered(name)
+        tried = []
+        for alternative in alternatives:
+            element, seconds = _probe(context, alternative, clickable)
+            tried.append((alternative, seconds))
+            if element is not None:
+                self._record(name, alternative, tried)
+                outcome = "hit" if alternative == alternatives[0] else "fallback"
+                increment("locator", locator=name, outcome=outcome)
+                return element
+        return None
+
+    def find_first(self, context, names, timeout=0, clickable=False):
+        """Return ``(name, element)`` for the first of ``names`` that matches.
+
+        ``context`` is the driver or an element to search from. With a
+        ``timeout``, polls until one matches and raises TimeoutException
+        otherwise; without one, raises NoSuchElementException right away.
+        ``clickable`` only accepts displayed, enabled elements.
+        """
+
+        def attempt(context):
+            for name in names:
+                element = self._attempt(context, name, clickable)
+                if element is not None:
+                    return name, element
+            return False
+
+        if not timeout:
+            found = attempt(context)
+            if found:
+                return found
+            for name in names:
+                increment("locator", locator=name, outcome="miss")
+            raise NoSuchElementException(f"No match for {', '.join(names)}.")
+
+        try:
+            return WebDriverWait(
+                context,
+                timeout,
+                poll_frequency=POLL_SECONDS,
+                ignored_exceptions=(StaleElementReferenceException,),
+            ).until(attempt)
+        except TimeoutException:
+            with self._lock:
+                self._timeouts.update(names)
+            for name in names:
+                increment("locator", locator=name, outcome="timeout")
+            raise TimeoutException(f"No match for {', '.join(names)} in {timeout}s.")
+
+    def find(self, context, name, timeout=0, clickable=False):
+        """Return the element for locator ``name``; see find_first."""
+        return self.find_first(context, (name,), timeout, clickable)[1]
+
+    def save(self):
+        """Write the stats atomically so the next run starts with this ranking."""
+        with self._lock:
+            if self._stats is None:
+                return
+            data = json.dumps(self._stats, indent=2, sort_keys=True)
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=".json")
+        try:
+            with os.fdopen(fd, "w") as file:
+                file.write(data)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def report(self):
+        """Print every used locator's alternatives in their current order."""
+        with self._lock:
+            used = sorted(self._stats or {})
+        for name in used:
+            if name not in self.locators:
+                continue
+            timeouts = self._timeouts[name]
+            print(f"{name}:" + (f" {timeouts} timeouts" if timeouts else ""))
+            for alternative in self.ordered(name):
+                record = self._stats[name].get(_alternative_key(alternative))
+                if not record:
+                    continue
+                latency = record["seconds"] / record["calls"] if record["calls"] else 0
+                print(
+                    f"  {record['hits']:>6.0f} hits {record['misses']:>5.0f} misses "
+                    f"{latency * 1000:>6.1f}ms  {_alternative_key(alternative)}"
+                )
+
+
+_registry = LocatorRegistry()
+
+
+def find(context, name, timeout=0, clickable=False):
+    return _registry.find(context, name, timeout, clickable)
+
+
+def find_first(context, names, timeout=0, clickable=False):
+    return _registry.find_first(context, names, timeout, clickable)
+
+
+def save_locator_stats():
+    try:
+        _registry.save()
+    except OSError as e:
+        print(f"Failed to save locator stats: {e}")
+
+
+def locator_report():
+    _registry.report()
@@ -0,0 +1,176 @@
+import json
+import os
+import threading
+import time
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+from scripts.metrics import increment
+
+memory_path = "resources/metrics/memory.jsonl"
+
+TAB = "tab"
+DRIVER = "driver"
+
+MB = 2**20
+
+_write_lock = threading.Lock()
+
+
+def browser_rss(driver):
+    """Resident memory of every Chrome process under the driver's chromedriver.
+
+    Needs psutil; returns None without it.
+    """
+    if psutil is None:
+        return None
+    try:
+        service = psutil.Process(driver.service.process.pid)
+        processes = service.children(recursive=True)
+    except (AttributeError, psutil.Error):
+        return None
+    total = 0
+    for process in processes:
+        try:
+            total += process.memory_info().rss
+        except psutil.Error:
+            continue
+    return total
+
+
+def sample_memory(driver):
+    """The open tab's heap and DOM size from CDP, plus the browser's RSS."""
+    try:
+        driver.execute_cdp_cmd("Performance.enable", {})
+        response = driver.execute_cdp_cmd("Performance.getMetrics", {})
+        metrics = {metric["name"]: metric["value"] for metric in response["metrics"]}
+    except Exception as e:
+        print(f"Could not read browser memory metrics: {e}")
+        metrics = {}
+
+    rss = browser_rss(driver)
+    return {
+        "js_heap_used_mb": round(metrics.get("JSHeapUsedSize", 0) / MB, 1),
+        "js_heap_total_mb": round(metrics.get("JSHeapTotalSize", 0) / MB, 1),
+        "nodes": int(metrics.get("Nodes", 0)),
+        "documents": int(metrics.get("Documents", 0)),
+        "rss_mb": round(rss / MB, 1) if rss is not None else None,
+    }
+
+
+class MemoryWatchdog:
+    """Decides when a long-running browser should be recycled.
+
+    ``check`` runs between applications. It samples memory every
+    ``sample_every`` applications and asks for a TAB or DRIVER recycle when
+    the tab's JS heap or the browser's RSS crossed its limit, or after a set
+    number of applications. A tab recycle that doesn't bring the heap back
+    under its limit is followed by a driver restart. Every sample is
+    appended to ``memory_path``.
+    """
+
+    def __init__(self, settings=None, label=None):
+        settings = settings or {}
+        self.enabled = settings.get("enabled", False)
+        self.sample_every = max(1, settings.get("sample_every", 1))
+        self.max_js_heap_mb = settings.get("max_js_heap_mb")
+        self.max_rss_mb = settings.get("max_rss_mb")
+        self.recycle_tab_every = settings.get("recycle_tab_every")
+        self.restart_driver_every = settings.get("restart_driver_every")
+        self.label = label
+        self.applications = 0
+        self.since_tab = 0
+        self.since_driver = 0
+        self.samples = []
+        self.recycles = {TAB: 0, DRIVER: 0}
+        self._heap_after_tab_recycle = False
+
+    def check(self, driver):
+        """Count one application; return ``(TAB or DRIVER, reason)`` or None."""
+        if not self.enabled:
+            return None
+        self.applications += 1
+        self.since_tab += 1
+        self.since_driver += 1
+
+        sample = None
+        if self.applications % self.sample_every == 0:
+            sample = self._record(sample_memory(driver))
+
+        heap_high = bool(
+            sample
+            and self.max_js_heap_mb
+            and sample["js_heap_used_mb"] >= self.max_js_heap_mb
+        )
+        rss_high = bool(
+            sample
+            and self.max_rss_mb
+            and sample["rss_mb"] is not None
+            and sample["rss_mb"] >= self.max_rss_mb
+        )
+
+        if rss_high:
+            return DRIVER, f"browser RSS {sample['rss_mb']:.0f} MB"
+        if heap_high and self._heap_after_tab_recycle:
+            return DRIVER, f"JS heap still {sample['js_heap_used_mb']:.0f} MB"
+        restart_every = self.restart_driver_every
+        if restart_every and self.since_driver >= restart_every:
+            return DRIVER, f"{self.since_driver} applications"
+        if heap_high:
+            return TAB, f"JS heap {sample['js_heap_used_mb']:.0f} MB"
+        if self.recycle_tab_every and self.since_tab >= self.recycle_tab_every:
+            return TAB, f"{self.since_tab} applications"
+        if sample:
+            self._heap_after_tab_recycle = False
+        return None
+
+    def recycled(self, scope, driver=None):
+        """Note a finished recycle; samples the fresh session if given ``driver``."""
+        self.recycles[scope] += 1
+        self.since_tab = 0
+        if scope == DRIVER:
+            self.since_driver = 0
+        # The first sample after a tab recycle tells whether it helped.
+        self._heap_after_tab_recycle = scope == TAB
+        increment("browser_recycle", scope=scope)
+        if driver is not None:
+            self._record(sample_memory(driver), event=f"after_{scope}_recycle")
+
+    def _record(self, sample, event=None):
+        sample = dict(
+            sample, ts=time.time(), applications=self.applications, worker=self.label
+        )
+        if event:
+            sample["event"] = event
+        self.samples.append(sample)
+        try:
+            with _write_lock:
+                directory = os.path.dirname(os.path.abspath(memory_path))
+                os.makedirs(directory, exist_ok=True)
+                with open(memory_path, "a", encoding="utf-8") as file:
+                    file.write(json.dumps(sample) + "\n")
+        except OSError as e:
+            print(f"Failed to log memory sample: {e}")
+        return sample
+
+    def report(self):
+        """Print how memory developed over the run and how often it was recycled."""
+        if not self.samples:
+            return
+        first, last = self.samples[0], self.samples[-1]
+        peak = max(self.samples, key=lambda sample: sample["js_heap_used_mb"])
+        print(
+            f"Browser memory over {self.applications} applications: JS heap "
+            f"{first['js_heap_used_mb']:.0f} -> {last['js_heap_used_mb']:.0f} MB "
+            f"(peak {peak['js_heap_used_mb']:.0f} MB), DOM nodes "
+            f"{first['nodes']} -> {last['nodes']}"
+            + (
+                f", RSS {first['rss_mb']:.0f} -> {last['rss_mb']:.0f} MB"
+                if first["rss_mb"] is not None and last["rss_mb"] is not None
+                else ""
+            )
+            + f"; recycled {self.recycles[TAB]} tabs, {self.recycles[DRIVER]} drivers."
+        )
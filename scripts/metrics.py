@@ -0,0 +1,201 @@
+import contextvars
+import functools
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+spans_path = "resources/metrics/spans.jsonl"
+prometheus_path = "resources/metrics/jobbot.prom"
+
+QUANTILES = (0.5, 0.95)
+
+_lock = threading.Lock()
+_durations = defaultdict(list)
+_errors = defaultdict(int)
+_counters = defaultdict(float)
+_current_span = contextvars.ContextVar("current_span", default=None)
+_spans_file = None
+
+
+def _key(name, labels):
+    return (name, tuple(sorted((key, str(value)) for key, value in labels.items())))
+
+
+def _write_span(record):
+    global _spans_file
+    line = json.dumps(record, default=str) + "\n"
+    with _lock:
+        if _spans_file is None:
+            os.makedirs(os.path.dirname(os.path.abspath(spans_path)), exist_ok=True)
+            _spans_file = open(spans_path, "a", encoding="utf-8")
+        _spans_file.write(line)
+        _spans_file.flush()
+
+
+@contextmanager
+def span(name, **labels):
+    """Time a phase and record it as a span.
+
+    ``labels`` should have few distinct values (a field kind, a wait
+    condition) since each combination becomes its own Prometheus series.
+    Anything else, like a job id, goes into the yielded dict, which is only
+    written to the JSONL log. Spans nest, within a thread or an asyncio task.
+    """
+    attrs = {}
+    parent = _current_span.get()
+    token = _current_span.set(name)
+    started_at = time.time()
+    start = time.perf_counter()
+    status = "ok"
+    try:
+        yield attrs
+    except BaseException:
+        status = "error"
+        raise
+    finally:
+        duration = time.perf_counter() - start
+        _current_span.reset(token)
+        key = _key(name, labels)
+        with _lock:
+            _durations[key].append(duration)
+            if status == "error":
+                _errors[key] += 1
+        try:
+            _write_span(
+                {
+                    "span": name,
+                    "ts": started_at,
+                    "duration_ms": round(duration * 1000, 2),
+                    "status": status,
+                    "parent": parent,
+                    "thread": threading.current_thread().name,
+                    **labels,
+                    **attrs,
+                }
+            )
+        except OSError as e:
+            print(f"Could not write span '{name}': {e}")
+
+
+def timed(name, **labels):
+    """Decorator form of span() for whole functions."""
+
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with span(name, **labels):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def increment(name, value=1, **labels):
+    """Add to a counter, exported as ``jobbot_events_total{event=name}``."""
+    with _lock:
+        _counters[_key(name, labels)] += value
+
+
+def _quantile(sorted_values, q):
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+def _escape(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(pairs):
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in pairs) + "}"
+
+
+def span_summary():
+    """Return ``{(name, labels): {count, total, p50, p95, max, errors}}`` per span."""
+    with _lock:
+        snapshot = {key: sorted(values) for key, values in _durations.items()}
+        errors = dict(_errors)
+    return {
+        key: {
+            "count": len(values),
+            "total": sum(values),
+            **{f"p{round(q * 100)}": _quantile(values, q) for q in QUANTILES},
+            "max": values[-1],
+            "errors": errors.get(key, 0),
+        }
+        for key, values in snapshot.items()
+    }
+
+
+def export_prometheus(path=None):
+    """Write span latencies and counters in the node_exporter textfile format.
+
+    ``path`` defaults to ``prometheus_path``. The file is renamed into place
+    so the collector never reads half of it.
+    """
+    path = path or prometheus_path
+    summary = span_summary()
+    with _lock:
+        counters = dict(_counters)
+
+    lines = [
+        "# HELP jobbot_span_duration_seconds Time spent in each instrumented phase.",
+        "# TYPE jobbot_span_duration_seconds summary",
+    ]
+    for (name, labels), stats in sorted(summary.items()):
+        base = (("span", name),) + labels
+        for q in QUANTILES:
+            quantile = _labels(base + (("quantile", str(q)),))
+            value = stats[f"p{round(q * 100)}"]
+            lines.append(f"jobbot_span_duration_seconds{quantile} {value:.6f}")
+        lines.append(
+            f"jobbot_span_duration_seconds_sum{_labels(base)} {stats['total']:.6f}"
+        )
+        lines.append(
+            f"jobbot_span_duration_seconds_count{_labels(base)} {stats['count']}"
+        )
+
+    lines += [
+        "# HELP jobbot_span_errors_total Spans that ended with an exception.",
+        "# TYPE jobbot_span_errors_total counter",
+    ]
+    for (name, labels), stats in sorted(summary.items()):
+        series = _labels((("span", name),) + labels)
+        lines.append(f"jobbot_span_errors_total{series} {stats['errors']}")
+
+    lines += [
+        "# HELP jobbot_events_total Counted events such as application outcomes.",
+        "# TYPE jobbot_events_total counter",
+    ]
+    for (name, labels), value in sorted(counters.items()):
+        series = _labels((("event", name),) + labels)
+        lines.append(f"jobbot_events_total{series} {value:g}")
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=".prom")
+    try:
+        with os.fdopen(fd, "w") as file:
+            file.write("\n".join(lines) + "\n")
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def metrics_report(limit=15):
+    """Print the phases that took the most total time."""
+    summary = span_summary()
+    if not summary:
+        return
+    print(f"{'phase':<40} {'count':>6} {'total s':>8} {'p50 s':>7} {'p95 s':>7}")
+    ranked = sorted(summary.items(), key=lambda item: item[1]["total"], reverse=True)
+    for (name, labels), stats in ranked[:limit]:
+        label = name + "".join(f" {key}={value}" for key, value in labels)
+        print(
+            f"{label[:40]:<40} {stats['count']:>6} {stats['total']:>8.1f} "
+            f"{stats['p50']:>7.2f} {stats['p95']:>7.2f}"
+        )
@@ -0,0 +1,72 @@
+from itertools import count
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+SEARCH_URL = "https://www.linkedin.com/jobs/search/"
+
+# LinkedIn shows 25 results per search page and pages them with ``start=``.
+PAGE_SIZE = 25
+
+# A search stops once this many result pages in a row failed to load.
+MAX_FAILED_PAGES = 3
+
+# Search spec keys mapped to LinkedIn's query parameters.
+SPEC_PARAMETERS = {
+    "keywords": "keywords",
+    "location": "location",
+    "geo_id": "geoId",
+    "date_posted": "f_TPR",
+    "experience": "f_E",
+    "sort_by": "sortBy",
+}
+
+
+def with_start_offset(url, start):
+    """Return ``url`` with its ``start`` query parameter set to ``start``."""
+    parts = urlsplit(url)
+    query = [(key, value) for key, value in parse_qsl(parts.query) if key != "start"]
+    if start:
+        query.append(("start", str(start)))
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def start_offset(url):
+    """Return the ``start`` offset of a search URL (0 when absent)."""
+    for key, value in parse_qsl(urlsplit(url).query):
+        if key == "start" and value.isdigit():
+            return int(value)
+    return 0
+
+
+def build_search_url(spec):
+    """Turn a search spec into a first-page search URL.
+
+    A spec is either a search URL (copied from the browser) or a dict such as
+    ``{"keywords": "python", "location": "United States", "remote": True}``.
+    Easy Apply filtering is on unless ``easy_apply`` is false.
+    """
+    if isinstance(spec, str):
+        return with_start_offset(spec, 0)
+
+    query = [
+        (parameter, str(spec[key]))
+        for key, parameter in SPEC_PARAMETERS.items()
+        if spec.get(key) not in (None, "")
+    ]
+    if spec.get("easy_apply", True):
+        query.append(("f_AL", "true"))
+    if spec.get("remote"):
+        query.append(("f_WT", "2"))
+    return f"{SEARCH_URL}?{urlencode(query)}"
+
+
+def page_urls(spec, start_page=0, step=1, max_pages=None, page_size=PAGE_SIZE):
+    """Yield ``(page_number, url)`` for every ``step``-th result page of a search.
+
+    The generator is open-ended; callers stop once a page comes back empty.
+    Giving N workers ``start_page=i, step=N`` shards a search between them.
+    """
+    base_url = build_search_url(spec)
+    for page in count(start_page, step):
+        if max_pages is not None and page >= max_pages:
+            return
+        yield page, with_start_offset(base_url, page * page_size)
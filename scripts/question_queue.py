@@ -0,0 +1,192 @@
+import argparse
+import json
+import os
+import tempfile
+import threading
+import time
+
+from scripts.answer_journal import append_answers, compact_journal
+
+queue_path = "resources/deferred_questions.json"
+
+
+class QuestionsDeferred(Exception):
+    """Raised in defer mode when a form step has questions nobody can answer now."""
+
+    def __init__(self, questions):
+        self.questions = questions
+        super().__init__(
+            f"Deferred {len(questions)} unanswered questions: "
+            + "; ".join(item["question"] for item in questions)
+        )
+
+
+class QuestionQueue:
+    """Questions that parked applications are waiting on, and those applications.
+
+    Stored as one JSON document::
+
+        {"questions": {question: {"options": [...], "jobs": [job_id, ...]}},
+         "jobs": {job_id: {"title", "company", "questions", "parked_at"}}}
+
+    Every change is written atomically, so workers can share one queue.
+    """
+
+    def __init__(self, path=queue_path):
+        self.path = path
+        self._lock = threading.Lock()
+        try:
+            with open(path, "r") as file:
+                self._data = json.load(file)
+        except FileNotFoundError:
+            self._data = {"questions": {}, "jobs": {}}
+
+    def __len__(self):
+        return len(self._data["jobs"])
+
+    def _save(self):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=".json")
+        try:
+            with os.fdopen(fd, "w") as file:
+                json.dump(self._data, file, indent=2)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def park(self, job, questions):
+        """Queue ``questions`` (``{"question", "options"}`` dicts) for a parked job."""
+        with self._lock:
+            for item in questions:
+                entry = self._data["questions"].setdefault(
+                    item["question"], {"options": item.get("options") or [], "jobs": []}
+                )
+                if job["job_id"] not in entry["jobs"]:
+                    entry["jobs"].append(job["job_id"])
+
+            parked = self._data["jobs"].setdefault(job["job_id"], {"questions": []})
+            parked.update(
+                title=job.get("title"),
+                company=job.get("company"),
+                parked_at=time.time(),
+            )
+            for item in questions:
+                if item["question"] not in parked["questions"]:
+                    parked["questions"].append(item["question"])
+            self._save()
+
+    def pending_questions(self):
+        """Return ``[(question, options, job_count)]``, most-blocking first."""
+        return sorted(
+            (
+                (question, entry["options"], len(entry["jobs"]))
+                for question, entry in self._data["questions"].items()
+            ),
+            key=lambda row: (-row[2], row[0]),
+        )
+
+    def resolve(self, questions):
+        """Drop answered questions from the queue; parked jobs stay until retried."""
+        with self._lock:
+            for question in questions:
+                self._data["questions"].pop(question, None)
+            self._save()
+
+    def parked_jobs(self):
+        """Return ``[(job_id, job)]`` for every parked application, oldest first."""
+        return sorted(self._data["jobs"].items(), key=lambda item: item[1]["parked_at"])
+
+    def remove_job(self, job_id):
+        with self._lock:
+            self._data["jobs"].pop(job_id, None)
+            for question, entry in list(self._data["questions"].items()):
+                if job_id in entry["jobs"]:
+                    entry["jobs"].remove(job_id)
+                    if not entry["jobs"]:
+                        del self._data["questions"][question]
+            self._save()
+
+
+def answer_queued_questions(queue):
+    """Prompt once for every queued question and journal the answers."""
+    pending = queue.pending_questions()
+    if not pending:
+        print("No questions are waiting for an answer.")
+        return {}
+
+    print(f"{len(pending)} questions are holding up {len(queue)} applications.")
+    print("Press Enter to skip a question.")
+    answers = {}
+    for question, options, job_count in pending:
+        hint = f" ({'/'.join(options)})" if options else ""
+        answer = input(f"[{job_count} jobs] {question}{hint}: ").strip()
+        if answer:
+            answers[question] = answer
+
+    if answers:
+        append_answers(answers)
+        queue.resolve(answers)
+        print(f"Journaled {len(answers)} answers; they are used from the next run on.")
+    return answers
+
+
+def retry_parked_jobs(queue):
+    """Log in and re-attempt the parked jobs whose questions now have answers."""
+    # Imported here because the bot itself imports this module.
+    from scripts.job_application_bot import (
+        LINKEDIN_PASSWORD,
+        LINKEDIN_USERNAME,
+        apply_to_parked_jobs,
+        config_path,
+        ensure_logged_in,
+        load_config,
+        load_settings,
+        setup_driver,
+        start_rate_limits,
+    )
+    from scripts.startup import DEFAULT_PROFILE_DIR
+
+    config = load_config()
+    settings = load_settings()
+    start_rate_limits(settings)
+    browser_settings = settings.get("browser") or {}
+    driver = setup_driver(
+        profile_dir=browser_settings.get("profile_dir", DEFAULT_PROFILE_DIR),
+        browser_settings=browser_settings,
+    )
+    try:
+        ensure_logged_in(driver, LINKEDIN_USERNAME, LINKEDIN_PASSWORD)
+        outcomes = apply_to_parked_jobs(driver, config, settings, queue)
+        print(f"Retried parked jobs: {dict(outcomes)}")
+    finally:
+        driver.quit()
+        compact_journal(config_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Answer deferred application questions and retry parked jobs."
+    )
+    parser.add_argument(
+        "command",
+        choices=("list", "answer", "retry"),
+        help="list the queue, answer every queued question, or retry parked jobs",
+    )
+    parser.add_argument("--queue", default=queue_path, help="queue file path")
+    args = parser.parse_args()
+
+    queue = QuestionQueue(args.queue)
+    if args.command == "list":
+        print(f"{len(queue)} parked applications.")
+        for question, options, job_count in queue.pending_questions():
+            hint = f" ({'/'.join(options)})" if options else ""
+            print(f"{job_count:>4} jobs  {question}{hint}")
+    elif args.command == "answer":
+        answer_queued_questions(queue)
+    else:
+        retry_parked_jobs(queue)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,331 @@
+import asyncio
+import random
+import re
+import threading
+import time
+from itertools import count
+
+from scripts.metrics import increment, span
+
+# Actions a bucket lets through back to back before it starts spacing them.
+DEFAULT_BURST = 1
+# Backoff and cooldown defaults for settings.yaml's rate_limits section.
+BACKOFF_BASE_SECONDS = 2
+BACKOFF_MAX_SECONDS = 120
+MAX_RETRIES = 5
+THROTTLE_COOLDOWN_SECONDS = 600
+MAX_THROTTLE_COOLDOWN_SECONDS = 3600
+
+# Actions that LinkedIn's throttling pauses; LLM requests carry on.
+LINKEDIN_KINDS = ("application", "navigation")
+
+# LinkedIn pages that mean the session is at risk; the run stops on these.
+CHALLENGE_URL = re.compile(r"/checkpoint/|/authwall|/uas/login")
+# Messages LinkedIn shows when it wants fewer applications or requests.
+LIMIT_TEXT = re.compile(
+    r"reached (?:the|today.s|your|our) (?:daily |weekly )?(?:easy apply )?"
+    r"(?:application|submission)s? limit|limit daily submissions",
+    re.IGNORECASE,
+)
+SLOW_DOWN_TEXT = re.compile(
+    r"too many requests|made too many|unusual activity",
+    re.IGNORECASE,
+)
+
+# Text of dialogs, alerts and inline errors, plus the whole body of short
+# pages such as a bare 429 response. textContent avoids forcing a layout.
+THROTTLE_SCRIPT = """
+const parts = [document.title];
+document.querySelectorAll(
+    '[role="dialog"], [role="alert"], .artdeco-inline-feedback--error'
+).forEach((node) => parts.push(node.textContent));
+const body = document.body ? document.body.textContent : '';
+if (body.length < 3000) { parts.push(body); }
+return [location.href, parts.join(' ')];
+"""
+
+
+class SystemClock:
+    monotonic = staticmethod(time.monotonic)
+    sleep = staticmethod(time.sleep)
+
+    async def asleep(self, seconds):
+        await asyncio.sleep(seconds)
+
+
+class FakeClock:
+    """A clock that only moves when slept on, for exercising the scheduler."""
+
+    def __init__(self, now=0.0):
+        self.now = now
+        self.slept = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+    async def asleep(self, seconds):
+        self.sleep(seconds)
+        await asyncio.sleep(0)
+
+
+class RunThrottled(Exception):
+    """LinkedIn showed an application limit or a security checkpoint."""
+
+
+class TokenBucket:
+    """``rate`` tokens per second, holding at most ``capacity``.
+
+    ``reserve`` always takes a token and returns how long the caller has to
+    wait for it, so waiters queue up in order instead of racing.
+    """
+
+    def __init__(self, rate, capacity=DEFAULT_BURST, clock=None, tokens=None):
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock or SystemClock()
+        self.tokens = capacity if tokens is None else tokens
+        self.updated = self.clock.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens=1):
+        with self._lock:
+            now = self.clock.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            self.tokens -= tokens
+            return max(0.0, -self.tokens / self.rate)
+
+
+def _status_code(error):
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status
+
+
+def is_retryable(error):
+    """True for 429s, 5xx server errors, timeouts and lost connections."""
+    status = _status_code(error)
+    if status is not None:
+        return status == 429 or status >= 500
+    return type(error).__name__ in ("APIConnectionError", "APITimeoutError")
+
+
+def retry_after(error):
+    """Seconds the server asked us to wait, from a Retry-After header, or 0."""
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    try:
+        return float(headers.get("retry-after", 0))
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class Scheduler:
+    """Paces applications, page navigations and LLM requests.
+
+    Each kind of action draws from its token buckets before it runs, so a
+    long run stays at the configured ceilings instead of bursting into
+    LinkedIn's or OpenAI's limits. Kinds without a limit never wait. LLM
+    calls that hit a 429 or 5xx are retried with full-jitter exponential
+    backoff, and a LinkedIn "slow down" page pauses LinkedIn actions for a
+    cooldown that doubles each time it is seen again.
+    """
+
+    def __init__(self, limits=None, clock=None, rng=None, recent_applications=0):
+        limits = limits or {}
+        self.clock = clock or SystemClock()
+        self.rng = rng or random.Random()
+        burst = limits.get("burst", DEFAULT_BURST)
+        self.backoff_base = limits.get("backoff_base_seconds", BACKOFF_BASE_SECONDS)
+        self.backoff_max = limits.get("backoff_max_seconds", BACKOFF_MAX_SECONDS)
+        self.max_retries = limits.get("max_retries", MAX_RETRIES)
+        self.cooldown = limits.get(
+            "throttle_cooldown_seconds", THROTTLE_COOLDOWN_SECONDS
+        )
+        self.paused_until = 0.0
+        self._throttle_count = 0
+        self._lock = threading.Lock()
+
+        def per(limit, seconds):
+            return [TokenBucket(limit / seconds, burst, self.clock)] if limit else []
+
+        self.buckets = {
+            "application": per(limits.get("applications_per_hour"), 3600),
+            "navigation": per(limits.get("navigations_per_minute"), 60),
+            "llm": per(limits.get("llm_requests_per_minute"), 60),
+        }
+        per_day = limits.get("applications_per_day")
+        if per_day:
+            # The whole allowance may go at the hourly pace; applications
+            # submitted earlier in the day are already spent.
+            self.buckets["application"].append(
+                TokenBucket(
+                    per_day / 86400,
+                    per_day,
+                    self.clock,
+                    tokens=per_day - recent_applications,
+                )
+            )
+
+    def reserve(self, kind):
+        """Take a turn for ``kind``; returns the seconds to wait before acting."""
+        delay = max((bucket.reserve() for bucket in self.buckets[kind]), default=0.0)
+        if kind not in LINKEDIN_KINDS:
+            return delay
+        with self._lock:
+            pause = self.paused_until - self.clock.monotonic()
+        return max(delay, pause, 0.0)
+
+    def wait(self, kind):
+        delay = self.reserve(kind)
+        if delay > 0:
+            self._report_wait(kind, delay)
+            with span("rate_limit_wait", kind=kind):
+                self.clock.sleep(delay)
+        return delay
+
+    async def await_turn(self, kind):
+        delay = self.reserve(kind)
+        if delay > 0:
+            self._report_wait(kind, delay)
+            with span("rate_limit_wait", kind=kind):
+                await self.clock.asleep(delay)
+        return delay
+
+    def _report_wait(self, kind, delay):
+        increment("rate_limit_wait", kind=kind)
+        if delay >= 5:
+            print(f"Rate limit: waiting {delay:.0f}s before the next {kind}.")
+
+    def backoff_delay(self, attempt, error=None):
+        """Full-jitter exponential backoff, never shorter than a Retry-After."""
+        ceiling = min(self.backoff_max, self.backoff_base * 2**attempt)
+        delay = self.rng.uniform(0, ceiling)
+        if error is not None:
+            delay = max(delay, retry_after(error))
+        return delay
+
+    def _retry_delay(self, kind, attempt, error):
+        if not is_retryable(error) or attempt >= self.max_retries:
+            return None
+        delay = self.backoff_delay(attempt, error)
+        increment("backoff", kind=kind)
+        print(
+            f"{kind} request failed ({_status_code(error) or type(error).__name__}), "
+            f"retry {attempt + 1}/{self.max_retries} in {delay:.1f}s."
+        )
+        return delay
+
+    def call(self, kind, function, *args, **kwargs):
+        """Run ``function`` in turn, retrying rate limits and server errors."""
+        for attempt in count():
+            self.wait(kind)
+            try:
+                return function(*args, **kwargs)
+            except Exception as e:
+                delay = self._retry_delay(kind, attempt, e)
+                if delay is None:
+                    raise
+            self.clock.sleep(delay)
+
+    async def acall(self, kind, function, *args, **kwargs):
+        """``call`` for a coroutine function."""
+        for attempt in count():
+            await self.await_turn(kind)
+            try:
+                return await function(*args, **kwargs)
+            except Exception as e:
+                delay = self._retry_delay(kind, attempt, e)
+                if delay is None:
+                    raise
+            await self.clock.asleep(delay)
+
+    def throttled(self, reason):
+        """Pause LinkedIn actions after LinkedIn asked us to slow down."""
+        with self._lock:
+            self._throttle_count += 1
+            cooldown = min(
+                MAX_THROTTLE_COOLDOWN_SECONDS,
+                self.cooldown * 2 ** (self._throttle_count - 1),
+            )
+            cooldown *= self.rng.uniform(1.0, 1.25)
+            self.paused_until = max(
+                self.paused_until, self.clock.monotonic() + cooldown
+            )
+        increment("throttled", reason="slow_down")
+        print(f"LinkedIn is throttling ({reason}); pausing for {cooldown:.0f}s.")
+        return cooldown
+
+    def recovered(self):
+        """Reset the cooldown after an action went through normally."""
+        with self._lock:
+            self._throttle_count = 0
+
+
+def detect_throttling(driver):
+    """Return ``(signal, detail)`` when the page shows LinkedIn throttling, else None.
+
+    ``signal`` is "challenge" for a security checkpoint or login wall,
+    "limit" for an application limit and "slow_down" for a request limit.
+    """
+    try:
+        url, text = driver.execute_script(THROTTLE_SCRIPT)
+    except Exception as e:
+        print(f"Could not check the page for throttling: {e}")
+        return None
+    if CHALLENGE_URL.search(url or ""):
+        return "challenge", url
+    for signal, pattern in (("limit", LIMIT_TEXT), ("slow_down", SLOW_DOWN_TEXT)):
+        match = pattern.search(text or "")
+        if match:
+            return signal, match.group(0)
+    return None
+
+
+_scheduler = Scheduler()
+
+
+def configure_rate_limits(settings=None, recent_applications=0, clock=None):
+    """Apply the ``rate_limits`` settings to every later action of this process.
+
+    ``recent_applications`` submitted in the past day count against the
+    daily ceiling, so restarting the bot doesn't reset it.
+    """
+    global _scheduler
+    limits = (settings or {}).get("rate_limits") or {}
+    if not limits.get("enabled", False):
+        limits = {}
+    _scheduler = Scheduler(limits, clock, recent_applications=recent_applications)
+    return _scheduler
+
+
+def wait_turn(kind):
+    return _scheduler.wait(kind)
+
+
+def call_with_backoff(kind, function, *args, **kwargs):
+    return _scheduler.call(kind, function, *args, **kwargs)
+
+
+async def acall_with_backoff(kind, function, *args, **kwargs):
+    return await _scheduler.acall(kind, function, *args, **kwargs)
+
+
+def check_throttling(driver):
+    """Pause after a LinkedIn "slow down" page; raise RunThrottled on the others."""
+    signal = detect_throttling(driver)
+    if signal is None:
+        _scheduler.recovered()
+        return None
+    kind, detail = signal
+    if kind == "slow_down":
+        _scheduler.throttled(detail)
+        return signal
+    increment("throttled", reason=kind)
+    raise RunThrottled(f"LinkedIn {kind}: {detail}")
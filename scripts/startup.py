@@ -0,0 +1,101 @@
+import json
+import os
+import time
+from contextlib import contextmanager
+
+from webdriver_manager.chrome import ChromeDriverManager
+
+driver_cache_path = "resources/.driver_cache.json"
+
+DEFAULT_PROFILE_DIR = "resources/chrome_profiles/main"
+FEED_URL = "https://www.linkedin.com/feed/"
+# LinkedIn's authentication cookie; a session without it is logged out.
+SESSION_COOKIE = "li_at"
+
+LAUNCHED = time.perf_counter()
+STARTUP_PHASES = []
+_first_card_seen = False
+
+
+@contextmanager
+def startup_phase(name):
+    """Time one startup phase and print how long it took."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        STARTUP_PHASES.append((name, elapsed))
+        print(f"Startup: {name} took {elapsed:.2f}s.")
+
+
+def mark_first_card():
+    """Print the time from launch to the first job card, once per process."""
+    global _first_card_seen
+    if _first_card_seen:
+        return
+    _first_card_seen = True
+    phases = ", ".join(f"{name} {elapsed:.1f}s" for name, elapsed in STARTUP_PHASES)
+    print(
+        f"Startup: first job card {time.perf_counter() - LAUNCHED:.2f}s after launch"
+        + (f" ({phases})." if phases else ".")
+    )
+
+
+def _load_driver_cache(path):
+    try:
+        with open(path, "r") as file:
+            return json.load(file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def chromedriver_path(version=None, path=driver_cache_path, refresh=False):
+    """Return a local chromedriver binary, resolving it over the network only once.
+
+    The path webdriver-manager installs to is cached per ``version`` (a
+    pinned driver version, or the latest one when None), so later launches
+    skip the version lookup. ``refresh`` forces a new lookup, e.g. after
+    Chrome updated and the cached driver no longer matches it.
+    """
+    cache = _load_driver_cache(path)
+    key = version or "latest"
+    cached = cache.get(key)
+    if cached and os.path.isfile(cached) and not refresh:
+        return cached
+
+    if version:
+        manager = ChromeDriverManager(driver_version=version)
+    else:
+        manager = ChromeDriverManager()
+    installed = manager.install()
+    cache[key] = installed
+    # Losing this file only costs one more lookup, so a plain write will do.
+    with open(path, "w") as file:
+        json.dump(cache, file)
+    print(f"Cached chromedriver {key} at {installed}.")
+    return installed
+
+
+def session_is_valid(driver):
+    """Open the feed and report whether the profile is still logged in.
+
+    The session counts as valid when the ``li_at`` cookie is present and
+    unexpired and LinkedIn didn't bounce the feed to a login page.
+    """
+    try:
+        driver.get(FEED_URL)
+        cookie = driver.get_cookie(SESSION_COOKIE)
+    except Exception as e:
+        print(f"Could not check the saved session: {e}")
+        return False
+
+    if not cookie:
+        return False
+    expiry = cookie.get("expiry")
+    if expiry is not None and expiry <= time.time():
+        return False
+    url = driver.current_url
+    return "/feed" in url and not any(
+        marker in url for marker in ("/login", "/authwall", "/checkpoint")
+    )
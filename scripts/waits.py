@@ -0,0 +1,166 @@
+import time
+from collections import defaultdict
+
+from scripts.metrics import span
+
+# Upper bound for any single wait; setup_driver applies it as the script timeout.
+SCRIPT_TIMEOUT = 30
+
+# Each condition is the body of a JS function of ``args`` that returns truthy
+# once the page is ready. They are inlined rather than eval'd so LinkedIn's
+# CSP doesn't get in the way.
+CONDITIONS = {
+    # The detail pane shows a description for the clicked card's job id.
+    "job_details": """
+        const pane = document.querySelector('#job-details');
+        if (!pane || !pane.innerText.trim()) { return false; }
+        if (!args.job_id) { return true; }
+        return location.href.includes(`currentJobId=${args.job_id}`)
+            || !!document.querySelector(
+                `.jobs-search__job-details--container a[href*="/jobs/view/${args.job_id}"]`);
+    """,
+    # The Easy Apply modal moved past the step captured by modal_step_signature,
+    # or closed altogether.
+    "modal_step_changed": """
+        const modal = document.querySelector('.jobs-easy-apply-modal, [role="dialog"]');
+        if (!modal) { return true; }
+        const signature = window.__jobbotStepSignature(modal);
+        return signature !== args.previous && !!modal.querySelector('button, input');
+    """,
+    # No new resource requests for ``idle_ms``.
+    "network_idle": """
+        const now = performance.now();
+        const state = window.__jobbotNetwork = window.__jobbotNetwork
+            || (performance.setResourceTimingBufferSize(10000), {count: -1, since: now});
+        const count = performance.getEntriesByType('resource').length;
+        if (count !== state.count) {
+            state.count = count;
+            state.since = now;
+            return false;
+        }
+        return now - state.since >= (args.idle_ms || 500);
+    """,
+    # Every job card scrolled into view has rendered its content.
+    "job_cards_hydrated": """
+        const cards = document.querySelectorAll('li[data-occludable-job-id]');
+        return Array.from(cards).every((li) => {
+            const box = li.getBoundingClientRect();
+            const visible = box.bottom > 0 && box.top < window.innerHeight;
+            return !visible || li.innerText.trim() !== '';
+        });
+    """,
+    "element_present": "return !!document.querySelector(args.selector);",
+    "element_visible": """
+        const el = document.querySelector(args.selector);
+        return !!el && el.offsetParent !== null && !el.disabled;
+    """,
+    "element_gone": "return !document.querySelector(args.selector);",
+}
+
+STEP_SIGNATURE_HELPER = """
+window.__jobbotStepSignature = window.__jobbotStepSignature || function (modal) {
+    const header = modal.querySelector('h3, h2');
+    const progress = modal.querySelector('progress, [role="progressbar"]');
+    const names = Array.from(modal.querySelectorAll('input, select, textarea'))
+        .map((el) => el.name || el.id).join('|');
+    return [
+        header ? header.innerText.trim() : '',
+        progress ? (progress.value || progress.getAttribute('aria-valuenow')) : '',
+        names,
+    ].join('#');
+};
+"""
+
+WAIT_TEMPLATE = (
+    STEP_SIGNATURE_HELPER
+    + """
+const done = arguments[arguments.length - 1];
+const args = arguments[0];
+const timeoutMs = arguments[1];
+const predicate = () => {
+    try {
+        return !!(function (args) { __PREDICATE__ })(args);
+    } catch (e) {
+        return false;
+    }
+};
+
+if (predicate()) {
+    done(true);
+} else {
+    let finished = false;
+    let observer = null;
+    let poll = null;
+    let timer = null;
+    const finish = (ok) => {
+        if (finished) { return; }
+        finished = true;
+        observer.disconnect();
+        clearInterval(poll);
+        clearTimeout(timer);
+        done(ok);
+    };
+    observer = new MutationObserver(() => { if (predicate()) { finish(true); } });
+    observer.observe(document, {
+        childList: true, subtree: true, attributes: true, characterData: true,
+    });
+    // Conditions like network_idle change without touching the DOM.
+    poll = setInterval(() => { if (predicate()) { finish(true); } }, 100);
+    timer = setTimeout(() => finish(predicate()), timeoutMs);
+}
+"""
+)
+
+WAIT_SCRIPTS = {
+    name: WAIT_TEMPLATE.replace("__PREDICATE__", predicate)
+    for name, predicate in CONDITIONS.items()
+}
+
+WAIT_TIMINGS = defaultdict(list)
+
+
+def wait_for(driver, condition, timeout=10, **args):
+    """Block until a named readiness condition holds or ``timeout`` expires.
+
+    Returns True if the condition was met. Every wait's duration is printed
+    and kept in WAIT_TIMINGS for wait_report().
+    """
+    timeout = min(timeout, SCRIPT_TIMEOUT - 1)
+    start = time.perf_counter()
+
+    with span("wait", condition=condition) as attrs:
+        try:
+            ready = driver.execute_async_script(
+                WAIT_SCRIPTS[condition], args, int(timeout * 1000)
+            )
+        except Exception as e:
+            print(f"Wait for '{condition}' was interrupted: {e}")
+            ready = False
+        attrs["ready"] = bool(ready)
+
+    elapsed = time.perf_counter() - start
+    WAIT_TIMINGS[condition].append(elapsed)
+    status = "ready" if ready else "timed out"
+    print(f"Waited {elapsed:.2f}s for '{condition}' ({status}).")
+    return bool(ready)
+
+
+def modal_step_signature(driver):
+    """Capture the current Easy Apply step so modal_step_changed can detect a new one."""
+    return driver.execute_script(
+        STEP_SIGNATURE_HELPER
+        + """
+        const modal = document.querySelector('.jobs-easy-apply-modal, [role="dialog"]');
+        return modal ? window.__jobbotStepSignature(modal) : null;
+        """
+    )
+
+
+def wait_report():
+    """Print how long each kind of wait took so far."""
+    for condition, timings in sorted(WAIT_TIMINGS.items()):
+        print(
+            f"{condition}: {len(timings)} waits, "
+            f"avg {sum(timings) / len(timings):.2f}s, max {max(timings):.2f}s, "
+            f"total {sum(timings):.1f}s"
+        )
@@ -0,0 +1,225 @@
+import os
+import threading
+import time
+from collections import Counter
+
+from scripts.applied_ledger import AppliedJobsLedger, SUBMITTED
+from scripts.checkpoint import load_checkpoint
+from scripts.job_application_bot import (
+    setup_driver,
+    ensure_logged_in,
+    apply_to_jobs,
+    build_answer_index,
+    start_cover_letter_worker,
+)
+from scripts.job_corpus import load_job_corpus
+from scripts.pagination import PAGE_SIZE, build_search_url
+from scripts.question_queue import QuestionQueue
+
+DEFAULT_PROFILE_ROOT = "resources/chrome_profiles"
+worker_checkpoint_path = "resources/checkpoint-worker-{worker_id}.json"
+
+
+class WorkerStats:
+    def __init__(self, worker_id):
+        self.worker_id = worker_id
+        self.outcomes = Counter()
+        self.searches = 0
+        self.started = time.perf_counter()
+        self.finished = None
+
+    @property
+    def elapsed(self):
+        return (self.finished or time.perf_counter()) - self.started
+
+
+def _per_minute(count, seconds):
+    return count / (seconds / 60) if seconds else 0.0
+
+
+def _resume_point(worker_id, worker_count, searches, checkpoint_file):
+    """Return ``(search index, checkpoint)`` to continue a worker from.
+
+    Falls back to ``(0, None)``, the first search, when the worker has no
+    checkpoint or it can't be continued with these searches and workers.
+    """
+    checkpoint = load_checkpoint(checkpoint_file)
+    if not checkpoint:
+        print(f"[worker {worker_id}] No checkpoint found, starting a new run.")
+        return 0, None
+
+    search_urls = [build_search_url(search) for search in searches]
+    if checkpoint["search_url"] not in search_urls:
+        print(
+            f"[worker {worker_id}] The checkpointed search is no longer configured, "
+            "starting a new run."
+        )
+        return 0, None
+    if checkpoint["start"] // PAGE_SIZE % worker_count != worker_id - 1:
+        print(
+            f"[worker {worker_id}] The checkpoint was written by a run with a "
+            "different number of workers, starting a new run."
+        )
+        return 0, None
+    return search_urls.index(checkpoint["search_url"]), checkpoint
+
+
+def _run_worker(
+    worker_id,
+    worker_count,
+    searches,
+    config,
+    settings,
+    shared,
+    credentials,
+    stats,
+    resume=False,
+):
+    """Drive one Chrome session through this worker's share of every search.
+
+    Worker ``i`` of ``N`` takes result pages ``i-1, i-1+N, ...`` of each
+    search, so the pages of one search are spread over all sessions. With
+    ``resume``, the worker skips the searches it finished and continues
+    from its own checkpoint. Once ``shared["stop"]`` is set the worker stops
+    between cards and runs no further searches.
+    """
+    profile_root = settings.get("workers", {}).get("profile_dir", DEFAULT_PROFILE_ROOT)
+    checkpoint_file = worker_checkpoint_path.format(worker_id=worker_id)
+    first_search, checkpoint = 0, None
+    if resume:
+        first_search, checkpoint = _resume_point(
+            worker_id, worker_count, searches, checkpoint_file
+        )
+    driver = None
+    try:
+        driver = setup_driver(
+            profile_dir=os.path.join(profile_root, f"worker-{worker_id}"),
+            browser_settings=settings.get("browser"),
+        )
+        ensure_logged_in(driver, *credentials)
+
+        for search in searches[first_search:]:
+            if shared["stop"].is_set():
+                print(f"[worker {worker_id}] Stopping, the run was throttled.")
+                break
+            start_page = worker_id - 1
+            if checkpoint:
+                start_page = checkpoint["start"] // PAGE_SIZE
+            print(f"[worker {worker_id}] Applying from {search}")
+            stats.outcomes += apply_to_jobs(
+                driver,
+                config,
+                settings,
+                ledger=shared["ledger"],
+                resume=checkpoint,
+                answer_index=shared["answer_index"],
+                checkpoint_file=checkpoint_file,
+                search=search,
+                start_page=start_page,
+                page_step=worker_count,
+                question_queue=shared["question_queue"],
+                cover_letters=shared["cover_letters"],
+                corpus=shared["corpus"],
+                stop=shared["stop"],
+            )
+            stats.searches += 1
+            checkpoint = None
+
+    except Exception as e:
+        print(f"[worker {worker_id}] Stopped on error: {e}")
+    finally:
+        stats.finished = time.perf_counter()
+        if driver:
+            driver.quit()
+
+
+def run_worker_pool(
+    config, settings, worker_count, credentials, searches=None, resume=False
+):
+    """Apply across ``workers.searches`` with ``worker_count`` parallel Chrome sessions.
+
+    Searches are URLs or search specs (see build_search_url), and their
+    result pages are sharded across the workers by ``start=`` offset.
+    Every worker has its own profile directory but shares one answer index
+    and one applied-jobs ledger, so answers typed in one session are used by
+    all of them and no job id is applied to twice. Cover letters are written
+    by one shared background worker, and reposts are caught against one
+    shared job description corpus. ``searches`` replaces the configured
+    searches, and ``resume`` continues every worker from its checkpoint.
+    When LinkedIn throttles one session, every worker stops, since they
+    all apply on the same account.
+    Returns the list of per-worker stats after printing a throughput report.
+    """
+    searches = searches or settings.get("workers", {}).get("searches") or []
+    if not searches:
+        print("No searches configured under workers.searches in settings.yaml.")
+        return []
+
+    answer_index = build_answer_index(config, settings)
+    shared = {
+        "answer_index": answer_index,
+        "ledger": AppliedJobsLedger(),
+        "question_queue": QuestionQueue(),
+        "cover_letters": start_cover_letter_worker(settings),
+        "corpus": load_job_corpus(settings),
+        "stop": threading.Event(),
+    }
+
+    worker_count = max(1, worker_count)
+    all_stats = [WorkerStats(worker_id) for worker_id in range(1, worker_count + 1)]
+    threads = [
+        threading.Thread(
+            target=_run_worker,
+            args=(
+                stats.worker_id,
+                worker_count,
+                searches,
+                config,
+                settings,
+                shared,
+                credentials,
+                stats,
+                resume,
+            ),
+            name=f"worker-{stats.worker_id}",
+        )
+        for stats in all_stats
+    ]
+
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    print_throughput_report(all_stats, time.perf_counter() - started)
+    if shared["stop"].is_set():
+        print(
+            "All workers stopped after LinkedIn throttled the run. "
+            "Continue with --resume."
+        )
+    shared["ledger"].close()
+    if shared["cover_letters"] is not None:
+        shared["cover_letters"].close()
+    if shared["corpus"] is not None:
+        shared["corpus"].close()
+    return all_stats
+
+
+def print_throughput_report(all_stats, wall_time):
+    total = Counter()
+    for stats in all_stats:
+        total += stats.outcomes
+        submitted = stats.outcomes[SUBMITTED]
+        print(
+            f"Worker {stats.worker_id}: {stats.searches} searches, "
+            f"{submitted} submitted, {sum(stats.outcomes.values())} processed "
+            f"in {stats.elapsed / 60:.1f} min "
+            f"({_per_minute(submitted, stats.elapsed):.2f} applications/min)"
+        )
+
+    print(
+        f"All workers: {total[SUBMITTED]} submitted, {sum(total.values())} processed "
+        f"in {wall_time / 60:.1f} min "
+        f"({_per_minute(total[SUBMITTED], wall_time):.2f} applications/min)"
+    )
@@ -0,0 +1,26 @@
+import pytest
+
+from ai.llm_cache import LLMCache
+from scripts import metrics
+
+
+@pytest.fixture(autouse=True)
+def spans_in_tmp_path(tmp_path, monkeypatch):
+    """Keep the spans and metrics written by the code under test out of resources/."""
+    monkeypatch.setattr(metrics, "spans_path", str(tmp_path / "spans.jsonl"))
+    monkeypatch.setattr(metrics, "prometheus_path", str(tmp_path / "bot.prom"))
+    monkeypatch.setattr(metrics, "_spans_file", None)
+    yield
+    if metrics._spans_file is not None:
+        metrics._spans_file.close()
+
+
+@pytest.fixture
+def ai_bot(tmp_path, monkeypatch):
+    """The ai_bot module with an empty LLM cache of its own."""
+    pytest.importorskip("openai")
+    pytest.importorskip("dotenv")
+    from ai import ai_bot
+
+    monkeypatch.setattr(ai_bot, "llm_cache", LLMCache(str(tmp_path / "llm")))
+    return ai_bot
@@ -0,0 +1,21 @@
+class FakeDriver:
+    """A browser showing one page, as far as the throttling checks read it."""
+
+    def __init__(self, url="https://www.linkedin.com/jobs/view/1/", text=""):
+        self.url = url
+        self.text = text
+        self.visited = []
+
+    @property
+    def current_url(self):
+        return self.url
+
+    def get(self, url):
+        self.visited.append(url)
+        self.url = url
+
+    def execute_script(self, script, *args):
+        return [self.url, self.text]
+
+    def quit(self):
+        pass
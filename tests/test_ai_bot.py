@@ -0,0 +1,154 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+EXPERIENCE = "How many years of Python experience do you have?"
+SPONSORSHIP = "Will you require visa sponsorship?"
+WORK_SETTING = "Which work setting do you prefer?"
+QUESTIONS = [
+    {"question": EXPERIENCE, "options": []},
+    {"question": SPONSORSHIP, "options": ["Yes", "No"]},
+    {"question": WORK_SETTING, "options": ["Remote", "Hybrid", "On-site"]},
+]
+ANSWERS = {EXPERIENCE: "5", SPONSORSHIP: "No", WORK_SETTING: "Remote"}
+
+
+def _reply(content):
+    message = SimpleNamespace(content=content)
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=None)
+
+
+class AsyncStubClient:
+    """Stands in for openai.AsyncOpenAI: answers the batched prompt with
+    ``batch_reply`` and single questions from ``answers``."""
+
+    def __init__(self, batch_reply="", answers=ANSWERS):
+        self.batch_reply = batch_reply
+        self.answers = answers
+        self.prompts = []
+        self.active = 0
+        self.peak = 0
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    async def create(self, model, messages):
+        prompt = messages[-1]["content"]
+        self.prompts.append(prompt)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0)
+        self.active -= 1
+
+        if "Questions:" in prompt:
+            if isinstance(self.batch_reply, Exception):
+                raise self.batch_reply
+            return _reply(self.batch_reply)
+        question = prompt.split("Question:")[-1].split("Answer:")[0].strip()
+        return _reply(self.answers[question.split(" (Options:")[0]])
+
+    def batch_questions(self):
+        (prompt,) = [prompt for prompt in self.prompts if "Questions:" in prompt]
+        numbered = prompt.split("Questions:")[1].split("Return only")[0]
+        return json.loads(numbered)
+
+
+def answer(ai_bot, client, questions=QUESTIONS, **kwargs):
+    return asyncio.run(
+        ai_bot.agenerate_answers_for_questions(questions, client, **kwargs)
+    )
+
+
+def test_a_form_step_is_answered_with_one_batched_prompt(ai_bot):
+    client = AsyncStubClient(
+        'Sure! Here are the answers:\n```json\n{"1": 5, "2": "No", "3": "Remote"}\n```'
+    )
+
+    assert answer(ai_bot, client) == ANSWERS
+    assert len(client.prompts) == 1
+    assert client.batch_questions() == {
+        "1": {"question": EXPERIENCE},
+        "2": {"question": SPONSORSHIP, "options": ["Yes", "No"]},
+        "3": {"question": WORK_SETTING, "options": ["Remote", "Hybrid", "On-site"]},
+    }
+
+
+def test_questions_the_batch_left_out_are_asked_one_by_one(ai_bot):
+    client = AsyncStubClient('{"1": "5", "2": "  ", "4": "Remote"}')
+
+    assert answer(ai_bot, client) == ANSWERS
+    assert len(client.prompts) == 3
+    assert any(
+        "Which work setting do you prefer? (Options: Remote, Hybrid, On-site)" in prompt
+        for prompt in client.prompts
+    )
+
+
+@pytest.mark.parametrize(
+    "batch_reply",
+    ["I can't answer that.", '{"1": "5", "2": }', RuntimeError("server error")],
+)
+def test_a_useless_batch_reply_falls_back_to_single_questions(ai_bot, batch_reply):
+    client = AsyncStubClient(batch_reply)
+
+    assert answer(ai_bot, client) == ANSWERS
+    assert len(client.prompts) == 1 + len(QUESTIONS)
+
+
+def test_single_questions_respect_the_concurrency_limit(ai_bot):
+    questions = [{"question": f"Question {number}?"} for number in range(8)]
+    client = AsyncStubClient(
+        "no JSON here", {item["question"]: "Yes" for item in questions}
+    )
+
+    answers = answer(ai_bot, client, questions, max_concurrency=2)
+    assert len(answers) == 8
+    assert client.peak == 2
+
+
+def test_answers_are_cached_by_question_and_options(ai_bot):
+    client = AsyncStubClient('{"1": "5", "2": "No", "3": "Remote"}')
+    answer(ai_bot, client)
+
+    assert answer(ai_bot, client) == ANSWERS
+    assert len(client.prompts) == 1
+
+    changed = [{"question": WORK_SETTING, "options": ["Remote", "On-site"]}]
+    assert answer(ai_bot, client, changed) == {WORK_SETTING: "Remote"}
+    assert len(client.prompts) == 2
+
+
+def test_a_default_client_is_closed_after_the_step(ai_bot, monkeypatch):
+    clients = []
+
+    class AsyncOpenAI(AsyncStubClient):
+        def __init__(self, api_key=None):
+            super().__init__('{"1": "5", "2": "No", "3": "Remote"}')
+            self.closed = False
+            clients.append(self)
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc_info):
+            self.closed = True
+
+    monkeypatch.setattr(ai_bot.openai, "AsyncOpenAI", AsyncOpenAI, raising=False)
+
+    assert answer(ai_bot, None) == ANSWERS
+    assert [client.closed for client in clients] == [True]
+
+
+@pytest.mark.parametrize(
+    "reply, expected",
+    [
+        ('{"1": "Yes", "2": 3}', {"A?": "Yes", "B?": "3"}),
+        ('Answers: {"1": " Yes "} and that is all.', {"A?": "Yes"}),
+        ('{"1": ["Yes"], "2": null}', {}),
+        ('["Yes", "3"]', {}),
+        ("", {}),
+    ],
+)
+def test_parse_batch_answers(ai_bot, reply, expected):
+    questions = [{"question": "A?"}, {"question": "B?"}]
+    assert ai_bot._parse_batch_answers(reply, questions) == expected
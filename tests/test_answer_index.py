@@ -0,0 +1,109 @@
+import pytest
+
+from scripts.answer_index import AnswerIndex, normalize_question
+from scripts.intent_engine import IntentEngine
+
+YEARS = "How many years of work experience do you have with {}?"
+
+CONFIG = {
+    "Are you 18 or older?": "Yes",
+    "Are you legally authorized to work in the United States?": "Yes",
+    "Do you have 5 years of experience with Python?": "Yes",
+    YEARS.format("Git"): "2",
+    YEARS.format("Rust"): "1",
+    YEARS.format("Commerce"): "5",
+    YEARS.format("Reactjs"): "2",
+    YEARS.format("Spring"): "3",
+    YEARS.format("SciPy"): "4",
+    YEARS.format("C"): "1",
+}
+
+
+@pytest.fixture
+def index():
+    return AnswerIndex(CONFIG)
+
+
+def test_normalize_collapses_repeated_labels_and_required():
+    assert normalize_question("Are you 18 or older?\n\nAre you 18 or older?") == (
+        "are you 18 or older"
+    )
+    assert normalize_question("Are you 18 or older? Required") == "are you 18 or older"
+
+
+def test_normalize_keeps_csharp_and_cpp_apart_from_c():
+    languages = ["C", "C#", "C++"]
+    keys = {normalize_question(YEARS.format(language)) for language in languages}
+    assert len(keys) == 3
+
+
+def test_exact_lookup_scores_one(index):
+    answer, question, score = index.lookup("ARE YOU 18 OR OLDER")
+    assert (answer, question, score) == ("Yes", "Are you 18 or older?", 1.0)
+
+
+def test_spelling_variant_matches(index):
+    answer, question, score = index.lookup(
+        "Are you legally authorised to work in the United States?"
+    )
+    assert answer == "Yes"
+    assert question == "Are you legally authorized to work in the United States?"
+    assert index.fuzzy_threshold <= score < 1.0
+
+
+def test_spacing_variant_of_the_slot_matches(index):
+    answer, question, _ = index.lookup(YEARS.format("React.js"))
+    assert (answer, question) == ("2", YEARS.format("Reactjs"))
+
+
+@pytest.mark.parametrize(
+    "technology", ["Kubernetes", "Ruby", "C#", "C++", "Redis", "Spark", "Scala"]
+)
+def test_other_technology_is_not_matched(index, technology):
+    assert index.lookup(YEARS.format(technology))[0] is None
+
+
+def test_other_required_years_is_not_matched(index):
+    assert index.lookup("Do you have 3 years of experience with Python?")[0] is None
+
+
+def test_engine_answers_questions_without_an_exact_answer():
+    asked = []
+
+    def engine(question):
+        asked.append(question)
+        return "7", "intent:years_experience", 0.95
+
+    index = AnswerIndex(CONFIG, engine=engine)
+    assert index.lookup(YEARS.format("Kubernetes")) == (
+        "7",
+        "intent:years_experience",
+        0.95,
+    )
+    assert index.lookup("Are you 18 or older?")[0] == "Yes"
+    assert asked == [YEARS.format("Kubernetes")]
+
+
+def test_engine_comes_before_the_fuzzy_tier():
+    engine = IntentEngine({"years_of_experience": {"react": 3}})
+    index = AnswerIndex(CONFIG, engine=engine)
+    assert index.lookup(YEARS.format("React.js")) == (
+        "3",
+        "intent:years_experience",
+        0.95,
+    )
+    # The profile has no work_authorized field, so the fuzzy tier answers.
+    answer, _, _ = index.lookup(
+        "Are you legally authorised to work in the United States?"
+    )
+    assert answer == "Yes"
+
+
+def test_added_answer_is_found_by_later_lookups(index):
+    assert index.lookup(YEARS.format("Kubernetes"))[0] is None
+    index.add(YEARS.format("Kubernetes"), 1)
+    assert index.lookup(YEARS.format("Kubernetes")) == (
+        "1",
+        YEARS.format("Kubernetes"),
+        1.0,
+    )
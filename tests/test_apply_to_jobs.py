@@ -0,0 +1,42 @@
+from selenium.common.exceptions import WebDriverException
+
+from scripts.applied_ledger import AppliedJobsLedger
+from scripts.checkpoint import load_checkpoint
+from scripts.job_application_bot import apply_to_jobs
+from scripts.pagination import PAGE_SIZE
+from tests.fakes import FakeDriver
+
+SEARCH = "https://www.linkedin.com/jobs/search/?keywords=python"
+
+
+class OfflineDriver(FakeDriver):
+    """Every page load times out."""
+
+    def get(self, url):
+        super().get(url)
+        raise WebDriverException("timeout: Timed out receiving message from renderer")
+
+
+def test_a_search_stops_after_pages_in_a_row_fail_to_load(tmp_path):
+    checkpoint_file = str(tmp_path / "checkpoint.json")
+    ledger = AppliedJobsLedger(str(tmp_path / "ledger.sqlite3"))
+    driver = OfflineDriver()
+
+    apply_to_jobs(
+        driver,
+        {},
+        {"pagination": {"max_pages": None, "max_failed_pages": 2}},
+        ledger=ledger,
+        answer_index=object(),
+        checkpoint_file=checkpoint_file,
+        search=SEARCH,
+        start_page=4,
+    )
+    ledger.close()
+
+    # Two pages, each tried three times.
+    assert len(driver.visited) == 6
+    assert len(set(driver.visited)) == 2
+    checkpoint = load_checkpoint(checkpoint_file)
+    assert checkpoint["search_url"] == SEARCH
+    assert checkpoint["start"] == 4 * PAGE_SIZE
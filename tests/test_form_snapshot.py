@@ -0,0 +1,295 @@
+import os
+
+from scripts.answer_index import AnswerIndex
+from scripts.form_snapshot import plan_form_writes
+
+
+def text_field(id, question, value="", typeahead=False):
+    return {
+        "id": id,
+        "kind": "text",
+        "question": question,
+        "value": value,
+        "options": [],
+        "typeahead": typeahead,
+    }
+
+
+def radio_field(id, question, labels, checked=None):
+    options = [
+        {"id": f"{id}.{index}", "label": label, "checked": label == checked}
+        for index, label in enumerate(labels)
+    ]
+    return {
+        "id": id,
+        "kind": "radio",
+        "question": question,
+        "value": checked or "",
+        "options": options,
+    }
+
+
+def select_field(id, question, options, value="Select an option"):
+    return {
+        "id": id,
+        "kind": "select",
+        "question": question,
+        "value": value,
+        "options": ["Select an option"] + options,
+    }
+
+
+def checkbox_field(id, question, checked=False):
+    return {
+        "id": id,
+        "kind": "checkbox",
+        "question": question,
+        "value": checked,
+        "options": [],
+    }
+
+
+def file_field(id, question):
+    return {"id": id, "kind": "file", "question": question, "value": "", "options": []}
+
+
+def snapshot(*fields, resume_selected=False):
+    return {"fields": list(fields), "resumeSelected": resume_selected}
+
+
+def never_ask(question_text, field):
+    raise AssertionError(f"asked for {question_text!r}")
+
+
+def test_known_answers_become_one_write_per_field():
+    index = AnswerIndex(
+        {
+            "Mobile phone number": "5550100",
+            "City": "Austin, Texas",
+            "Are you legally authorized to work in the United States?": True,
+            "English proficiency": "native",
+            "I agree to the terms": "Yes",
+        }
+    )
+    writes, new_answers = plan_form_writes(
+        snapshot(
+            text_field("0", "Mobile phone number"),
+            text_field("1", "City", typeahead=True),
+            radio_field(
+                "2",
+                "Are you legally authorized to work in the United States?",
+                ["Yes", "No"],
+            ),
+            select_field("3", "English proficiency", ["Basic", "Native"]),
+            checkbox_field("4", "I agree to the terms"),
+        ),
+        index,
+        never_ask,
+    )
+
+    assert new_answers == {}
+    assert [(write["id"], write["action"], write.get("value")) for write in writes] == [
+        ("0", "type", "5550100"),
+        ("1", "keys", "Austin, Texas"),
+        ("2.0", "click", None),
+        ("3", "select", "Native"),
+        ("4", "click", None),
+    ]
+
+
+def test_filled_and_already_matching_fields_are_left_alone():
+    index = AnswerIndex(
+        {"Mobile phone number": "5550100", "Do you need sponsorship?": "No"}
+    )
+    writes, _ = plan_form_writes(
+        snapshot(
+            text_field("0", "Mobile phone number", value="5550199"),
+            radio_field("1", "Do you need sponsorship?", ["Yes", "No"], checked="No"),
+            text_field("2", "Upload resume"),
+            text_field("3", "Search"),
+        ),
+        index,
+        never_ask,
+    )
+    assert writes == []
+
+
+def test_unknown_questions_are_resolved_in_one_batch():
+    index = AnswerIndex({"Mobile phone number": "5550100"})
+    batches = []
+
+    def resolve_unknowns(items):
+        batches.append(items)
+        return {
+            "How many years of experience do you have with Django?": "3",
+            "Preferred work setting": "Remote",
+        }
+
+    writes, new_answers = plan_form_writes(
+        snapshot(
+            text_field("0", "Mobile phone number"),
+            text_field("1", "How many years of experience do you have with Django?"),
+            select_field("2", "Preferred work setting", ["Remote", "Hybrid"]),
+        ),
+        index,
+        never_ask,
+        resolve_unknowns=resolve_unknowns,
+    )
+
+    assert batches == [
+        [
+            {
+                "question": "How many years of experience do you have with Django?",
+                "options": [],
+            },
+            {"question": "Preferred work setting", "options": ["Remote", "Hybrid"]},
+        ]
+    ]
+    assert new_answers == {
+        "How many years of experience do you have with Django?": "3",
+        "Preferred work setting": "Remote",
+    }
+    assert index.get("Preferred work setting") == "Remote"
+    assert [write["id"] for write in writes] == ["0", "1", "2"]
+
+
+def test_batch_answers_outside_the_options_go_to_ask():
+    index = AnswerIndex()
+    asked = []
+
+    def ask(question_text, field):
+        asked.append(question_text)
+        return "Hybrid"
+
+    writes, new_answers = plan_form_writes(
+        snapshot(select_field("0", "Preferred work setting", ["Remote", "Hybrid"])),
+        index,
+        ask,
+        resolve_unknowns=lambda items: {"Preferred work setting": "Anywhere"},
+    )
+
+    assert asked == ["Preferred work setting"]
+    assert new_answers == {"Preferred work setting": "Hybrid"}
+    assert writes[0]["value"] == "Hybrid"
+
+
+def test_failed_batch_falls_back_to_ask():
+    def resolve_unknowns(items):
+        raise TimeoutError("LLM down")
+
+    def ask(question_text, field):
+        return "90000" if question_text == "Desired salary" else ""
+
+    writes, new_answers = plan_form_writes(
+        snapshot(text_field("0", "Desired salary"), text_field("1", "Notice period")),
+        AnswerIndex(),
+        ask,
+        resolve_unknowns=resolve_unknowns,
+    )
+
+    assert new_answers == {"Desired salary": "90000"}
+    assert [(write["id"], write["value"]) for write in writes] == [("0", "90000")]
+
+
+RAW_LEGEND = "Will you relocate to Austin?\nWill you relocate to Austin?\nRequired"
+
+
+def test_radio_questions_are_asked_and_journaled_with_clean_text():
+    index = AnswerIndex()
+    asked = []
+
+    def ask(question_text, field):
+        asked.append(question_text)
+        return "Yes"
+
+    writes, new_answers = plan_form_writes(
+        snapshot(
+            radio_field("0", RAW_LEGEND, ["Yes", "No"]),
+            radio_field("1", RAW_LEGEND, ["Yes", "No"]),
+        ),
+        index,
+        ask,
+    )
+
+    # The second copy of the question is found under the raw legend.
+    assert asked == ["Will you relocate to Austin?"]
+    assert new_answers == {"Will you relocate to Austin?": "Yes"}
+    assert [write["id"] for write in writes] == ["0.0", "1.0"]
+
+
+def test_unknown_radio_questions_are_resolved_with_clean_text():
+    batches = []
+
+    def resolve_unknowns(items):
+        batches.append(items)
+        return {"Will you relocate to Austin?": "No"}
+
+    writes, new_answers = plan_form_writes(
+        snapshot(radio_field("0", RAW_LEGEND, ["Yes", "No"])),
+        AnswerIndex(),
+        never_ask,
+        resolve_unknowns=resolve_unknowns,
+    )
+
+    assert batches == [
+        [{"question": "Will you relocate to Austin?", "options": ["Yes", "No"]}]
+    ]
+    assert new_answers == {"Will you relocate to Austin?": "No"}
+    assert [write["id"] for write in writes] == ["0.1"]
+
+
+def test_cover_letter_fields_get_the_letter(tmp_path):
+    letter = tmp_path / "acme--engineer.txt"
+    letter.write_text("Dear Acme,\n", encoding="utf-8")
+    upload = tmp_path / "acme--engineer.pdf"
+    upload.write_bytes(b"%PDF-1.4\n")
+
+    writes, _ = plan_form_writes(
+        snapshot(
+            file_field("0", "Upload cover letter"),
+            text_field("1", "Cover letter"),
+            file_field("2", "Upload portfolio"),
+        ),
+        AnswerIndex(),
+        never_ask,
+        cover_letter=lambda: str(letter),
+    )
+
+    assert writes == [
+        {
+            "id": "0",
+            "action": "keys",
+            "value": os.path.abspath(upload),
+            "question": "Upload cover letter",
+        },
+        {
+            "id": "1",
+            "action": "type",
+            "value": "Dear Acme,",
+            "question": "Cover letter",
+        },
+    ]
+
+
+def test_cover_letter_uploads_need_a_pdf_or_docx_copy(tmp_path):
+    letter = tmp_path / "acme--engineer.txt"
+    letter.write_text("Dear Acme,\n", encoding="utf-8")
+
+    writes, _ = plan_form_writes(
+        snapshot(file_field("0", "Upload cover letter")),
+        AnswerIndex(),
+        never_ask,
+        cover_letter=lambda: str(letter),
+    )
+    assert writes == []
+
+    (tmp_path / "acme--engineer.docx").write_bytes(b"PK")
+    writes, _ = plan_form_writes(
+        snapshot(file_field("0", "Upload cover letter")),
+        AnswerIndex(),
+        never_ask,
+        cover_letter=lambda: str(letter),
+    )
+    assert [write["value"] for write in writes] == [
+        os.path.abspath(tmp_path / "acme--engineer.docx")
+    ]
@@ -0,0 +1,60 @@
+import os
+
+import pytest
+import yaml
+
+from benchmarks.answer_engine import ANSWER_PROFILE, INTENT_LABELS, evaluate
+from scripts.intent_engine import IntentEngine
+
+CONFIG = os.path.join(os.path.dirname(__file__), "..", "resources", "config.yaml")
+
+# Answers where the benchmark profile and the answer typed into config.yaml
+# differ on the facts, as (question, config answer, engine answer).
+KNOWN_DIFFERENCES = {
+    (
+        "Do you have more than 3 years of hands-on coding experience with Golang?",
+        "Yes",
+        "No",
+    ),
+    ("How many Years of experience do you have with react", "3", "2"),
+    ("How many years of experience do you have with React?", "3", "2"),
+    (
+        "How many years of proven experience do have as a Python/Django Developer?",
+        "4",
+        "5",
+    ),
+    ("How many years of work experience do you have with TypeScript?", "3", "2"),
+    ("How many years with Node.js do you have?", "2", "3"),
+}
+
+
+def _load(path):
+    with open(path, "r") as file:
+        return yaml.safe_load(file)
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return IntentEngine(_load(ANSWER_PROFILE))
+
+
+@pytest.fixture(scope="module")
+def labels():
+    return _load(INTENT_LABELS)
+
+
+def test_answered_questions_have_the_labeled_intent(engine, labels):
+    wrong = []
+    for item in labels:
+        intent, answer, confidence, _ = engine.classify(item["question"])
+        if answer is not None and confidence >= engine.min_confidence:
+            if intent != item["intent"]:
+                wrong.append((item["question"], item["intent"], intent, answer))
+    assert wrong == []
+
+
+def test_confident_answers_match_config(engine, labels):
+    rows, _, disagreements = evaluate(engine, labels, _load(CONFIG))
+
+    assert rows["config_answers"] > 0
+    assert set(disagreements) <= KNOWN_DIFFERENCES
@@ -0,0 +1,52 @@
+import pytest
+
+from scripts import job_cards
+from scripts.job_cards import iter_job_cards
+
+
+class ResultsDriver:
+    """A results list of ``job_ids`` whose card elements belong to one session."""
+
+    def __init__(self, job_ids):
+        self.job_ids = job_ids
+        self.session_id = "session-1"
+        self.current_window_handle = "tab-1"
+
+    def execute_script(self, script, seen, step, selector):
+        cards = [
+            {"element": self.browser(), "job_id": job_id, "title": job_id}
+            for job_id in self.job_ids
+            if job_id not in seen
+        ]
+        return {"cards": cards, "placeholders": 0, "at_end": True}
+
+    def browser(self):
+        return self.session_id, self.current_window_handle
+
+
+@pytest.fixture(autouse=True)
+def no_waits(monkeypatch):
+    monkeypatch.setattr(job_cards, "wait_for", lambda *args, **kwargs: True)
+
+
+def test_every_card_is_yielded_once():
+    driver = ResultsDriver(["1", "2", "3"])
+    assert [card["job_id"] for card in iter_job_cards(driver)] == ["1", "2", "3"]
+
+
+@pytest.mark.parametrize("attribute", ["session_id", "current_window_handle"])
+def test_cards_are_rediscovered_after_a_recycle(attribute):
+    driver = ResultsDriver(["1", "2", "3"])
+    cards = []
+    for card in iter_job_cards(driver):
+        cards.append(card)
+        if card["job_id"] == "1":
+            setattr(driver, attribute, "recycled")
+
+    assert [card["job_id"] for card in cards] == ["1", "2", "3"]
+    # Only the card clicked before the recycle holds an element of the old page.
+    assert [card["element"] == driver.browser() for card in cards] == [
+        False,
+        True,
+        True,
+    ]
@@ -0,0 +1,105 @@
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from ai.llm_cache import LLMCache
+
+
+class Clock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+def test_hit_after_set_and_miss_before(tmp_path, clock):
+    cache = LLMCache(str(tmp_path), clock=clock)
+    key = LLMCache.make_key("answer", "model", "resume", "are you 18 or older")
+
+    assert cache.get(key) is None
+    cache.set(key, "Yes")
+    assert cache.get(key) == "Yes"
+    assert LLMCache(str(tmp_path), clock=clock).get(key) == "Yes"
+    assert cache.stats() == {"hits": 1, "misses": 1, "evictions": 0, "hit_rate": 0.5}
+
+
+def test_changed_resume_digest_misses(tmp_path, clock):
+    cache = LLMCache(str(tmp_path), clock=clock)
+    cache.set(LLMCache.make_key("answer", "model", "resume-v1", "question"), "5")
+    changed = LLMCache.make_key("answer", "model", "resume-v2", "question")
+    assert cache.get(changed) is None
+
+
+def test_key_parts_do_not_run_together():
+    assert LLMCache.make_key("ab", "c") != LLMCache.make_key("a", "bc")
+
+
+def test_expired_entries_are_dropped(tmp_path, clock):
+    cache = LLMCache(str(tmp_path), ttl=60, clock=clock)
+    key = LLMCache.make_key("question")
+    cache.set(key, "answer")
+
+    clock.now += 61
+    assert cache.get(key) is None
+    assert cache.stats()["evictions"] == 1
+    assert not list(tmp_path.rglob("*.json"))
+
+
+def test_oldest_entries_are_evicted_past_max_entries(tmp_path, clock):
+    cache = LLMCache(str(tmp_path), max_entries=10, clock=clock)
+    keys = [LLMCache.make_key(str(number)) for number in range(11)]
+    for age, key in enumerate(keys):
+        cache.set(key, "answer")
+        # Eviction goes by file age; space the entries out.
+        (path,) = tmp_path.rglob(f"{key}.json")
+        os.utime(path, (age, age))
+
+    # Evicted down to 10% under the limit, oldest first.
+    assert cache.evictions == 2
+    assert [cache.get(key) for key in keys[:2]] == [None, None]
+    assert all(cache.get(key) == "answer" for key in keys[2:])
+
+
+class StubClient:
+    """Stands in for the OpenAI client: counts requests, answers from a map."""
+
+    def __init__(self, answers):
+        self.answers = answers
+        self.requests = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, model, messages):
+        self.requests.append(messages)
+        question = messages[-1]["content"].split("Question:")[-1]
+        question = question.split("Answer:")[0].strip()
+        message = SimpleNamespace(content=self.answers[question])
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=None)
+
+
+def test_answers_are_served_from_the_cache(ai_bot):
+    client = StubClient({"Are you 18 or older?": "Yes"})
+
+    assert ai_bot.generate_answer_for_question("Are you 18 or older?", client) == "Yes"
+    # A LinkedIn label variant of the same question is a hit.
+    assert (
+        ai_bot.generate_answer_for_question("Are you 18 or older?  Required", client)
+        == "Yes"
+    )
+    assert len(client.requests) == 1
+    assert ai_bot.llm_cache.stats()["hits"] == 1
+
+
+def test_editing_the_resume_invalidates_answers(ai_bot, monkeypatch):
+    client = StubClient({"Are you 18 or older?": "Yes"})
+    ai_bot.generate_answer_for_question("Are you 18 or older?", client)
+
+    monkeypatch.setattr(ai_bot, "resume_digest", LLMCache.make_key("new resume"))
+    ai_bot.generate_answer_for_question("Are you 18 or older?", client)
+    assert len(client.requests) == 2
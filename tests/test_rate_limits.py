@@ -0,0 +1,199 @@
+import asyncio
+import random
+
+import pytest
+
+from scripts import rate_limits
+from scripts.rate_limits import (
+    FakeClock,
+    RunThrottled,
+    Scheduler,
+    TokenBucket,
+    check_throttling,
+    configure_rate_limits,
+    detect_throttling,
+    is_retryable,
+    retry_after,
+)
+from tests.fakes import FakeDriver
+
+
+class APIError(Exception):
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"status {status_code}")
+        self.status_code = status_code
+        self.response = type("Response", (), {"headers": headers or {}})()
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def test_bucket_allows_a_burst_then_spaces_tokens(clock):
+    bucket = TokenBucket(rate=1.0, capacity=2, clock=clock)
+    assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 1.0, 2.0]
+
+    clock.now += 10
+    assert bucket.reserve() == 0.0
+
+
+def test_applications_keep_the_hourly_pace(clock):
+    scheduler = Scheduler({"applications_per_hour": 60}, clock)
+    for _ in range(10):
+        scheduler.wait("application")
+    # One burst token, then one application a minute, never faster.
+    assert clock.slept == [60.0] * 9
+    assert clock.now == 540.0
+
+
+def test_kinds_without_a_limit_never_wait(clock):
+    scheduler = Scheduler({"applications_per_hour": 1}, clock)
+    for _ in range(100):
+        scheduler.wait("navigation")
+        scheduler.wait("llm")
+    assert clock.slept == []
+
+
+def test_daily_ceiling_counts_earlier_applications(clock):
+    scheduler = Scheduler(
+        {"applications_per_hour": 3600, "applications_per_day": 10},
+        clock,
+        recent_applications=10,
+    )
+    assert scheduler.wait("application") == pytest.approx(86400 / 10)
+
+
+def test_call_retries_rate_limits_with_jittered_backoff(clock):
+    scheduler = Scheduler(
+        {"backoff_base_seconds": 2, "backoff_max_seconds": 10, "max_retries": 5},
+        clock,
+        rng=random.Random(0),
+    )
+    attempts = []
+
+    def flaky():
+        attempts.append(clock.now)
+        if len(attempts) < 4:
+            raise APIError(429 if len(attempts) % 2 else 503)
+        return "answer"
+
+    assert scheduler.call("llm", flaky) == "answer"
+    assert len(attempts) == 4
+    for attempt, delay in enumerate(clock.slept):
+        assert 0 <= delay <= min(10, 2 * 2**attempt)
+
+
+def test_call_waits_at_least_retry_after(clock):
+    scheduler = Scheduler({"backoff_base_seconds": 1}, clock, rng=random.Random(0))
+    responses = iter([APIError(429, {"retry-after": "30"})])
+
+    def limited():
+        error = next(responses, None)
+        if error:
+            raise error
+        return "ok"
+
+    assert scheduler.call("llm", limited) == "ok"
+    assert clock.slept == [30.0]
+
+
+def test_call_gives_up_after_max_retries(clock):
+    scheduler = Scheduler({"max_retries": 2}, clock, rng=random.Random(0))
+    calls = []
+
+    def overloaded():
+        calls.append(1)
+        raise APIError(500)
+
+    with pytest.raises(APIError):
+        scheduler.call("llm", overloaded)
+    assert len(calls) == 3
+
+
+def test_call_does_not_retry_client_errors(clock):
+    scheduler = Scheduler({}, clock)
+    calls = []
+
+    def invalid():
+        calls.append(1)
+        raise APIError(400)
+
+    with pytest.raises(APIError):
+        scheduler.call("llm", invalid)
+    assert calls == [1]
+    assert clock.slept == []
+
+
+def test_acall_paces_and_retries_coroutines(clock):
+    scheduler = Scheduler({"llm_requests_per_minute": 30}, clock, rng=random.Random(0))
+    attempts = []
+
+    async def flaky():
+        attempts.append(clock.now)
+        if len(attempts) == 1:
+            raise APIError(429)
+        return "answer"
+
+    async def run():
+        return [await scheduler.acall("llm", flaky) for _ in range(2)]
+
+    assert asyncio.run(run()) == ["answer", "answer"]
+    # The retry and the second request each waited for a token, 2s apart.
+    assert attempts[2] - attempts[1] >= 2.0
+
+
+def test_throttling_pauses_linkedin_actions_only(clock):
+    scheduler = Scheduler(
+        {"throttle_cooldown_seconds": 100}, clock, rng=random.Random(0)
+    )
+    first = scheduler.throttled("too many requests")
+    assert 100 <= first <= 125
+    assert scheduler.wait("navigation") == pytest.approx(first)
+    assert scheduler.wait("llm") == 0.0
+
+    second = scheduler.throttled("too many requests")
+    assert 200 <= second <= 250
+
+    scheduler.recovered()
+    clock.now += 1000
+    assert 100 <= scheduler.throttled("too many requests") <= 125
+
+
+def test_retryable_errors_and_retry_after():
+    assert is_retryable(APIError(429))
+    assert is_retryable(APIError(502))
+    assert not is_retryable(APIError(401))
+    assert is_retryable(type("APITimeoutError", (Exception,), {})())
+    assert retry_after(APIError(429, {"retry-after": "7"})) == 7.0
+    assert retry_after(APIError(429, {"retry-after": "soon"})) == 0.0
+
+
+@pytest.mark.parametrize(
+    "driver, signal",
+    [
+        (FakeDriver(), None),
+        (FakeDriver(url="https://www.linkedin.com/checkpoint/challenge/"), "challenge"),
+        (
+            FakeDriver(text="You've reached today's Easy Apply application limit."),
+            "limit",
+        ),
+        (FakeDriver(text="Too many requests. Please slow down."), "slow_down"),
+    ],
+)
+def test_detect_throttling(driver, signal):
+    detected = detect_throttling(driver)
+    assert (detected and detected[0]) == signal
+
+
+def test_check_throttling_pauses_or_stops_the_run(clock, monkeypatch):
+    monkeypatch.setattr(rate_limits, "_scheduler", rate_limits._scheduler)
+    scheduler = configure_rate_limits(
+        {"rate_limits": {"enabled": True, "throttle_cooldown_seconds": 60}}, clock=clock
+    )
+
+    check_throttling(FakeDriver(text="Too many requests"))
+    assert scheduler.paused_until >= 60
+
+    with pytest.raises(RunThrottled):
+        check_throttling(FakeDriver(url="https://www.linkedin.com/authwall?x=1"))
@@ -0,0 +1,94 @@
+import threading
+
+import pytest
+
+from scripts import job_application_bot, worker_pool
+from scripts.applied_ledger import AppliedJobsLedger
+from scripts.checkpoint import load_checkpoint
+from scripts.worker_pool import WorkerStats, _run_worker
+from tests.fakes import FakeDriver
+
+LIMIT_PAGE = "You've reached today's Easy Apply application limit."
+SEARCHES = [
+    "https://www.linkedin.com/jobs/search/?keywords=python",
+    "https://www.linkedin.com/jobs/search/?keywords=golang",
+]
+
+
+@pytest.fixture(autouse=True)
+def checkpoints_in_tmp_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        worker_pool,
+        "worker_checkpoint_path",
+        str(tmp_path / "checkpoint-worker-{worker_id}.json"),
+    )
+
+
+@pytest.fixture
+def shared(tmp_path):
+    ledger = AppliedJobsLedger(str(tmp_path / "ledger.sqlite3"))
+    yield {
+        "answer_index": object(),
+        "ledger": ledger,
+        "question_queue": None,
+        "cover_letters": None,
+        "corpus": None,
+        "stop": threading.Event(),
+    }
+    ledger.close()
+
+
+def run_worker(worker_id, driver, shared, monkeypatch):
+    monkeypatch.setattr(worker_pool, "setup_driver", lambda **kwargs: driver)
+    monkeypatch.setattr(worker_pool, "ensure_logged_in", lambda *args: True)
+    stats = WorkerStats(worker_id)
+    _run_worker(worker_id, 2, SEARCHES, {}, {}, shared, ("user", "pw"), stats)
+    return stats
+
+
+def test_a_throttled_worker_stops_the_others(shared, monkeypatch):
+    throttled = FakeDriver(text=LIMIT_PAGE)
+    stats = run_worker(1, throttled, shared, monkeypatch)
+
+    assert shared["stop"].is_set()
+    # The throttled page was the only one opened, the second search never ran.
+    assert len(throttled.visited) == 1
+    assert stats.searches == 1
+
+    other = FakeDriver()
+    stats = run_worker(2, other, shared, monkeypatch)
+    assert other.visited == []
+    assert stats.searches == 0
+
+
+def test_stop_is_checked_between_cards(shared, tmp_path, monkeypatch):
+    checkpoint_file = str(tmp_path / "checkpoint.json")
+    cards = [
+        {"job_id": "1", "title": "Python Developer", "easy_apply": False},
+        {"job_id": "2", "title": "Python Developer", "easy_apply": True},
+    ]
+
+    def iter_job_cards(driver):
+        yield cards[0]
+        shared["stop"].set()
+        yield cards[1]
+
+    monkeypatch.setattr(job_application_bot, "iter_job_cards", iter_job_cards)
+    claimed = []
+    monkeypatch.setattr(
+        shared["ledger"], "claim", lambda job_id, *args: claimed.append(job_id)
+    )
+
+    job_application_bot.apply_to_jobs(
+        FakeDriver(),
+        {},
+        {},
+        ledger=shared["ledger"],
+        answer_index=shared["answer_index"],
+        checkpoint_file=checkpoint_file,
+        search=SEARCHES[0],
+        stop=shared["stop"],
+    )
+
+    assert claimed == []
+    assert load_checkpoint(checkpoint_file)["search_url"] == SEARCHES[0]